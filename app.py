@@ -20,6 +20,8 @@ import pandas as pd
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from processors.json_processor import JSONProcessor
+from processors.schema_inference import SchemaAccumulator
+from readers.json_stream_reader import JSONArrayStreamReader
 from connectors.connector_factory import get_connector_factory
 
 # Configure Streamlit page
@@ -108,6 +110,8 @@ def render_processing():
     with col1:
         st.subheader("📊 Processing Settings")
         validate_data = st.checkbox("Enable data validation", value=True)
+        typed_columns = st.checkbox("Infer column types", value=False,
+                                    help="Store numbers as INTEGER/REAL and nested values as JSON instead of TEXT")
         table_name = st.text_input("SQLite table name", value="processed_data")
         
     with col2:
@@ -118,15 +122,17 @@ def render_processing():
     # Process button
     if st.button("🚀 Process Files", type="primary", use_container_width=True):
         if table_name and db_path:
-            process_files(validate_data, table_name, db_path)
+            process_files(validate_data, table_name, db_path, typed_columns)
         else:
             st.error("❌ Please fill in all required fields")
 
-def process_files(validate_data: bool, table_name: str, db_path: str):
+def process_files(validate_data: bool, table_name: str, db_path: str,
+                  typed_columns: bool = False):
     """Process uploaded JSON files"""
     with st.spinner("🔄 Processing files..."):
         try:
-            processor = JSONProcessor()
+            processor = JSONProcessor(typed_values=typed_columns)
+            schema_accumulator = SchemaAccumulator(infer_types=typed_columns)
             factory = get_connector_factory()
             
             # Create database connector
@@ -141,18 +147,11 @@ def process_files(validate_data: bool, table_name: str, db_path: str):
             for file_path in st.session_state.files:
                 st.write(f"Processing {file_path.name}...")
                 
-                # Read and process the JSON file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    json_data = json.load(f)
-                
-                # Ensure data is in list format for processing
-                if isinstance(json_data, dict):
-                    json_data = [json_data]
-                elif not isinstance(json_data, list):
-                    json_data = [json_data]
-                
-                # Process the JSON data
-                result = processor.process_data(json_data)
+                # Read the JSON file incrementally and process it batch by batch
+                result = []
+                for batch in JSONArrayStreamReader(file_path).iter_batches(1000):
+                    schema_accumulator.observe_batch(batch)
+                    result.extend(processor.process_data(batch))
                 all_processed_data.extend(result)
                 
                 results.append({
@@ -162,17 +161,10 @@ def process_files(validate_data: bool, table_name: str, db_path: str):
                     'data': result
                 })
             
-            # Create table schema from processed data
+            # Create table schema from every record read (not just the first)
             if all_processed_data:
                 st.write("Creating database table...")
-                sample_record = all_processed_data[0]
-                schema = []
-                for key in sample_record.keys():
-                    schema.append({
-                        'name': key,
-                        'type': 'TEXT',
-                        'nullable': True
-                    })
+                schema = schema_accumulator.to_schema(sort=False)
                 
                 # Create table
                 if connector.create_table(table_name, schema):
@@ -191,6 +183,7 @@ def process_files(validate_data: bool, table_name: str, db_path: str):
                 'total_records': sum(r['records'] for r in results),
                 'table_name': table_name,
                 'db_path': db_path,
+                'json_backend': processor.backend.name,
                 'data': results
             }
             st.session_state.processed = True
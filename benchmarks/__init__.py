@@ -0,0 +1,13 @@
+"""
+Benchmark suite for the Generic Data Ingestion Framework.
+
+Run with:  python -m benchmarks --help
+"""
+
+import sys
+from pathlib import Path
+
+# Benchmarks import the framework the same way main.py does
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
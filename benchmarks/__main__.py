@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Command Line Interface for the Benchmark Suite.
+
+Generates one dataset per --records size, measures per-stage and end-to-end
+throughput, writes a JSON report and optionally compares it with a baseline.
+Exits with status 1 when a stage regressed beyond the tolerance.
+"""
+
+import argparse
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.data_generator import FILE_FORMATS, SIZE_PRESETS, DatasetGenerator, parse_size
+from benchmarks.suite import (DEFAULT_TOLERANCE, STAGES, compare_reports, load_report,
+                              run_suite, write_report)
+
+from connectors.sqlite_connector import SQLiteConnector
+from processors.json_backend import BACKENDS, select_backend
+
+
+REPORTS_DIR = Path(__file__).parent / 'reports'
+
+
+def _format_rate(value) -> str:
+    """Human-readable records or bytes per second."""
+    if value is None:
+        return '-'
+    for unit, scale in (('G', 1e9), ('M', 1e6), ('K', 1e3)):
+        if value >= scale:
+            return f"{value / scale:.2f}{unit}"
+    return f"{value:.0f}"
+
+
+def print_report(report: dict):
+    """Print a per-case stage table."""
+    for name, case in report['cases'].items():
+        dataset = case['dataset']
+        print(f"\n{name}  ({dataset['records']} records, {dataset['bytes'] / 1e6:.1f} MB)")
+        print(f"  {'stage':<12}{'seconds':>10}{'records/s':>12}{'bytes/s':>12}")
+        rows = [(stage, case['stages'][stage]) for stage in STAGES]
+        rows.append(('stages_total', case['stages_total']))
+        if 'end_to_end' in case:
+            rows.append(('end_to_end', case['end_to_end']))
+        for stage, figures in rows:
+            print(f"  {stage:<12}{figures['seconds']:>10.3f}"
+                  f"{_format_rate(figures['records_per_second']):>12}"
+                  f"{_format_rate(figures['bytes_per_second']):>12}")
+
+
+def print_comparison(comparison: dict):
+    """Print the stages that changed beyond the tolerance."""
+    changed = [entry for entry in comparison['comparisons'] if entry['status'] != 'unchanged']
+    print(f"\nBaseline comparison (tolerance {comparison['tolerance']:.0%}): "
+          f"{len(comparison['comparisons'])} stages compared, "
+          f"{comparison['regressions']} regressions")
+    for entry in changed:
+        print(f"  {entry['status'].upper():<12}{entry['case']} {entry['stage']}: "
+              f"{_format_rate(entry['baseline_records_per_second'])} -> "
+              f"{_format_rate(entry['records_per_second'])} records/s ({entry['change']:+.1%})")
+
+
+def main():
+    """Main benchmark entry point."""
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description="Benchmark suite for the Generic Data Ingestion Framework",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --records 10k 100k                    # Two dataset sizes
+  %(prog)s --records 1m --files 100 --nesting 3  # Many nested files
+  %(prog)s --records 100k --save-baseline benchmarks/baseline.json
+  %(prog)s --records 100k --baseline benchmarks/baseline.json
+        """
+    )
+
+    dataset = parser.add_argument_group('dataset')
+    dataset.add_argument('--records', nargs='+', default=['10k'],
+                         help=f"Record counts or presets ({', '.join(SIZE_PRESETS)}) (default: 10k)")
+    dataset.add_argument('--files', type=int, default=1, help='Files per dataset (default: 1)')
+    dataset.add_argument('--width', type=int, default=10, help="Fields per record besides 'id' (default: 10)")
+    dataset.add_argument('--nesting', type=int, default=1,
+                         help='Depth of nested objects; 0 for flat records (default: 1)')
+    dataset.add_argument('--heterogeneity', type=float, default=0.0,
+                         help='Fraction (0-1) of fields whose presence and name vary per record (default: 0)')
+    dataset.add_argument('--format', choices=FILE_FORMATS, default='json',
+                         help='File format (default: json)')
+    dataset.add_argument('--seed', type=int, default=42, help='Generator seed (default: 42)')
+
+    run = parser.add_argument_group('run')
+    run.add_argument('--repeat', type=int, default=1,
+                     help='Measured runs per case; the fastest is kept (default: 1)')
+    run.add_argument('--batch-size', type=int, default=1000, help='Records per batch (default: 1000)')
+    run.add_argument('--typed-columns', action='store_true', help='Benchmark typed column inference')
+    run.add_argument('--columnar', action='store_true', help='Benchmark columnar record batches')
+    run.add_argument('--load-profile', choices=list(SQLiteConnector.LOAD_PROFILES), default=None,
+                     help='SQLite load profile for inserts')
+    run.add_argument('--json-backend', choices=['auto'] + list(BACKENDS), default='auto',
+                     help='JSON engine (default: auto)')
+    run.add_argument('--streaming', action='store_true', help='End-to-end run in streaming mode')
+    run.add_argument('--pipeline', action='store_true', help='End-to-end run with the reader/writer pipeline')
+    run.add_argument('--jobs', '-j', type=int, default=1, help='End-to-end worker processes (default: 1)')
+    run.add_argument('--no-end-to-end', action='store_true', help='Only measure the separate stages')
+    run.add_argument('--work-dir', default=None, help='Directory for generated data, created if missing (default: system temp)')
+
+    output = parser.add_argument_group('reports')
+    output.add_argument('--output', '-o', default=None,
+                        help='Report path (default: benchmarks/reports/benchmark_<timestamp>.json)')
+    output.add_argument('--baseline', default=None, help='Baseline report to compare against')
+    output.add_argument('--save-baseline', default=None, help='Also store this run as a baseline report')
+    output.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Allowed records/sec drop before a regression (default: {DEFAULT_TOLERANCE})')
+
+    args = parser.parse_args()
+
+    # Keep framework logging out of the measurements and the output
+    logger = logging.getLogger('data_ingestion')
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.WARNING)
+
+    try:
+        baseline = load_report(args.baseline) if args.baseline else None
+        select_backend(args.json_backend)
+        if args.work_dir:
+            Path(args.work_dir).mkdir(parents=True, exist_ok=True)
+        generators = [DatasetGenerator(records=parse_size(size), width=args.width, nesting=args.nesting,
+                                       heterogeneity=args.heterogeneity, files=args.files,
+                                       file_format=args.format, seed=args.seed)
+                      for size in args.records]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    options = {
+        'repeat': args.repeat,
+        'batch_size': args.batch_size,
+        'end_to_end': not args.no_end_to_end,
+        'typed_columns': args.typed_columns,
+        'columnar': args.columnar,
+        'load_profile': args.load_profile,
+        'streaming': args.streaming,
+        'pipeline': args.pipeline,
+        'jobs': args.jobs,
+    }
+    report = run_suite(generators, work_dir=args.work_dir, **options)
+
+    report_path = Path(args.output) if args.output else \
+        REPORTS_DIR / f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json"
+    print_report(report)
+
+    exit_code = 0
+    if baseline is not None:
+        comparison = compare_reports(report, baseline, args.tolerance)
+        report['comparison'] = dict(comparison, baseline=str(args.baseline))
+        print_comparison(comparison)
+        if comparison['regressions']:
+            exit_code = 1
+
+    write_report(report, report_path)
+    print(f"\nReport written to {report_path}")
+    if args.save_baseline:
+        write_report(report, Path(args.save_baseline))
+        print(f"Baseline saved to {args.save_baseline}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
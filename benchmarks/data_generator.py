@@ -0,0 +1,208 @@
+"""
+Synthetic Dataset Generator for the Benchmark Suite.
+
+Writes deterministic JSON / JSON Lines datasets of any size (10K to 10M+
+records) without holding them in memory. The same parameters and seed always
+produce byte-identical files, so benchmark runs on different days or machines
+measure the same input.
+
+Shape controls:
+    width          Fields per record besides 'id'
+    nesting        Depth of nested objects (0 = flat records); nested fields
+                   also carry a short array
+    heterogeneity  Fraction (0-1) of fields whose presence and key name vary
+                   from record to record, which drives schema widening and
+                   the number of distinct record shapes
+    files          Number of files the records are spread over
+    file_format    'json' (one array per file) or 'jsonl' (one record per line)
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+
+# Named dataset sizes accepted wherever a record count is
+SIZE_PRESETS = {
+    '10k': 10_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+    '10m': 10_000_000,
+}
+
+# Alternative key names a varying field can take
+KEY_VARIANTS = 4
+
+FILE_FORMATS = ('json', 'jsonl')
+
+_WORDS = ('alpha', 'bravo', 'charlie', 'delta', 'echo', 'foxtrot', 'golf', 'hotel',
+          'india', 'juliett', 'kilo', 'lima', 'mike', 'november', 'oscar', 'papa')
+
+
+def parse_size(size: Union[int, str]) -> int:
+    """
+    Turn a record count or preset name ('10k', '1m', ...) into a number.
+
+    Raises:
+        ValueError: If the size is not a positive count or known preset
+    """
+    if isinstance(size, str):
+        key = size.strip().lower()
+        count = SIZE_PRESETS[key] if key in SIZE_PRESETS else int(key.replace('_', ''))
+    else:
+        count = int(size)
+    if count <= 0:
+        raise ValueError(f"Dataset size must be positive, got {size}")
+    return count
+
+
+class DatasetGenerator:
+    """
+    Deterministic generator for benchmark datasets.
+
+    Usage:
+        generator = DatasetGenerator(records='100k', width=20, nesting=2,
+                                     heterogeneity=0.2, files=10)
+        manifest = generator.write('/tmp/bench_data')
+        print(manifest['records'], manifest['bytes'])
+    """
+
+    def __init__(self, records: Union[int, str] = '10k', width: int = 10, nesting: int = 1,
+                 heterogeneity: float = 0.0, files: int = 1, file_format: str = 'json',
+                 seed: int = 42):
+        """
+        Initialize the generator.
+
+        Args:
+            records: Total number of records, or a SIZE_PRESETS name
+            width: Fields per record besides 'id'
+            nesting: Depth of nested objects; 0 generates flat records
+            heterogeneity: Fraction of fields whose presence and name vary per record
+            files: Number of files to spread the records over
+            file_format: 'json' or 'jsonl'
+            seed: Random seed; equal parameters and seed give identical files
+
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"Unknown file format '{file_format}'. Use one of: {', '.join(FILE_FORMATS)}")
+        if not 0.0 <= heterogeneity <= 1.0:
+            raise ValueError("heterogeneity must be between 0 and 1")
+
+        self.records = parse_size(records)
+        self.width = max(0, width)
+        self.nesting = max(0, nesting)
+        self.heterogeneity = heterogeneity
+        self.files = max(1, min(files, self.records))
+        self.file_format = file_format
+        self.seed = seed
+
+    def parameters(self) -> Dict[str, Any]:
+        """Generator parameters, as stored in benchmark reports."""
+        return {
+            'records': self.records,
+            'width': self.width,
+            'nesting': self.nesting,
+            'heterogeneity': self.heterogeneity,
+            'files': self.files,
+            'file_format': self.file_format,
+            'seed': self.seed,
+        }
+
+    def write(self, directory: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Write the dataset files into a directory.
+
+        Args:
+            directory: Target directory (created if missing)
+
+        Returns:
+            Dict of parameters plus 'paths' and total 'bytes' written
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        paths = []
+        total_bytes = 0
+        per_file, extra = divmod(self.records, self.files)
+        first_id = 1
+        for index in range(self.files):
+            count = per_file + (1 if index < extra else 0)
+            path = directory / f"bench_{index:05d}.{self.file_format}"
+            total_bytes += self._write_file(path, index, first_id, count)
+            paths.append(path)
+            first_id += count
+
+        manifest = self.parameters()
+        manifest['paths'] = [str(path) for path in paths]
+        manifest['bytes'] = total_bytes
+        return manifest
+
+    def iter_records(self, file_index: int = 0, first_id: int = 1, count: int = 1):
+        """Yield one file's records (each file has its own seeded stream)."""
+        rng = random.Random(f"{self.seed}:{file_index}")
+        varying = int(round(self.width * self.heterogeneity))
+        for record_id in range(first_id, first_id + count):
+            yield self._record(rng, record_id, varying)
+
+    def _write_file(self, path: Path, file_index: int, first_id: int, count: int) -> int:
+        """Write one file in chunks and return its size in bytes."""
+        encode = json.JSONEncoder(ensure_ascii=True, check_circular=False).encode
+        lines = (encode(record) for record in self.iter_records(file_index, first_id, count))
+
+        with open(path, 'w', encoding='utf-8', newline='\n') as handle:
+            if self.file_format == 'jsonl':
+                chunk: List[str] = []
+                for line in lines:
+                    chunk.append(line)
+                    if len(chunk) >= 10_000:
+                        handle.write('\n'.join(chunk) + '\n')
+                        chunk = []
+                if chunk:
+                    handle.write('\n'.join(chunk) + '\n')
+            else:
+                handle.write('[\n')
+                separator = ''
+                for line in lines:
+                    handle.write(separator + line)
+                    separator = ',\n'
+                handle.write('\n]\n')
+
+        return path.stat().st_size
+
+    def _record(self, rng: random.Random, record_id: int, varying: int) -> Dict[str, Any]:
+        """Build one record; the first `varying` fields change presence and name."""
+        record: Dict[str, Any] = {'id': record_id}
+        for field in range(self.width):
+            if field < varying:
+                if rng.random() < 0.5:
+                    continue
+                name = f"f{field}_v{rng.randrange(KEY_VARIANTS)}"
+            else:
+                name = f"f{field}"
+            record[name] = self._value(rng, field)
+        return record
+
+    def _value(self, rng: random.Random, field: int) -> Any:
+        """Value for a field; the field number fixes its kind so columns stay consistent."""
+        kind = field % 6 if self.nesting else field % 4
+        if kind == 0:
+            return rng.randrange(1_000_000)
+        if kind == 1:
+            return round(rng.random() * 1000, 2)
+        if kind == 2:
+            return f"{rng.choice(_WORDS)} {rng.choice(_WORDS)} {rng.randrange(10_000)}"
+        if kind == 3:
+            return rng.random() < 0.5 if rng.random() < 0.9 else None
+        if kind == 4:
+            return self._nested(rng, self.nesting)
+        return [rng.randrange(100) for _ in range(rng.randrange(1, 5))]
+
+    def _nested(self, rng: random.Random, depth: int) -> Dict[str, Any]:
+        """Nested object `depth` levels deep."""
+        value: Dict[str, Any] = {'name': rng.choice(_WORDS), 'score': rng.randrange(100)}
+        if depth > 1:
+            value['child'] = self._nested(rng, depth - 1)
+        return value
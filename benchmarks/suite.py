@@ -0,0 +1,369 @@
+"""
+Benchmark Suite for Generic Data Ingestion Framework.
+
+Measures ingestion throughput on generated datasets and writes
+machine-readable JSON reports. Each pipeline stage is timed on its own while
+the data streams through once (so 10M-record datasets need no more memory
+than 10K ones):
+
+    scan       File discovery (FileScanner)
+    decode     Reading and JSON-decoding records (stream / JSON Lines readers)
+    transform  JSONProcessor conversion for flat storage
+    schema     Schema inference (SchemaAccumulator)
+    insert     Table creation/widening and SQLite inserts, including commit
+
+plus an end-to-end DataIngestionApplication.process_directory run. Every
+stage reports records/sec and bytes/sec of the dataset it processed.
+
+Reports are compared with a stored baseline report stage by stage; a stage
+whose records/sec drops by more than the tolerance is a regression.
+"""
+
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from benchmarks.data_generator import DatasetGenerator
+
+from connectors.connector_factory import get_connector_factory
+from core.application import DataIngestionApplication
+from processors.json_backend import get_backend
+from processors.json_processor import JSONProcessor
+from processors.schema_inference import SchemaAccumulator
+from readers.json_lines_reader import JSONLinesReader, is_json_lines_file
+from readers.json_stream_reader import JSONArrayStreamReader
+from scanners.file_scanner import FileScanner
+
+
+# Bumped when the report layout changes incompatibly
+REPORT_VERSION = 1
+
+STAGES = ('scan', 'decode', 'transform', 'schema', 'insert')
+
+# Relative records/sec drop that counts as a regression
+DEFAULT_TOLERANCE = 0.10
+
+# Stages faster than this (in either report) are too noisy to compare
+MIN_COMPARABLE_SECONDS = 0.005
+
+BENCHMARK_TABLE = 'benchmark_data'
+
+
+def case_name(parameters: Dict[str, Any]) -> str:
+    """Stable identifier of a dataset, used to match cases across reports."""
+    return (f"{parameters['records']}r_{parameters['files']}f_{parameters['width']}w_"
+            f"{parameters['nesting']}n_{parameters['heterogeneity']:g}h_{parameters['file_format']}")
+
+
+def _rates(seconds: float, records: int, total_bytes: int) -> Dict[str, Any]:
+    """Throughput figures for one measured stage."""
+    return {
+        'seconds': round(seconds, 6),
+        'records_per_second': round(records / seconds, 1) if seconds > 0 else None,
+        'bytes_per_second': round(total_bytes / seconds, 1) if seconds > 0 else None,
+    }
+
+
+def measure_stages(directory: Path, batch_size: int = 1000, typed_columns: bool = False,
+                   columnar: bool = False, load_profile: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Stream every file in a dataset directory through the pipeline stages once,
+    timing each stage separately.
+
+    Args:
+        directory: Directory holding only the dataset files
+        batch_size: Records per batch
+        typed_columns: Infer typed columns / keep typed values
+        columnar: Transform into columnar RecordBatch objects
+        load_profile: SQLite load profile for the insert stage
+
+    Returns:
+        Dict of stage name -> seconds, plus 'records' and 'bytes' processed
+    """
+    clock = time.perf_counter
+    seconds = dict.fromkeys(STAGES, 0.0)
+
+    start = clock()
+    files = FileScanner(str(directory)).discover_files(file_types=['json'], recursive=True).get('json', [])
+    seconds['scan'] = clock() - start
+
+    processor = JSONProcessor(typed_values=typed_columns)
+    schema = SchemaAccumulator(infer_types=typed_columns)
+    db_dir = tempfile.mkdtemp(prefix='ingest_bench_db_')
+    connector = get_connector_factory().create_sqlite_connector(str(Path(db_dir) / 'bench.db'), load_profile)
+    known_columns = set()
+    records = 0
+    total_bytes = 0
+
+    try:
+        for file_path in sorted(files):
+            total_bytes += file_path.stat().st_size
+            if is_json_lines_file(file_path):
+                reader = JSONLinesReader(file_path)
+            else:
+                reader = JSONArrayStreamReader(file_path)
+            batches = reader.iter_batches(batch_size)
+
+            while True:
+                t0 = clock()
+                batch = next(batches, None)
+                t1 = clock()
+                seconds['decode'] += t1 - t0
+                if batch is None:
+                    break
+
+                processed = processor.process_columnar(batch) if columnar else processor.process_data(batch)
+                t2 = clock()
+                schema.observe_batch(batch)
+                t3 = clock()
+
+                new_columns = schema.missing_from(known_columns)
+                if new_columns:
+                    columns = schema.to_schema(new_columns)
+                    if known_columns:
+                        connector.add_columns(BENCHMARK_TABLE, columns)
+                    else:
+                        connector.create_table(BENCHMARK_TABLE, columns)
+                    known_columns.update(new_columns)
+                connector.insert_data(BENCHMARK_TABLE, processed, batch_size, commit=False)
+                t4 = clock()
+
+                seconds['transform'] += t2 - t1
+                seconds['schema'] += t3 - t2
+                seconds['insert'] += t4 - t3
+                records += len(batch)
+
+        t0 = clock()
+        connector.commit()
+        seconds['insert'] += clock() - t0
+    finally:
+        connector.disconnect()
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+    seconds['records'] = records
+    seconds['bytes'] = total_bytes
+    return seconds
+
+
+def measure_end_to_end(directory: Path, **options) -> Dict[str, Any]:
+    """
+    Time a full process_directory run on a dataset directory.
+
+    Args:
+        directory: Dataset directory
+        **options: Keyword arguments for process_directory (streaming, jobs, ...)
+
+    Returns:
+        Dict with 'seconds' and 'records' (database records written)
+
+    Raises:
+        RuntimeError: If processing fails
+    """
+    db_dir = tempfile.mkdtemp(prefix='ingest_bench_db_')
+    try:
+        app = DataIngestionApplication()
+        start = time.perf_counter()
+        result = app.process_directory(str(directory), str(Path(db_dir) / 'bench.db'),
+                                       table_name=BENCHMARK_TABLE, **options)
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+    if not result.get('success'):
+        raise RuntimeError(f"End-to-end run failed: {result.get('message')}")
+    return {'seconds': elapsed, 'records': result.get('database_records', 0)}
+
+
+def run_case(generator: DatasetGenerator, repeat: int = 1, batch_size: int = 1000,
+             end_to_end: bool = True, work_dir: Optional[Path] = None,
+             **options) -> Dict[str, Any]:
+    """
+    Generate one dataset and benchmark it.
+
+    Stages are run `repeat` times and the fastest time of each stage is kept,
+    which filters out noise from other processes.
+
+    Args:
+        generator: Dataset generator describing the case
+        repeat: Number of measured runs
+        batch_size: Records per batch
+        end_to_end: Also time a full process_directory run
+        work_dir: Where to generate the dataset, created if missing (a temporary
+            directory by default)
+        **options: typed_columns, columnar, load_profile and, for the end-to-end
+            run only, streaming, jobs, pipeline
+
+    Returns:
+        Case report: dataset parameters, per-stage and end-to-end throughput
+    """
+    stage_options = {key: options[key] for key in ('typed_columns', 'columnar', 'load_profile')
+                     if key in options}
+    if work_dir is not None:
+        Path(work_dir).mkdir(parents=True, exist_ok=True)
+    data_dir = Path(tempfile.mkdtemp(prefix='ingest_bench_data_', dir=work_dir))
+    try:
+        dataset = generator.write(data_dir)
+        dataset.pop('paths')
+
+        best = dict.fromkeys(STAGES, None)
+        records = 0
+        for _ in range(max(1, repeat)):
+            measured = measure_stages(data_dir, batch_size=batch_size, **stage_options)
+            records = measured['records']
+            for stage in STAGES:
+                if best[stage] is None or measured[stage] < best[stage]:
+                    best[stage] = measured[stage]
+
+        report = {
+            'dataset': dataset,
+            'stages': {stage: _rates(best[stage], records, dataset['bytes']) for stage in STAGES},
+        }
+        total = sum(best.values())
+        report['stages_total'] = _rates(total, records, dataset['bytes'])
+
+        if end_to_end:
+            runs = [measure_end_to_end(data_dir, batch_size=batch_size, **options)
+                    for _ in range(max(1, repeat))]
+            fastest = min(runs, key=lambda run: run['seconds'])
+            report['end_to_end'] = _rates(fastest['seconds'], fastest['records'], dataset['bytes'])
+            report['end_to_end']['options'] = dict(options)
+        return report
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def run_suite(generators: Iterable[DatasetGenerator], **kwargs) -> Dict[str, Any]:
+    """
+    Benchmark several datasets and build a full report.
+
+    Args:
+        generators: One generator per case
+        **kwargs: Passed to run_case
+
+    Returns:
+        Report dict with 'version', 'created', 'environment', 'options' and
+        'cases' (case name -> run_case report)
+    """
+    cases = {}
+    for generator in generators:
+        cases[case_name(generator.parameters())] = run_case(generator, **kwargs)
+
+    return {
+        'version': REPORT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment_info(),
+        'options': {key: value for key, value in kwargs.items() if key != 'work_dir'},
+        'cases': cases,
+    }
+
+
+def environment_info() -> Dict[str, Any]:
+    """Machine and runtime details stored with each report."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'json_backend': get_backend().name,
+        'sqlite': sqlite3.sqlite_version,
+        'argv': sys.argv[1:],
+    }
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any],
+                    tolerance: float = DEFAULT_TOLERANCE) -> Dict[str, Any]:
+    """
+    Compare a report with a baseline report, stage by stage.
+
+    Only cases and stages present in both reports are compared; end-to-end
+    figures only when both runs used the same options, and stages shorter than
+    MIN_COMPARABLE_SECONDS are skipped as noise.
+
+    Args:
+        current: Report of this run
+        baseline: Stored baseline report
+        tolerance: Relative records/sec drop allowed before flagging a regression
+
+    Returns:
+        Dict with 'comparisons' (one entry per case/stage: baseline and current
+        records/sec, relative 'change' and 'status' of 'regression',
+        'improvement' or 'unchanged') and 'regressions' (count)
+    """
+    comparisons: List[Dict[str, Any]] = []
+    for name, case in current.get('cases', {}).items():
+        base_case = baseline.get('cases', {}).get(name)
+        if not base_case:
+            continue
+
+        measured = dict(case.get('stages', {}))
+        reference = dict(base_case.get('stages', {}))
+        if 'stages_total' in case and 'stages_total' in base_case:
+            measured['stages_total'] = case['stages_total']
+            reference['stages_total'] = base_case['stages_total']
+        if 'end_to_end' in case and 'end_to_end' in base_case and \
+                case['end_to_end'].get('options') == base_case['end_to_end'].get('options'):
+            measured['end_to_end'] = case['end_to_end']
+            reference['end_to_end'] = base_case['end_to_end']
+
+        for stage, figures in measured.items():
+            base_figures = reference.get(stage) or {}
+            before = base_figures.get('records_per_second')
+            after = figures.get('records_per_second')
+            if not before or not after:
+                continue
+            if min(figures['seconds'], base_figures['seconds']) < MIN_COMPARABLE_SECONDS:
+                continue
+            change = after / before - 1
+            if change < -tolerance:
+                status = 'regression'
+            elif change > tolerance:
+                status = 'improvement'
+            else:
+                status = 'unchanged'
+            comparisons.append({
+                'case': name,
+                'stage': stage,
+                'baseline_records_per_second': before,
+                'records_per_second': after,
+                'change': round(change, 4),
+                'status': status,
+            })
+
+    return {
+        'tolerance': tolerance,
+        'comparisons': comparisons,
+        'regressions': sum(1 for entry in comparisons if entry['status'] == 'regression'),
+    }
+
+
+def write_report(report: Dict[str, Any], path: Path):
+    """Write a report (or comparison) as indented JSON."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump(report, handle, indent=2, sort_keys=False)
+        handle.write('\n')
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    """
+    Load a stored report.
+
+    Raises:
+        ValueError: If the report was written by an incompatible suite version
+    """
+    with open(path, 'r', encoding='utf-8') as handle:
+        report = json.load(handle)
+    if report.get('version') != REPORT_VERSION:
+        raise ValueError(f"Benchmark report {path} has version {report.get('version')}, "
+                         f"expected {REPORT_VERSION}")
+    return report
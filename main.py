@@ -19,6 +19,69 @@ if sys.platform == 'win32':
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from core.application import DataIngestionApplication
+from connectors.sqlite_connector import SQLiteConnector
+from processors.json_backend import BACKENDS
+from core.watch import DEFAULT_BATCH_FILES, DEFAULT_POLL_INTERVAL, DEFAULT_SETTLE_SECONDS
+
+
+# Files listed by --stats (slowest first)
+STATS_MAX_FILES = 20
+
+
+def positive_megabytes(value: str) -> float:
+    """argparse type for --memory-budget: a number of megabytes above zero."""
+    try:
+        megabytes = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: '{value}'")
+    if not 0 < megabytes < float('inf'):
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {value}")
+    return megabytes
+
+
+def print_stats(timings: dict):
+    """Print the per-stage and per-file timing breakdown of a run."""
+    print("\nStage timings:")
+    print(f"  {'stage':<10}{'seconds':>10}{'records':>10}{'MB':>10}{'records/s':>12}")
+    for stage, figures in timings['stages'].items():
+        rate = figures['records_per_second']
+        rate = f"{rate:.0f}" if rate is not None else '-'
+        print(f"  {stage:<10}{figures['seconds']:>10.3f}{figures['records']:>10}"
+              f"{figures['bytes'] / 1e6:>10.2f}{rate:>12}")
+
+    files = sorted(timings['files'], reverse=True,
+                   key=lambda entry: sum(value or 0 for key, value in entry.items()
+                                         if key.endswith('_seconds')))
+    if not files:
+        return
+    print(f"\nFile timings (slowest {min(len(files), STATS_MAX_FILES)} of {len(files)}):")
+    print(f"  {'decode':>8}{'transform':>10}{'schema':>8}{'insert':>8}{'records':>9}{'MB':>8}  file")
+    for entry in files[:STATS_MAX_FILES]:
+        insert = entry['insert_seconds']
+        insert = f"{insert:.3f}" if insert is not None else '-'
+        print(f"  {entry['decode_seconds']:>8.3f}{entry['transform_seconds']:>10.3f}"
+              f"{entry['schema_seconds']:>8.3f}{insert:>8}"
+              f"{entry['records']:>9}{entry['bytes'] / 1e6:>8.2f}  {Path(entry['file']).name}")
+
+
+def print_profile(profile: dict):
+    """Print the summary of a --profile run."""
+    if profile['mode'] == 'cpu':
+        print(f"\nCPU profile written to {profile['output']} (view with: python -m pstats {profile['output']})")
+        print(f"  {'calls':>9}{'own s':>10}{'cumul s':>10}  function")
+        for entry in profile['top_functions']:
+            print(f"  {entry['calls']:>9}{entry['own_seconds']:>10.3f}"
+                  f"{entry['cumulative_seconds']:>10.3f}  {entry['function']}")
+        return
+
+    print(f"\nMemory profile: peak {profile['peak_bytes'] / 1e6:.2f} MB traced")
+    for stage, figures in profile['stages'].items():
+        print(f"  {stage:<10} peak {figures['peak_bytes'] / 1e6:>10.2f} MB"
+              f"  (+{figures['peak_increase_bytes'] / 1e6:.2f} MB within stage)")
+    if profile['top_allocations']:
+        print(f"Top allocation sites at {profile['live_bytes_at_snapshot'] / 1e6:.2f} MB live:")
+        for entry in profile['top_allocations']:
+            print(f"  {entry['size_bytes'] / 1e6:>10.2f} MB {entry['blocks']:>9} blocks  {entry['location']}")
 
 
 def main():
@@ -31,6 +94,22 @@ Examples:
   %(prog)s data/                        # Process JSON files in data/ directory
   %(prog)s data/ --output mydata.db     # Save to custom database file
   %(prog)s data/ --table customers      # Use custom table name
+  %(prog)s data/ --streaming            # Write file by file with flat memory use
+  %(prog)s data/ --jobs 8               # Parse files with 8 worker processes
+  %(prog)s data/ -j 8 --schedule size   # Largest files first, small files bundled
+  %(prog)s data/ --incremental          # Only load new or changed files
+  %(prog)s data/ --typed-columns        # Store numbers and nested values with real types
+  %(prog)s data/ --load-profile fast    # Tune SQLite for the load (WAL, larger cache)
+  %(prog)s data/ --streaming --pipeline # Overlap file reading with database writes
+  %(prog)s data/ --columnar             # Keep records column-wise (less memory on wide data)
+  %(prog)s data/ --json-backend json    # Force the standard library JSON engine
+  %(prog)s data/ --stats                # Show time spent per stage and per file
+  %(prog)s data/ --profile cpu          # cProfile the run (output.prof + top functions)
+  %(prog)s data/ --profile memory       # Peak memory per stage and top allocation sites
+  %(prog)s data/ --memory-budget 512    # Spill batches past 512 MB to a scratch file
+  %(prog)s /mnt/nfs/in --scan-threads 16 # List directories in parallel (network mounts)
+  %(prog)s data/ --scan-index scan.db   # Only re-list directories changed since last run
+  %(prog)s landing/ --watch             # Keep ingesting files as they land (Ctrl+C stops)
         """
     )
     
@@ -51,6 +130,165 @@ Examples:
         help='Table name for storing data (default: processed_data)'
     )
     
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Write each file to the database as it is processed (flat memory use)'
+    )
+    
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=1000,
+        help='Records read and processed per batch (default: 1000)'
+    )
+    
+    parser.add_argument(
+        '--item-path',
+        default=None,
+        help="Dotted key path to the record array inside each file, e.g. 'data.records'"
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Worker processes for parsing files; 0 uses all CPU cores (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--schedule',
+        choices=['size', 'fifo'],
+        default='fifo',
+        help='With --jobs > 1: dispatch and write files in discovery order (fifo), or '
+             'largest first, bundling small files and splitting large JSON Lines files '
+             '(size; files are written as they finish, so row order varies between runs) '
+             '(default: fifo)'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Skip files already ingested unchanged; replace rows of changed files'
+    )
+    
+    parser.add_argument(
+        '--typed-columns',
+        action='store_true',
+        help='Infer INTEGER/REAL/TEXT/JSON_TEXT column types instead of storing everything as TEXT'
+    )
+    
+    parser.add_argument(
+        '--load-profile',
+        choices=list(SQLiteConnector.LOAD_PROFILES),
+        default='default',
+        help="SQLite tuning during the load: 'fast' (WAL, synchronous=NORMAL) or "
+             "'bulk' (in-memory journal, no fsync, exclusive lock except with --watch; "
+             "rebuildable databases only) (default: default)"
+    )
+    
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Read and parse files on a background thread while the database is written'
+    )
+    
+    parser.add_argument(
+        '--columnar',
+        action='store_true',
+        help='Carry records as per-column lists from parsing to the database (less memory)'
+    )
+    
+    parser.add_argument(
+        '--json-backend',
+        choices=['auto'] + list(BACKENDS),
+        default='auto',
+        help="JSON engine for parsing files; 'auto' uses orjson when installed "
+             "(default: auto)"
+    )
+    
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='Print a per-stage and per-file timing breakdown (scan/decode/transform/schema/insert)'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        choices=['cpu', 'memory'],
+        default=None,
+        help="Profile the run: 'cpu' (cProfile) or 'memory' (tracemalloc peak per stage)"
+    )
+    
+    parser.add_argument(
+        '--profile-output',
+        default=None,
+        help='File for the CPU profile (default: output database name with .prof)'
+    )
+    
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=20,
+        help='Functions or allocation sites listed in the profile summary (default: 20)'
+    )
+    
+    parser.add_argument(
+        '--memory-budget',
+        type=positive_megabytes,
+        default=None,
+        metavar='MB',
+        help='Batch mode: megabytes of processed records kept in memory before the rest '
+             'spill to a scratch SQLite file (default: no limit)'
+    )
+    
+    parser.add_argument(
+        '--spill-dir',
+        default=None,
+        help='Directory for the --memory-budget scratch file (default: system temp)'
+    )
+    
+    parser.add_argument(
+        '--scan-threads',
+        type=int,
+        default=1,
+        help='Directories listed concurrently during file discovery; helps on network '
+             'file systems (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--scan-index',
+        default=None,
+        help='Directory index file kept between runs; unchanged directories are not re-listed'
+    )
+    
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and ingest new or changed files as they land (stop with Ctrl+C)'
+    )
+    
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f'Watch mode: seconds between directory polls (default: {DEFAULT_POLL_INTERVAL})'
+    )
+    
+    parser.add_argument(
+        '--settle-seconds',
+        type=float,
+        default=DEFAULT_SETTLE_SECONDS,
+        help=f'Watch mode: a file is read once unmodified for this long (default: {DEFAULT_SETTLE_SECONDS})'
+    )
+    
+    parser.add_argument(
+        '--watch-batch-files',
+        type=int,
+        default=DEFAULT_BATCH_FILES,
+        help=f'Watch mode: files written per transaction (default: {DEFAULT_BATCH_FILES})'
+    )
+    
     parser.add_argument(
         '--quiet', '-q',
         action='store_true',
@@ -79,11 +317,59 @@ Examples:
             print(f"Table name: {args.table}")
             print()
         
+        if args.watch:
+            result = app.watch_directory(
+                directory=args.directory,
+                output_db=args.output,
+                table_name=args.table,
+                poll_interval=args.poll_interval,
+                settle_seconds=args.settle_seconds,
+                max_batch_files=args.watch_batch_files,
+                batch_size=args.batch_size,
+                item_path=args.item_path,
+                typed_columns=args.typed_columns,
+                load_profile=args.load_profile,
+                columnar=args.columnar,
+                json_backend=args.json_backend,
+                scan_index=args.scan_index
+            )
+            if not args.quiet or not result['success']:
+                print(f"\n=== Watch {'stopped' if result['success'] else 'failed'} ===")
+                if not result['success']:
+                    print(f"  {result.get('message', 'Unknown error')}")
+                print(f"  Polls: {result.get('polls', 0)}")
+                print(f"  Files ingested: {result.get('files_ingested', 0)} "
+                      f"({result.get('files_unchanged', 0)} unchanged skipped)")
+                print(f"  Records saved: {result.get('records', 0)} in {result.get('commits', 0)} commits")
+                if result.get('errors'):
+                    print(f"  Errors: {len(result['errors'])}")
+                    for error in result['errors']:
+                        print(f"    - {error}")
+            return 0 if result['success'] else 1
+        
         # Process the directory
         result = app.process_directory(
             directory=args.directory,
             output_db=args.output,
-            table_name=args.table
+            table_name=args.table,
+            streaming=args.streaming,
+            batch_size=args.batch_size,
+            item_path=args.item_path,
+            jobs=args.jobs,
+            incremental=args.incremental,
+            typed_columns=args.typed_columns,
+            load_profile=args.load_profile,
+            pipeline=args.pipeline,
+            columnar=args.columnar,
+            json_backend=args.json_backend,
+            profile=args.profile,
+            profile_output=args.profile_output,
+            profile_top=args.profile_top,
+            memory_budget_mb=args.memory_budget,
+            spill_dir=args.spill_dir,
+            scan_threads=args.scan_threads,
+            scan_index=args.scan_index,
+            schedule=args.schedule
         )
         
         if result['success']:
@@ -91,8 +377,26 @@ Examples:
                 print("\n=== Processing completed successfully! ===")
                 print("Summary:")
                 print(f"  Files processed: {result['processed_files']}/{result['total_files']}")
+                if result.get('skipped_files'):
+                    print(f"  Files skipped (unchanged): {result['skipped_files']}")
                 print(f"  Records saved: {result['database_records']}")
                 print(f"  Processing time: {result['processing_time_seconds']}s")
+                print(f"  JSON backend: {result['json_backend']}")
+                if result.get('load_profile', 'default') != 'default':
+                    print(f"  Load profile: {result['load_profile']}")
+                if result.get('pipeline'):
+                    pipeline = result['pipeline']
+                    print(f"  Pipeline: max queue depth {pipeline['max_queue_depth']}/"
+                          f"{pipeline['queue_size']}, bottleneck: {pipeline['bottleneck']}")
+                if result.get('spill') and result['spill']['spilled_batches']:
+                    spill = result['spill']
+                    print(f"  Spilled to disk: {spill['spilled_records']} records in "
+                          f"{spill['spilled_batches']} batches ({spill['spilled_bytes'] / 1e6:.2f} MB)")
+                if result.get('schedule'):
+                    schedule = result['schedule']
+                    print(f"  Schedule: {schedule['tasks']} tasks for {schedule['files']} files "
+                          f"({schedule['bundles']} bundles, {schedule['split_files']} files split "
+                          f"into {schedule['ranges']} ranges)")
                 print(f"  Database: {result['database_path']}")
                 print(f"  Table: {result['table_name']}")
                 
@@ -101,6 +405,11 @@ Examples:
                     for error in result['errors']:
                         print(f"    - {error}")
             
+            if args.stats:
+                print_stats(result['timings'])
+            if result.get('profile'):
+                print_profile(result['profile'])
+            
             return 0
         else:
             print(f"\nProcessing failed: {result.get('message', 'Unknown error')}")
@@ -8,7 +8,7 @@ Supports extensibility while maintaining simplicity for FYP scope.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from .database_connector import DatabaseConnector
 from .sqlite_connector import SQLiteConnector
 
@@ -88,17 +88,21 @@ class DatabaseConnectorFactory:
         """
         return list(self.SUPPORTED_DATABASES.keys())
     
-    def create_sqlite_connector(self, database_path: str) -> SQLiteConnector:
+    def create_sqlite_connector(self, database_path: str,
+                                load_profile: Optional[str] = None) -> SQLiteConnector:
         """
         Convenience method to create SQLite connector.
         
         Args:
             database_path: Path to SQLite database file
+            load_profile: Optional bulk-load profile (see SQLiteConnector.LOAD_PROFILES)
             
         Returns:
             SQLiteConnector: Configured SQLite connector instance
         """
         connection_params = {'database': database_path}
+        if load_profile:
+            connection_params['load_profile'] = load_profile
         return self.create_connector('sqlite', connection_params)
 
 
@@ -78,20 +78,98 @@ class DatabaseConnector(ABC):
 
     @abstractmethod
     def insert_data(self, table_name: str, data: List[Dict[str, Any]], 
-                   batch_size: int = 1000) -> int:
+                   batch_size: int = 1000, commit: bool = True) -> int:
         """
         Insert data into a table with batch optimization.
         
         Args:
             table_name: Name of the target table
-            data: List of records to insert
+            data: List of records, or a columnar batch (an object with
+                'columns' and rows()), to insert
             batch_size: Number of records per batch for optimization
+            commit: Commit after inserting; pass False to group several
+                inserts into one transaction and call commit() later
             
         Returns:
             int: Number of records successfully inserted
         """
         pass
 
+    @abstractmethod
+    def get_table_columns(self, table_name: str) -> List[str]:
+        """
+        Get the column names of an existing table.
+        
+        Args:
+            table_name: Name of the table to inspect
+            
+        Returns:
+            List[str]: Column names in table order (empty if table is missing)
+        """
+        pass
+
+    @abstractmethod
+    def get_column_types(self, table_name: str) -> Dict[str, str]:
+        """
+        Get the declared column types of an existing table.
+        
+        Args:
+            table_name: Name of the table to inspect
+            
+        Returns:
+            Dict[str, str]: Declared type per column name, in table order
+            (empty if table is missing)
+        """
+        pass
+
+    @abstractmethod
+    def add_columns(self, table_name: str, columns: List[Dict[str, Any]]) -> bool:
+        """
+        Add new columns to an existing table.
+        
+        Args:
+            table_name: Name of the table to alter
+            columns: Column definitions in the same format as create_table
+            
+        Returns:
+            bool: True if all columns were added, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    def widen_columns(self, table_name: str, column_names: List[str]) -> bool:
+        """
+        Change the type of existing columns to TEXT, keeping their rows.
+        
+        Args:
+            table_name: Name of the table to alter
+            column_names: Columns to store as TEXT from now on
+            
+        Returns:
+            bool: True if the columns were changed, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    def commit(self) -> bool:
+        """
+        Commit the current transaction.
+        
+        Returns:
+            bool: True if commit successful, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    def rollback(self) -> bool:
+        """
+        Roll back the current transaction.
+        
+        Returns:
+            bool: True if rollback successful, False otherwise
+        """
+        pass
+
     @abstractmethod
     def execute_query(self, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
         """
@@ -10,12 +10,20 @@ Achieves 100% transaction success with batch optimization.
 
 import sqlite3
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from itertools import groupby, islice
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
 from .database_connector import DatabaseConnector
 
 
+# Cached INSERT statements per connector; further key signatures are built per
+# call, so highly heterogeneous data cannot grow the cache without bound
+MAX_INSERT_STATEMENTS = 1024
+
+
 class SQLiteConnector(DatabaseConnector):
     """
     SQLite database connector implementation.
@@ -24,6 +32,36 @@ class SQLiteConnector(DatabaseConnector):
     Optimization: Batch processing for high throughput
     Referenced in: Results section (page 48) - Database performance
     """
+    
+    # Named bulk-load profiles: PRAGMA settings applied for the lifetime of the
+    # connection and restored to their previous values on disconnect.
+    # 'fast' keeps the database crash-safe (WAL, synchronous=NORMAL); 'bulk'
+    # keeps the rollback journal in memory and turns syncing off, so rollback
+    # still works but a crash mid-load can corrupt the file - only use it when
+    # the database can be rebuilt from the sources.
+    LOAD_PROFILES = {
+        'default': {},
+        'fast': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'cache_size': -64 * 1024,           # 64 MiB page cache
+            'temp_store': 'MEMORY',
+            'mmap_size': 256 * 1024 * 1024,
+        },
+        'bulk': {
+            'locking_mode': 'EXCLUSIVE',
+            # Not OFF: per-file transactions, incremental replacement and
+            # watch-mode group commits all rely on ROLLBACK
+            'journal_mode': 'MEMORY',
+            'synchronous': 'OFF',
+            'cache_size': -256 * 1024,          # 256 MiB page cache
+            'temp_store': 'MEMORY',
+            'mmap_size': 1024 * 1024 * 1024,
+        },
+    }
+    
+    # Settings that outlive the connection (or its locks) and must be put back
+    RESTORED_PRAGMAS = ('journal_mode', 'synchronous', 'locking_mode')
 
     def __init__(self, connection_params: Dict[str, Any]):
         """
@@ -31,12 +69,27 @@ class SQLiteConnector(DatabaseConnector):
         
         Args:
             connection_params: Dictionary containing 'database' key with SQLite file path
+                and optional 'load_profile' key naming one of LOAD_PROFILES
+            
+        Raises:
+            ValueError: If the load profile is unknown
         """
         super().__init__(connection_params)
         self.db_path = connection_params.get('database', 'default.db')
+        self.load_profile = connection_params.get('load_profile') or 'default'
+        if self.load_profile not in self.LOAD_PROFILES:
+            supported = ', '.join(self.LOAD_PROFILES)
+            raise ValueError(f"Unknown load profile '{self.load_profile}'. Supported profiles: {supported}")
         self.connection = None
+        self._saved_pragmas: Dict[str, Any] = {}
+        # Cumulative insert/commit timings, measured per call (cheap enough to keep on)
+        self.insert_stats = {'calls': 0, 'records': 0, 'seconds': 0.0, 'commit_seconds': 0.0}
         self.logger = logging.getLogger('data_ingestion.sqlite_connector')
         
+        # INSERT statement and row builder per (table, key signature); sqlite3
+        # keeps the prepared statement for each distinct SQL text in its cache
+        self._insert_statements: Dict[Tuple[str, tuple], Tuple[str, Callable]] = {}
+        
     def connect(self) -> bool:
         """
         Connect to SQLite database with automatic directory creation.
@@ -52,11 +105,17 @@ class SQLiteConnector(DatabaseConnector):
             # Establish connection with row factory for dict-like access
             self.connection = sqlite3.connect(self.db_path)
             self.connection.row_factory = sqlite3.Row
+            self._apply_load_profile()
             self.logger.info(f"Connected to SQLite database: {self.db_path}")
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to connect to SQLite database: {str(e)}")
+            if self.connection:
+                # e.g. a load profile PRAGMA failed; do not leave a half-set-up connection
+                self.connection.close()
+                self.connection = None
+            self._saved_pragmas = {}
             return False
 
     def disconnect(self) -> bool:
@@ -68,6 +127,7 @@ class SQLiteConnector(DatabaseConnector):
         """
         try:
             if self.connection:
+                self._restore_load_profile()
                 self.connection.close()
                 self.connection = None
                 self.logger.info("Disconnected from SQLite database")
@@ -141,12 +201,7 @@ class SQLiteConnector(DatabaseConnector):
         """
         try:
             # Build column definitions from schema
-            columns = []
-            for column in schema:
-                col_name = column['name']
-                col_type = column.get('type', 'TEXT').upper()
-                nullable = '' if column.get('nullable', True) else ' NOT NULL'
-                columns.append(f'"{col_name}" {col_type}{nullable}')
+            columns = [self._column_definition(column) for column in schema]
             
             # Create table query with IF NOT EXISTS for safety
             columns_sql = ', '.join(columns)
@@ -164,8 +219,141 @@ class SQLiteConnector(DatabaseConnector):
             self.logger.error(f"Failed to create table '{table_name}': {str(e)}")
             return False
 
-    def insert_data(self, table_name: str, data: List[Dict[str, Any]], 
-                   batch_size: int = 1000) -> int:
+    def get_table_columns(self, table_name: str) -> List[str]:
+        """
+        Get the column names of an existing table.
+        
+        Args:
+            table_name: Name of the table to inspect
+            
+        Returns:
+            List[str]: Column names in table order (empty if table is missing)
+        """
+        if not self.connection:
+            if not self.connect():
+                return []
+        
+        try:
+            # PRAGMA is read directly so it does not commit an open transaction
+            cursor = self.connection.execute(f'PRAGMA table_info("{table_name}")')
+            return [row['name'] for row in cursor.fetchall()]
+            
+        except Exception as e:
+            self.logger.error(f"Failed to read columns of '{table_name}': {str(e)}")
+            return []
+
+    def get_column_types(self, table_name: str) -> Dict[str, str]:
+        """
+        Get the declared column types of an existing table.
+        
+        Args:
+            table_name: Name of the table to inspect
+            
+        Returns:
+            Dict[str, str]: Declared type per column name, in table order
+            (empty if table is missing)
+        """
+        if not self.connection:
+            if not self.connect():
+                return {}
+        
+        try:
+            # PRAGMA is read directly so it does not commit an open transaction
+            cursor = self.connection.execute(f'PRAGMA table_info("{table_name}")')
+            return {row['name']: row['type'].upper() for row in cursor.fetchall()}
+            
+        except Exception as e:
+            self.logger.error(f"Failed to read columns of '{table_name}': {str(e)}")
+            return {}
+
+    def widen_columns(self, table_name: str, column_names: List[str]) -> bool:
+        """
+        Change the type of existing columns to TEXT, keeping their rows.
+        
+        SQLite cannot change a column's type in place, so the table is rebuilt
+        under a temporary name and renamed back. Rows keep their rowids, and
+        values already stored in the columns become text as a TEXT column
+        would have stored them. Like add_columns, the change is not committed
+        and is undone by rollback().
+        
+        Args:
+            table_name: Name of the table to alter
+            column_names: Columns to store as TEXT from now on
+            
+        Returns:
+            bool: True if the columns were changed, False otherwise
+        """
+        if not column_names:
+            return True
+        
+        try:
+            if not self.connection:
+                if not self.connect():
+                    return False
+            
+            cursor = self.connection.cursor()
+            table_info = cursor.execute(f'PRAGMA table_info("{table_name}")').fetchall()
+            widened = set(column_names)
+            columns = [self._column_definition({
+                'name': row['name'],
+                'type': 'TEXT' if row['name'] in widened else row['type'],
+                'nullable': not row['notnull'],
+            }) for row in table_info]
+            names = ', '.join(f'"{row["name"]}"' for row in table_info)
+            rebuilt = f'{table_name}__rebuild'
+            
+            # Keep the rebuild in one transaction, joining the caller's if open
+            if not self.connection.in_transaction:
+                cursor.execute('BEGIN')
+            cursor.execute(f'CREATE TABLE "{rebuilt}" ({", ".join(columns)})')
+            cursor.execute(f'INSERT INTO "{rebuilt}" (rowid, {names}) '
+                           f'SELECT rowid, {names} FROM "{table_name}"')
+            cursor.execute(f'DROP TABLE "{table_name}"')
+            cursor.execute(f'ALTER TABLE "{rebuilt}" RENAME TO "{table_name}"')
+            
+            self.logger.info(f"Changed {len(widened)} columns of '{table_name}' to TEXT")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to change columns of '{table_name}' to TEXT: {str(e)}")
+            return False
+
+    def add_columns(self, table_name: str, columns: List[Dict[str, Any]]) -> bool:
+        """
+        Add new columns to an existing table using ALTER TABLE.
+        
+        SQLite only appends nullable columns, so NOT NULL is never applied here.
+        The change is not committed, so it joins the caller's current transaction.
+        
+        Args:
+            table_name: Name of the table to alter
+            columns: Column definitions in the same format as create_table
+            
+        Returns:
+            bool: True if all columns were added, False otherwise
+        """
+        if not columns:
+            return True
+        
+        try:
+            if not self.connection:
+                if not self.connect():
+                    return False
+            
+            cursor = self.connection.cursor()
+            for column in columns:
+                definition = self._column_definition(dict(column, nullable=True))
+                cursor.execute(f'ALTER TABLE "{table_name}" ADD COLUMN {definition}')
+            
+            self.logger.info(f"Added {len(columns)} columns to '{table_name}'")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to add columns to '{table_name}': {str(e)}")
+            return False
+
+    def insert_data(self, table_name: str, data: Union[List[Dict[str, Any]], Any], 
+                   batch_size: int = 1000, commit: bool = True) -> int:
         """
         Insert data into table with batch optimization.
         
@@ -173,10 +361,20 @@ class SQLiteConnector(DatabaseConnector):
         Achievement: Enables 30,786 records/sec average performance
         Referenced in: Results section (page 47) - Throughput achievements
         
+        Consecutive records with the same key signature are written with one
+        executemany() of row tuples built by itemgetter, so mixed-shape records
+        keep all their columns, rows need no per-column dict lookups in Python
+        and rows are inserted (and get rowids) in input order. A columnar batch (any object with a 'columns'
+        list and a rows() iterator of tuples, such as
+        processors.record_batch.RecordBatch) is bound row by row straight from
+        its column lists with a single statement.
+        
         Args:
             table_name: Name of the table
-            data: List of records to insert
+            data: List of records, or a columnar batch, to insert
             batch_size: Number of records to insert per batch
+            commit: Commit after inserting; pass False to keep the rows in the
+                current transaction until commit() or rollback() is called
             
         Returns:
             int: Number of records successfully inserted
@@ -184,34 +382,37 @@ class SQLiteConnector(DatabaseConnector):
         if not data:
             return 0
         
+        started = time.perf_counter()
         try:
             if not self.connection:
                 if not self.connect():
                     return 0
             
-            # Get column names from first record
-            columns = list(data[0].keys())
-            placeholders = ', '.join(['?' for _ in columns])
-            column_names = ', '.join([f'"{col}"' for col in columns])
-            
-            query = f'INSERT INTO "{table_name}" ({column_names}) VALUES ({placeholders})'
-            
             cursor = self.connection.cursor()
             total_inserted = 0
             
-            # Process data in batches for optimal performance
-            for i in range(0, len(data), batch_size):
-                batch = data[i:i + batch_size]
-                batch_values = []
-                
-                for record in batch:
-                    row_values = [record.get(col) for col in columns]
-                    batch_values.append(row_values)
-                
-                cursor.executemany(query, batch_values)
-                total_inserted += cursor.rowcount
+            if self._is_columnar(data):
+                # Columnar batch: one signature, rows come straight from the columns
+                query, _ = self._insert_statement(table_name, tuple(data.columns))
+                rows = data.rows()
+                for _ in range(0, len(data), batch_size):
+                    cursor.executemany(query, islice(rows, batch_size))
+                    total_inserted += cursor.rowcount
+            else:
+                # Process data in batches for optimal performance
+                for i in range(0, len(data), batch_size):
+                    for signature, group in groupby(data[i:i + batch_size], key=tuple):
+                        query, build_row = self._insert_statement(table_name, signature)
+                        cursor.executemany(query, map(build_row, group))
+                        total_inserted += cursor.rowcount
             
-            self.connection.commit()
+            if commit:
+                self.connection.commit()
+            
+            stats = self.insert_stats
+            stats['calls'] += 1
+            stats['records'] += total_inserted
+            stats['seconds'] += time.perf_counter() - started
             self.logger.info(f"Inserted {total_inserted} records into '{table_name}'")
             return total_inserted
             
@@ -221,6 +422,149 @@ class SQLiteConnector(DatabaseConnector):
                 self.connection.rollback()
             return 0
 
+    @staticmethod
+    def _is_columnar(data) -> bool:
+        """Whether data is a columnar batch rather than a list of records (duck typed)."""
+        return hasattr(data, 'columns') and hasattr(data, 'rows')
+
+    def _insert_statement(self, table_name: str, signature: tuple) -> Tuple[str, Callable]:
+        """
+        Get the cached INSERT statement and row-tuple builder for a key signature.
+        
+        Statements are built uncached once MAX_INSERT_STATEMENTS are cached.
+        
+        Args:
+            table_name: Target table
+            signature: Record keys in record order
+            
+        Returns:
+            Tuple of (SQL text, function turning a record into a row tuple)
+        """
+        key = (table_name, signature)
+        statement = self._insert_statements.get(key)
+        if statement is None:
+            if not signature:
+                statement = (f'INSERT INTO "{table_name}" DEFAULT VALUES', lambda record: ())
+            else:
+                column_names = ', '.join(f'"{col}"' for col in signature)
+                placeholders = ', '.join('?' for _ in signature)
+                query = f'INSERT INTO "{table_name}" ({column_names}) VALUES ({placeholders})'
+                if len(signature) == 1:
+                    # itemgetter with one key returns the bare value, not a tuple
+                    column = signature[0]
+                    statement = (query, lambda record: (record[column],))
+                else:
+                    statement = (query, itemgetter(*signature))
+            if len(self._insert_statements) < MAX_INSERT_STATEMENTS:
+                self._insert_statements[key] = statement
+        return statement
+
+    def release_exclusive_lock(self):
+        """
+        Switch an EXCLUSIVE-locking connection back to NORMAL locking.
+        
+        For long-lived connections (watch mode): locks are then released at the
+        end of every transaction, so other connections can read between
+        writes. The rest of the load profile stays in place, and the original
+        locking mode is still restored on disconnect.
+        """
+        if not self.connection:
+            if not self.connect():
+                return
+        
+        mode = self.connection.execute('PRAGMA locking_mode').fetchone()[0]
+        if mode.lower() != 'exclusive':
+            return
+        self.connection.execute('PRAGMA locking_mode = NORMAL')
+        if not self.connection.in_transaction:
+            # A held exclusive lock is only released on the next database access
+            self.connection.execute('SELECT 1 FROM sqlite_master LIMIT 1').fetchall()
+        self.logger.info("Switched to NORMAL locking so other connections can read")
+
+    def _apply_load_profile(self):
+        """Apply the connection's load profile, remembering settings to restore."""
+        settings = self.LOAD_PROFILES[self.load_profile]
+        if not settings:
+            return
+        
+        self._saved_pragmas = {
+            name: self.connection.execute(f'PRAGMA {name}').fetchone()[0]
+            for name in self.RESTORED_PRAGMAS if name in settings
+        }
+        for name, value in settings.items():
+            self.connection.execute(f'PRAGMA {name} = {value}')
+        self.logger.info(f"Applied '{self.load_profile}' load profile")
+
+    def _restore_load_profile(self):
+        """Put back the settings changed by the load profile. Never raises."""
+        if not self._saved_pragmas:
+            return
+        
+        try:
+            if self.connection.in_transaction:
+                self.connection.rollback()
+            for name, value in self._saved_pragmas.items():
+                self.connection.execute(f'PRAGMA {name} = {value}')
+            if 'locking_mode' in self._saved_pragmas:
+                # The exclusive lock is only released on the next database access
+                self.connection.execute('SELECT 1 FROM sqlite_master LIMIT 1').fetchall()
+            self.logger.info(f"Restored settings after '{self.load_profile}' load profile")
+        except Exception as e:
+            self.logger.warning(f"Could not restore settings after load profile: {str(e)}")
+        finally:
+            self._saved_pragmas = {}
+
+    def commit(self) -> bool:
+        """
+        Commit the current transaction.
+        
+        Returns:
+            bool: True if commit successful, False otherwise
+        """
+        started = time.perf_counter()
+        try:
+            if self.connection:
+                self.connection.commit()
+            self.insert_stats['commit_seconds'] += time.perf_counter() - started
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Commit failed: {str(e)}")
+            return False
+
+    def rollback(self) -> bool:
+        """
+        Roll back the current transaction.
+        
+        Returns:
+            bool: True if rollback successful, False otherwise
+        """
+        try:
+            if self.connection:
+                self.connection.rollback()
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Rollback failed: {str(e)}")
+            return False
+
+    def _column_definition(self, column: Dict[str, Any]) -> str:
+        """Build the SQL column definition for a schema entry."""
+        col_name = column['name']
+        col_type = column.get('type', 'TEXT').upper()
+        nullable = '' if column.get('nullable', True) else ' NOT NULL'
+        return f'"{col_name}" {col_type}{nullable}'
+
+    def get_insert_statistics(self) -> Dict[str, Any]:
+        """
+        Get cumulative insert statistics for this connector.
+        
+        Returns:
+            Dict of insert_data() calls, records inserted, seconds spent in
+            insert_data() (including commits it made) and seconds spent in commit()
+        """
+        return self.insert_stats.copy()
+
     def get_connection_info(self) -> Dict[str, Any]:
         """
         Get information about the database connection.
@@ -232,5 +576,6 @@ class SQLiteConnector(DatabaseConnector):
             'db_type': 'sqlite',
             'database': self.db_path,
             'connected': self.connection is not None,
+            'load_profile': self.load_profile,
             'file_exists': Path(self.db_path).exists() if self.db_path else False
         }
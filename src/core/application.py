@@ -5,13 +5,26 @@ FYP Project - University of Hertfordshire
 """
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Union
 import time
-import json
 import logging
+from itertools import chain
 
 from processors.json_processor import JSONProcessor
+from processors.json_backend import backend_selection, get_backend, restore_backend, select_backend
 from scanners.file_scanner import FileScanner
+from processors.schema_inference import DEFAULT_TYPE, SchemaAccumulator
+from processors.record_batch import RecordBatch
+from core.parallel import (STREAMING_JSON_LINES_CHUNK_BYTES, resolve_jobs, iter_file_batches,
+                           iter_parallel_file_batches)
+from core.scheduler import SCHEDULES, SizeAwareScheduler
+from core.manifest import IngestionManifest
+from core.pipeline import BatchPipeline
+from core.timings import IngestionTimings
+from core.profiling import active_memory_tracer, create_profiler
+from core.spill import SpillBuffer
+from core.watch import (DEFAULT_BATCH_FILES, DEFAULT_POLL_INTERVAL, DEFAULT_SETTLE_SECONDS,
+                        DirectoryWatcher)
 from connectors.connector_factory import get_connector_factory
 
 
@@ -34,68 +47,260 @@ This class implements the main application logic for the Generic Data Ingestion
             self.logger.setLevel(logging.INFO)
 
     def process_directory(self, directory: str, output_db: str = "output.db", 
-                         table_name: str = "processed_data") -> Dict[str, Any]:
+                         table_name: str = "processed_data",
+                         streaming: bool = False, batch_size: int = 1000,
+                         item_path: Optional[str] = None, jobs: int = 1,
+                         incremental: bool = False, typed_columns: bool = False,
+                         load_profile: Optional[str] = None,
+                         pipeline: bool = False, columnar: bool = False,
+                         json_backend: Optional[str] = None,
+                         profile: Optional[str] = None,
+                         profile_output: Optional[str] = None,
+                         profile_top: int = 20,
+                         memory_budget_mb: Optional[float] = None,
+                         spill_dir: Optional[str] = None,
+                         scan_threads: int = 1,
+                         scan_index: Optional[str] = None,
+                         schedule: str = 'fifo') -> Dict[str, Any]:
         """
         Process all JSON files in a directory and save to SQLite.        
         Args:
             directory: Path to directory containing JSON files
             output_db: Path to SQLite database file
             table_name: Name of table to create/use
+            streaming: Write each file to the database in batches as soon as it
+                is processed instead of collecting every record first, so memory
+                stays flat regardless of directory size
+            batch_size: Number of records read, processed and (in streaming
+                mode) written at a time
+            item_path: Optional dotted key path to the record array inside each
+                file, e.g. 'data.records' for {"data": {"records": [...]}}
+            jobs: Number of worker processes used to parse and transform files;
+                1 processes files in this process, 0 uses one per CPU core.
+                Writes always go through a single SQLite connection. A worker
+                returns a whole file (or JSON Lines byte range) of processed
+                records at once and up to two results per worker can wait for
+                the writer, so with streaming, memory is bounded by jobs times
+                the largest task rather than flat: JSON Lines files are split
+                into 8 MiB ranges, but a JSON array file is always one task.
+            incremental: Skip files already ingested unchanged (tracked in a
+                manifest table in the output database), replace the rows of
+                changed files and append new ones
+            typed_columns: Store columns as INTEGER, REAL, TEXT or JSON_TEXT based
+                on the values seen instead of TEXT throughout, and keep nulls as
+                NULL. In streaming mode a column is typed when it is created; if
+                text later reaches an INTEGER or REAL column, the table is rebuilt
+                with that column as TEXT (values already written become text)
+            load_profile: SQLite bulk-load profile for the writing connection
+                ('default', 'fast' or 'bulk'); settings are restored afterwards
+            pipeline: Read and parse files in a background thread feeding a
+                bounded queue, so reading, parsing and database writes overlap
+                (most useful with streaming). Queue metrics are returned under
+                'pipeline'
+            columnar: Carry processed records as columnar RecordBatch objects
+                (per-column lists) from parsing to the database instead of one
+                dict per record
+            json_backend: JSON engine for decoding files ('json', 'orjson' or
+                'auto') for this run only; None keeps the process default, the
+                fastest installed one. Nested values are always encoded by the
+                stdlib, so the stored text does not depend on it.
+                Reported under 'json_backend'
+            profile: 'cpu' to run under cProfile or 'memory' to trace peak memory
+                per stage with tracemalloc (see core.profiling); the summary is
+                returned under 'profile'
+            profile_output: File for the CPU profile (default: the output
+                database path with a .prof suffix)
+            profile_top: Number of functions / allocation sites in the summary
+            memory_budget_mb: Batch mode only - estimated megabytes of processed
+                batches held in memory before further batches are spilled to a
+                scratch SQLite file and read back for the final save (see
+                core.spill). Spill figures are returned under 'spill'
+            spill_dir: Directory for the scratch file (default: system temp)
+            scan_threads: Directories listed concurrently during discovery;
+                above 1 files are sorted by path so the run order stays fixed
+            scan_index: Persistent directory index file (see
+                scanners.directory_index); directories unchanged since the
+                previous run are not listed again
+            schedule: How files are handed to worker processes when jobs > 1:
+                'fifo' (default) dispatches and writes files in discovery
+                order. 'size' plans the whole listing first (largest files
+                first, small files bundled, large JSON Lines files split; see
+                core.scheduler) and writes files as they finish, so row order
+                varies between runs and files are not processed during
+                discovery. The plan is returned under 'schedule'
             
         Returns:
-            Dict containing comprehensive processing results
+            Dict containing comprehensive processing results, including
+            'timings': seconds, records and bytes per stage (scan, decode,
+            transform, schema, insert) and per file (see core.timings)
         """
         start_time = time.time()
+        connector = None
+        file_batches = None
+        timings = IngestionTimings()
+        profiler = None
+        all_batches = None
+        # Backend selection to put back when json_backend only applies to this run
+        previous_backend = None
         
         try:
+            # Profilers only exist when requested, so a normal run pays nothing
+            profiler = create_profiler(profile, profile_output or Path(output_db).with_suffix('.prof'),
+                                       profile_top)
+            if profiler:
+                self.logger.info(f"Profiling run ({profiler.mode})")
+                profiler.start()
+            tracer = active_memory_tracer()
+            
             self.logger.info(f"Starting data ingestion from: {directory}")
             
+            # Chosen before any reader or processor exists so all of them share it
+            if json_backend:
+                previous_backend = backend_selection()
+                backend = select_backend(json_backend)
+            else:
+                backend = get_backend()
+            self.logger.info(f"JSON backend: {backend.name}")
+            
             # Validate input directory
             if not Path(directory).exists():
                 raise FileNotFoundError(f"Directory not found: {directory}")
+            if schedule not in SCHEDULES:
+                raise ValueError(f"Unknown schedule '{schedule}' (expected one of {', '.join(SCHEDULES)})")
+            if memory_budget_mb is not None and not 0 < memory_budget_mb < float('inf'):
+                raise ValueError(f"Memory budget must be a positive number of megabytes, got {memory_budget_mb}")
+            jobs = resolve_jobs(jobs)
+            # Streaming keeps worker results small by splitting JSON Lines files finely
+            chunk_bytes = STREAMING_JSON_LINES_CHUNK_BYTES if streaming else None
+            scheduler = (SizeAwareScheduler(chunk_bytes=chunk_bytes)
+                         if jobs > 1 and schedule == 'size' else None)
             
             # File discovery using custom scanner
             # Referenced in: Implementation section (page 19)
-            scanner = FileScanner(directory)
-            discovered_files = scanner.discover_files(file_types=['json'], recursive=True)
-            json_files = discovered_files.get('json', [])
+            scanner = FileScanner(directory, index_path=scan_index)
+            # Files are processed while the tree is still being walked, except
+            # when the whole listing is needed first: incremental runs compare
+            # it with the manifest, parallel listings are sorted and the
+            # size-aware scheduler plans every file before dispatching any
+            lazy_discovery = not incremental and scan_threads <= 1 and scheduler is None
+            if lazy_discovery:
+                discovered = (file_path for _, file_path in
+                              scanner.iter_files(file_types=['json'], recursive=True))
+                first_file = next(discovered, None)
+                json_files = [first_file] if first_file is not None else []
+                if tracer is not None:
+                    # Later listing interleaves with parsing and is counted there
+                    tracer.mark('scan')
+            else:
+                discovered_files = scanner.discover_files(file_types=['json'], recursive=True,
+                                                          threads=scan_threads, ordered=scan_threads > 1)
+                json_files = discovered_files.get('json', [])
+                timings.record_scan(scanner.get_scan_statistics())
+                if tracer is not None:
+                    tracer.mark('scan')
             
             if not json_files:
                 self.logger.warning("No JSON files found in directory")
                 return {'success': False, 'message': 'No JSON files found'}
             
-            self.logger.info(f"Found {len(json_files)} JSON files to process")
+            if lazy_discovery:
+                self.logger.info("Processing JSON files as they are discovered")
+            else:
+                self.logger.info(f"Found {len(json_files)} JSON files to process")
+            
+            # Streaming mode keeps one connection open and writes file by file
+            # Declared type of every column the table has so far
+            known_columns = {}
+            if streaming:
+                connector = self.connector_factory.create_sqlite_connector(output_db, load_profile)
+                known_columns.update(connector.get_column_types(table_name))
+            
+            # Incremental mode only processes files that are new or changed
+            manifest = None
+            file_states = {}
+            files_to_process = chain(json_files, discovered) if lazy_discovery else json_files
+            if incremental:
+                manifest, file_states, files_to_process = self._plan_incremental_run(
+                    scanner, json_files, connector, output_db, table_name
+                )
+            
+            # Parse and transform in worker processes when more than one job is
+            # requested; either way each file arrives as a stream of record batches
+            # together with a schema accumulator that has seen every record yielded
+            # Bad lines in JSON Lines files are collected here and reported per line
+            line_errors = []
+            # In pipeline mode the source runs on the reader thread and reports
+            # line errors there; they are handed back here file by file
+            batch_pipeline = BatchPipeline() if pipeline else None
+            source_errors = batch_pipeline.source_errors if batch_pipeline else line_errors
+            if jobs > 1:
+                self.logger.info(f"Parsing files with {jobs} worker processes ({schedule} schedule)")
+                file_batches = iter_parallel_file_batches(
+                    files_to_process, jobs, item_path, batch_size, source_errors, typed_columns,
+                    columnar, timings, scheduler, scanner.file_sizes, chunk_bytes
+                )
+            else:
+                file_batches = iter_file_batches(
+                    files_to_process, JSONProcessor(typed_values=typed_columns), item_path,
+                    batch_size, source_errors, typed_columns, columnar, timings
+                )
+            if batch_pipeline:
+                self.logger.info("Reading files on a background thread (pipeline mode)")
+                file_batches = batch_pipeline.run(file_batches, line_errors)
             
             # Process files with graceful error handling
             # Innovation: Continue-on-error approach vs fail-fast enterprise systems
-            processor = JSONProcessor()
-            all_data = []
+            # Batch mode keeps every processed batch until the final save,
+            # on disk once the memory budget is used up
+            budget_bytes = int(memory_budget_mb * 1024 * 1024) if memory_budget_mb is not None else None
+            all_batches = SpillBuffer(budget_bytes, spill_dir)
             processed_files = 0
+            total_records = 0
+            records_saved = 0
             errors = []
+            ingested_files = []
+            # Schema of every record kept for the batch-mode save
+            run_schema = SchemaAccumulator(infer_types=typed_columns)
             
-            for file_path in json_files:
+            for file_path, batches, file_schema in file_batches:
+                file_stream = batches
                 try:
                     self.logger.info(f"Processing: {file_path.name}")
                     
-                    # Read JSON file with encoding handling
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Ensure data is a list for consistent processing
-                    if isinstance(data, dict):
-                        data = [data]
+                    file_state = file_states.get(file_path)
+                    if manifest:
+                        # Tag rows with their relative path so they can be replaced later
+                        batches = self._tag_source_path(batches, file_state[1]['file_path'])
+                        file_schema.add_column(IngestionManifest.SOURCE_PATH_COLUMN)
                     
-                    # Process the data using simplified JSON processor
+                    # Batches are read incrementally and processed by JSONProcessor
                     # Referenced in: Implementation section (page 21)
-                    processed_data = processor.process_data(data)
-                    if processed_data:
-                        # Add source file metadata for data lineage
-                        for record in processed_data:
-                            record['_source_file'] = file_path.name
-                        
-                        all_data.extend(processed_data)
+                    if streaming:
+                        insert_before = self._insert_seconds(connector)
+                        file_records = self._stream_file_to_database(
+                            connector, batches, file_schema, file_path.name, table_name,
+                            known_columns, manifest, file_state
+                        )
+                        records_saved += file_records
+                        timings.record_insert(self._insert_seconds(connector) - insert_before,
+                                              file_records, file_path)
+                    else:
+                        # Only keep a file's records once it has parsed completely
+                        checkpoint = all_batches.checkpoint()
+                        try:
+                            file_records = all_batches.extend(batches)
+                        except Exception:
+                            all_batches.rollback(checkpoint)
+                            raise
+                        run_schema.merge(file_schema)
+                    
+                    if manifest:
+                        ingested_files.append((file_state, file_records))
+                    
+                    if file_records:
+                        total_records += file_records
                         processed_files += 1
-                        self.logger.info(f"  ✓ Processed {len(processed_data)} records")
+                        self.logger.info(f"  ✓ Processed {file_records} records")
                     else:
                         self.logger.warning(f"  ⚠ No valid data in {file_path.name}")
                         
@@ -106,38 +311,81 @@ This class implements the main application logic for the Generic Data Ingestion
                     errors.append(error_msg)
                     self.logger.error(f"  ✗ {error_msg}")
                     # Continue processing other files (graceful degradation)
+                    # Closing the rest of the file reports its line errors now
+                    file_stream.close()
+                
+                # Skipped lines do not fail the file but are still reported
+                for line_error in line_errors:
+                    error_msg = f"Error processing {line_error}"
+                    errors.append(error_msg)
+                    self.logger.warning(f"  ⚠ {error_msg}")
+                line_errors.clear()
             
-            if not all_data:
+            # An incremental run with nothing new to load is still a success
+            up_to_date = incremental and not files_to_process
+            if not total_records and not ingested_files and not up_to_date:
                 return {
                     'success': False, 
                     'message': 'No data was processed successfully',
                     'errors': errors
                 }
             
-            # Save to SQLite database with batch optimization
-            # Referenced in: Results section (page 48)
-            self.logger.info(f"Saving {len(all_data)} records to database: {output_db}")
-            db_result = self._save_to_database(all_data, output_db, table_name)
+            if not streaming and (all_batches or ingested_files):
+                # Save to SQLite database with batch optimization
+                # Referenced in: Results section (page 48)
+                self.logger.info(f"Saving {total_records} records to database: {output_db}")
+                if tracer is not None:
+                    tracer.mark(None)
+                db_result = self._save_to_database(all_batches, output_db, table_name,
+                                                   manifest, ingested_files,
+                                                   run_schema.to_schema(), load_profile)
+                if tracer is not None:
+                    tracer.mark('insert')
+                records_saved = db_result.get('records_saved', 0)
+                timings.record_insert(db_result.get('insert_seconds', 0.0), records_saved)
+            
+            if lazy_discovery:
+                # Discovery finished with the last file; scan time excludes processing
+                timings.record_scan(scanner.get_scan_statistics())
+                total_files = scanner.get_scan_statistics()['files_classified']
+            else:
+                total_files = len(json_files)
+            skipped_files = total_files - len(files_to_process) if incremental else 0
             
             # Calculate comprehensive performance metrics
             processing_time = time.time() - start_time
+            if profiler:
+                profiler.stop()
             
             result = {
                 'success': True,
-                'total_files': len(json_files),
+                'total_files': total_files,
                 'processed_files': processed_files,
-                'failed_files': len(json_files) - processed_files,
-                'total_records': len(all_data),
+                'failed_files': total_files - processed_files - skipped_files,
+                'skipped_files': skipped_files,
+                'total_records': total_records,
                 'processing_time_seconds': round(processing_time, 2),
                 'database_path': output_db,
                 'table_name': table_name,
-                'database_records': db_result.get('records_saved', 0),
+                'database_records': records_saved,
+                'streaming': streaming,
+                'jobs': jobs,
+                'incremental': incremental,
+                'typed_columns': typed_columns,
+                'load_profile': load_profile or 'default',
+                'pipeline': batch_pipeline.metrics() if batch_pipeline else None,
+                'columnar': columnar,
+                'json_backend': backend.name,
+                'timings': timings.report(),
+                'profile': profiler.report() if profiler else None,
+                'spill': all_batches.stats() if not streaming else None,
+                'schedule': scheduler.statistics() if scheduler else None,
                 'errors': errors,
-                'throughput_rps': round(len(all_data) / processing_time, 2) if processing_time > 0 else 0
+                'throughput_rps': round(total_records / processing_time, 2) if processing_time > 0 else 0
             }
             
             self.logger.info(f"Processing completed in {processing_time:.2f}s")
-            self.logger.info(f"Successfully processed {processed_files}/{len(json_files)} files")
+            self.logger.info(f"Successfully processed {processed_files}/{total_files} files")
             self.logger.info(f"Saved {result['database_records']} records to {output_db}")
             self.logger.info(f"Throughput: {result['throughput_rps']} records/sec")
             
@@ -151,39 +399,295 @@ This class implements the main application logic for the Generic Data Ingestion
                 'message': error_msg,
                 'processing_time_seconds': round(time.time() - start_time, 2)
             }
+        finally:
+            if file_batches is not None and hasattr(file_batches, 'close'):
+                # Stops the reader thread / worker pool if the loop was left early
+                file_batches.close()
+            if connector:
+                connector.disconnect()
+            if profiler:
+                profiler.stop()
+            if all_batches is not None:
+                all_batches.close()
+            if previous_backend is not None:
+                restore_backend(previous_backend)
+
+    def watch_directory(self, directory: str, output_db: str = "output.db",
+                        table_name: str = "processed_data",
+                        poll_interval: float = DEFAULT_POLL_INTERVAL,
+                        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+                        max_batch_files: int = DEFAULT_BATCH_FILES,
+                        batch_size: int = 1000, item_path: Optional[str] = None,
+                        typed_columns: bool = False, load_profile: Optional[str] = None,
+                        columnar: bool = False, json_backend: Optional[str] = None,
+                        scan_index: Optional[str] = None,
+                        max_polls: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Keep ingesting new and changed files from a directory (see core.watch).
+        
+        The connector, processor, table columns and manifest stay open between
+        polls. Files are read once their mtime is settle_seconds old and written
+        max_batch_files per transaction. Runs until interrupted (Ctrl+C) or
+        max_polls polls.
+        
+        Returns:
+            Dict with 'success' and the watcher totals (polls, files ingested,
+            files unchanged, records, commits, errors)
+        """
+        start_time = time.time()
+        watcher = None
+        previous_backend = None
+        
+        try:
+            if not Path(directory).exists():
+                raise FileNotFoundError(f"Directory not found: {directory}")
+            if json_backend:
+                previous_backend = backend_selection()
+                backend = select_backend(json_backend)
+            else:
+                backend = get_backend()
+            self.logger.info(f"JSON backend: {backend.name}")
+            
+            watcher = DirectoryWatcher(
+                self, directory, output_db, table_name, poll_interval, settle_seconds,
+                max_batch_files, batch_size, item_path, typed_columns, load_profile,
+                columnar, scan_index
+            )
+            try:
+                watcher.run(max_polls)
+            except KeyboardInterrupt:
+                self.logger.info("Watch stopped")
+            
+            return dict(watcher.totals, success=True, database_path=output_db, table_name=table_name,
+                        processing_time_seconds=round(time.time() - start_time, 2))
+            
+        except Exception as e:
+            error_msg = f"Watch failed: {str(e)}"
+            self.logger.error(error_msg)
+            result = {'success': False, 'message': error_msg,
+                      'processing_time_seconds': round(time.time() - start_time, 2)}
+            if watcher:
+                result.update(watcher.totals)
+            return result
+        finally:
+            if watcher:
+                watcher.close()
+            if previous_backend is not None:
+                restore_backend(previous_backend)
+
+    def _plan_incremental_run(self, scanner: FileScanner, json_files: List[Path],
+                              connector, output_db: str, table_name: str):
+        """
+        Compare discovered files with the manifest and decide what to process.
+        
+        Returns:
+            Tuple of (manifest, {file path: (state, fingerprint)}, files to process)
+        """
+        owns_connector = connector is None
+        if owns_connector:
+            connector = self.connector_factory.create_sqlite_connector(output_db)
+        
+        try:
+            manifest = IngestionManifest(scanner, table_name)
+            if not manifest.load(connector):
+                raise RuntimeError("Could not load ingestion manifest")
+            
+            file_states = {}
+            files_to_process = []
+            counts = {manifest.NEW: 0, manifest.CHANGED: 0, manifest.UNCHANGED: 0}
+            
+            for file_path in json_files:
+                state, fingerprint = manifest.classify(file_path)
+                file_states[file_path] = (state, fingerprint)
+                counts[state] += 1
+                
+                if state == manifest.UNCHANGED:
+                    if manifest.is_stale(fingerprint):
+                        manifest.refresh(connector, fingerprint)
+                else:
+                    files_to_process.append(file_path)
+            
+            connector.commit()
+            self.logger.info(
+                f"Incremental run: {counts[manifest.NEW]} new, {counts[manifest.CHANGED]} changed, "
+                f"{counts[manifest.UNCHANGED]} unchanged files"
+            )
+            return manifest, file_states, files_to_process
+            
+        finally:
+            if owns_connector:
+                connector.disconnect()
 
-    def _save_to_database(self, data: List[Dict[str, Any]], 
-                         db_path: str, table_name: str) -> Dict[str, Any]:
+    def _tag_source_path(self, batches: Iterator[List[Dict[str, Any]]],
+                         source_path: str) -> Iterator[List[Dict[str, Any]]]:
+        """Add the relative source path used by incremental mode to every record."""
+        for batch in batches:
+            if isinstance(batch, RecordBatch):
+                batch.set_column(IngestionManifest.SOURCE_PATH_COLUMN, source_path)
+            else:
+                for record in batch:
+                    record[IngestionManifest.SOURCE_PATH_COLUMN] = source_path
+            yield batch
+
+    def _stream_file_to_database(self, connector, batches: Iterator[List[Dict[str, Any]]],
+                                 file_schema: SchemaAccumulator,
+                                 source_name: str, table_name: str,
+                                 known_columns: Dict[str, str],
+                                 manifest: Optional[IngestionManifest] = None,
+                                 file_state: Optional[tuple] = None,
+                                 commit: bool = True) -> int:
+        """
+        Write one file's processed record batches directly to the database.
+        
+        All batches of a file share one transaction, so a failure part-way through
+        leaves no partial rows behind and the file is reported as a single error.
+        With commit=False the file joins the caller's open transaction (group
+        commit) and the caller commits, or rolls back on error.
+        In incremental mode the old rows of a changed file are deleted and the
+        manifest entry is written in that same transaction. The table is widened
+        from the file's schema accumulator as new columns appear, so a field
+        first seen deep into a file still gets its own column, and a typed
+        numeric column is changed to TEXT before text values reach it.
+        
+        Returns:
+            Number of records written for the file
+        """
+        file_records = 0
+        
+        try:
+            if manifest and file_state[0] == manifest.CHANGED:
+                manifest.delete_rows(connector, file_state[1])
+            
+            for batch in batches:
+                self._ensure_table_columns(connector, table_name, file_schema, known_columns)
+                inserted = connector.insert_data(table_name, batch, batch_size=len(batch),
+                                                 commit=False)
+                if inserted != len(batch):
+                    raise RuntimeError(f"Database write failed for {source_name}")
+                file_records += inserted
+            
+            if manifest:
+                manifest.record(connector, file_state[1], file_records)
+            
+            if commit and not connector.commit():
+                raise RuntimeError(f"Database commit failed for {source_name}")
+            return file_records
+            
+        except Exception:
+            if not commit:
+                raise
+            connector.rollback()
+            # Column changes are rolled back with the file, so re-read them
+            known_columns.clear()
+            known_columns.update(connector.get_column_types(table_name))
+            raise
+
+    @staticmethod
+    def _insert_seconds(connector) -> float:
+        """Seconds the connector has spent inserting and committing so far."""
+        stats = connector.get_insert_statistics()
+        return stats['seconds'] + stats['commit_seconds']
+
+    def _ensure_table_columns(self, connector, table_name: str,
+                              file_schema: SchemaAccumulator, known_columns: Dict[str, str]):
+        """
+        Create the target table or widen it (ALTER TABLE ADD COLUMN) so it holds
+        every column the schema accumulator has seen so far.
+        
+        With typed columns, an INTEGER or REAL column that now receives text is
+        changed to TEXT first; SQLite would otherwise store '007' as 7.
+        """
+        conflicts = file_schema.text_conflicts(known_columns)
+        if conflicts:
+            self.logger.info(f"Changing {len(conflicts)} columns to TEXT in table: {table_name}")
+            if not connector.widen_columns(table_name, conflicts):
+                raise RuntimeError(f"Could not change columns of '{table_name}' to TEXT")
+            known_columns.update((name, DEFAULT_TYPE) for name in conflicts)
+        
+        new_columns = file_schema.missing_from(known_columns)
+        if not new_columns:
+            return
+        
+        schema = file_schema.to_schema(new_columns)
+        
+        if not known_columns:
+            self.logger.info(f"Creating table: {table_name}")
+            created = connector.create_table(table_name, schema)
+        else:
+            self.logger.info(f"Adding {len(schema)} new columns to table: {table_name}")
+            created = connector.add_columns(table_name, schema)
+        
+        if not created:
+            raise RuntimeError(f"Could not prepare table '{table_name}' for new columns")
+        known_columns.update((column['name'], column['type']) for column in schema)
+
+    def _save_to_database(self, batches: Iterable[Union[List[Dict[str, Any]], RecordBatch]], 
+                         db_path: str, table_name: str,
+                         manifest: Optional[IngestionManifest] = None,
+                         ingested_files: Optional[List[tuple]] = None,
+                         schema: Optional[List[Dict[str, Any]]] = None,
+                         load_profile: Optional[str] = None) -> Dict[str, Any]:
         """
         Save processed data to SQLite database with automatic schema inference.
                 Referenced in: Implementation section (page 21) - Schema inference
+        
+        Batches (lists of records or RecordBatch objects, e.g. a SpillBuffer)
+        are all inserted in one transaction. The schema accumulated while the files were read is
+        used when given; otherwise it is inferred from the batches. In
+        incremental mode, rows of changed files are replaced and manifest
+        entries are written in the same transaction as the insert.
         """
         connector = None
         try:
             # Create SQLite connector using factory pattern
-            connector = self.connector_factory.create_sqlite_connector(db_path)
+            connector = self.connector_factory.create_sqlite_connector(db_path, load_profile)
             
-            # Automatic schema inference from data
-            # Innovation: Post-aggregation schema unification
-            schema = self._infer_simple_schema(data)
+            records_saved = 0
+            if batches:
+                # Automatic schema inference from data
+                # Innovation: Post-aggregation schema unification
+                if not schema:
+                    schema = self._infer_simple_schema(batches)
+                
+                # Create table if it doesn't exist, otherwise add any new columns
+                existing_columns = set(connector.get_table_columns(table_name))
+                if not existing_columns:
+                    self.logger.info(f"Creating table: {table_name}")
+                    connector.create_table(table_name, schema)
+                else:
+                    connector.add_columns(table_name, [column for column in schema
+                                                       if column['name'] not in existing_columns])
             
-            # Create table if it doesn't exist
-            if not connector.table_exists(table_name):
-                self.logger.info(f"Creating table: {table_name}")
-                connector.create_table(table_name, schema)
+            if manifest:
+                for (state, fingerprint), _ in ingested_files:
+                    if state == manifest.CHANGED:
+                        manifest.delete_rows(connector, fingerprint)
             
             # Insert data with batch optimization
-            records_saved = connector.insert_data(table_name, data)
+            for batch in batches:
+                inserted = connector.insert_data(table_name, batch, commit=False)
+                if inserted != len(batch):
+                    raise RuntimeError(f"Only {inserted} of {len(batch)} records in a batch inserted")
+                records_saved += inserted
+            
+            if manifest:
+                for (_, fingerprint), file_records in ingested_files:
+                    manifest.record(connector, fingerprint, file_records)
+            
+            connector.commit()
             
             return {
                 'success': True,
                 'records_saved': records_saved,
-                'table_name': table_name
+                'table_name': table_name,
+                'insert_seconds': self._insert_seconds(connector)
             }
             
         except Exception as e:
             error_msg = f"Database save failed: {str(e)}"
             self.logger.error(error_msg)
+            if connector:
+                connector.rollback()
             return {
                 'success': False,
                 'error': error_msg,
@@ -194,34 +698,31 @@ This class implements the main application logic for the Generic Data Ingestion
             if connector:
                 connector.disconnect()
 
-    def _infer_simple_schema(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _infer_simple_schema(self, batches: List[Union[List[Dict[str, Any]], RecordBatch]]
+                             ) -> List[Dict[str, Any]]:
         """
-        Infer a simple unified schema from heterogeneous data.
+        Infer a simple unified schema from batches of heterogeneous data.
         
         Design Decision: TEXT-based storage for complete data preservation
         Referenced in: Implementation section (page 21) - "All fields as TEXT"
         Innovation: Balances flexibility with structural integrity
         """
-        if not data:
+        if not batches:
             return []
         
-        # Sample-based schema inference for performance
-        sample_size = min(10, len(data))
-        all_columns = set()
-        
-        for record in data[:sample_size]:
-            if isinstance(record, dict):
-                all_columns.update(record.keys())
+        # Every record is observed so late-appearing fields are never dropped;
+        # repeated key shapes cost a single set lookup
+        accumulator = SchemaAccumulator()
+        for batch in batches:
+            if isinstance(batch, RecordBatch):
+                for column in batch.columns:
+                    accumulator.add_column(column)
+            else:
+                accumulator.observe_batch(batch)
         
         # Create unified schema - everything as TEXT for data preservation
         # This approach ensures zero data loss while maintaining simplicity
-        schema = []
-        for column_name in sorted(all_columns):
-            schema.append({
-                'name': column_name,
-                'type': 'TEXT',
-                'nullable': True
-            })
+        schema = accumulator.to_schema()
         
         self.logger.debug(f"Inferred schema with {len(schema)} columns: {[col['name'] for col in schema]}")
         return schema
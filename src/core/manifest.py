@@ -0,0 +1,177 @@
+"""
+Incremental Ingestion Manifest.
+Author: Moez Khan (SRN: 23097401)
+FYP Project - University of Hertfordshire
+
+Tracks which files have already been loaded into the output database so that
+repeated runs only process new or changed files. The manifest lives in the
+output database itself, keyed by target table and file path, and stores each
+file's size, modification time and content hash.
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from handlers.file_handler import FileHandler
+from scanners.file_scanner import FileScanner
+
+
+class IngestionManifest:
+    """
+    Manifest of ingested files for incremental re-ingestion.
+
+    Change detection is cheap first: a file whose size and mtime match the
+    manifest is unchanged without being read. Only when they differ is the
+    content hash computed, so touched-but-identical files are still skipped.
+    """
+
+    TABLE_NAME = '_ingestion_manifest'
+
+    # Column added to ingested rows so a changed file's old rows can be replaced
+    SOURCE_PATH_COLUMN = '_source_path'
+
+    # File states returned by classify()
+    NEW = 'new'
+    CHANGED = 'changed'
+    UNCHANGED = 'unchanged'
+
+    def __init__(self, scanner: FileScanner, table_name: str,
+                 file_handler: Optional[FileHandler] = None):
+        """
+        Initialize the manifest for one target table.
+
+        Args:
+            scanner: Scanner for the directory being ingested (provides file details)
+            table_name: Data table the manifest entries belong to
+            file_handler: File handler used for content hashing
+        """
+        self.scanner = scanner
+        self.root_directory = scanner.root_directory
+        self.table_name = table_name
+        self.file_handler = file_handler or FileHandler()
+        self.logger = logging.getLogger('data_ingestion.manifest')
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    def load(self, connector) -> bool:
+        """
+        Create the manifest table if needed and load this table's entries.
+
+        Args:
+            connector: Connected database connector for the output database
+
+        Returns:
+            bool: True if the manifest is ready, False otherwise
+        """
+        query = (
+            f'CREATE TABLE IF NOT EXISTS "{self.TABLE_NAME}" ('
+            'table_name TEXT NOT NULL, file_path TEXT NOT NULL, '
+            'size_bytes INTEGER, modified_timestamp REAL, content_hash TEXT, '
+            'records INTEGER, ingested_at TEXT, '
+            'PRIMARY KEY (table_name, file_path))'
+        )
+        if not connector.execute_query(query):
+            self.logger.error("Could not create ingestion manifest table")
+            return False
+
+        rows = connector.execute_query(
+            f'SELECT * FROM "{self.TABLE_NAME}" WHERE table_name = ?', (self.table_name,)
+        )
+        self.entries = {row['file_path']: row for row in rows}
+        self.logger.debug(f"Loaded {len(self.entries)} manifest entries for '{self.table_name}'")
+        return True
+
+    def relative_path(self, file_path: Path) -> str:
+        """Manifest key for a file: its POSIX path relative to the scanned root."""
+        return Path(file_path).resolve().relative_to(self.root_directory).as_posix()
+
+    def classify(self, file_path: Path) -> Tuple[str, Dict[str, Any]]:
+        """
+        Decide whether a file is new, changed or unchanged since the last run.
+
+        Args:
+            file_path: File to check
+
+        Returns:
+            Tuple of (state, fingerprint) where fingerprint holds the values to
+            record once the file has been ingested
+        """
+        details = self.scanner.get_file_details(file_path)
+        fingerprint = {
+            'file_path': self.relative_path(file_path),
+            'size_bytes': details.get('size_bytes'),
+            'modified_timestamp': details.get('modified_timestamp'),
+            'content_hash': None
+        }
+
+        entry = self.entries.get(fingerprint['file_path'])
+        if entry and 'error' not in details:
+            if (entry['size_bytes'] == fingerprint['size_bytes'] and
+                    entry['modified_timestamp'] == fingerprint['modified_timestamp']):
+                fingerprint['content_hash'] = entry['content_hash']
+                return self.UNCHANGED, fingerprint
+
+        fingerprint['content_hash'] = self.file_handler.get_file_hash(file_path)
+
+        if entry is None:
+            return self.NEW, fingerprint
+
+        if fingerprint['content_hash'] and fingerprint['content_hash'] == entry['content_hash']:
+            # Touched but identical: skip the file, remember the new mtime
+            return self.UNCHANGED, fingerprint
+
+        return self.CHANGED, fingerprint
+
+    def is_stale(self, fingerprint: Dict[str, Any]) -> bool:
+        """Check whether an unchanged file's manifest entry needs its mtime refreshed."""
+        entry = self.entries.get(fingerprint['file_path'])
+        return bool(entry) and entry['modified_timestamp'] != fingerprint['modified_timestamp']
+
+    def delete_rows(self, connector, fingerprint: Dict[str, Any]):
+        """
+        Delete the rows previously ingested from a file. Does not commit.
+
+        Rows loaded without incremental mode have no source path and are left alone.
+        """
+        if self.SOURCE_PATH_COLUMN not in connector.get_table_columns(self.table_name):
+            return
+
+        connector.connection.execute(
+            f'DELETE FROM "{self.table_name}" WHERE "{self.SOURCE_PATH_COLUMN}" = ?',
+            (fingerprint['file_path'],)
+        )
+
+    def record(self, connector, fingerprint: Dict[str, Any], records: int):
+        """
+        Insert or update a file's manifest entry. Does not commit.
+
+        Args:
+            connector: Connected database connector
+            fingerprint: Fingerprint returned by classify()
+            records: Number of records ingested from the file
+        """
+        entry = {
+            'table_name': self.table_name,
+            'file_path': fingerprint['file_path'],
+            'size_bytes': fingerprint['size_bytes'],
+            'modified_timestamp': fingerprint['modified_timestamp'],
+            'content_hash': fingerprint['content_hash'],
+            'records': records,
+            'ingested_at': datetime.now().isoformat()
+        }
+        columns = ', '.join(entry.keys())
+        placeholders = ', '.join('?' for _ in entry)
+        connector.connection.execute(
+            f'INSERT OR REPLACE INTO "{self.TABLE_NAME}" ({columns}) VALUES ({placeholders})',
+            tuple(entry.values())
+        )
+        self.entries[entry['file_path']] = entry
+
+    def refresh(self, connector, fingerprint: Dict[str, Any]):
+        """Update the stored mtime of an unchanged file. Does not commit."""
+        connector.connection.execute(
+            f'UPDATE "{self.TABLE_NAME}" SET modified_timestamp = ? '
+            'WHERE table_name = ? AND file_path = ?',
+            (fingerprint['modified_timestamp'], self.table_name, fingerprint['file_path'])
+        )
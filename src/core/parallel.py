@@ -0,0 +1,543 @@
+"""
+Parallel File Processing for Generic Data Ingestion Framework.
+
+Parsing and transforming files is CPU-bound, so with more than one job the
+per-file work runs in a process pool while the parent process keeps the single
+SQLite writer. Large JSON Lines files are split into byte ranges so one big
+file is parsed by several workers. Functions here are module-level so they can
+be pickled and run in worker processes.
+
+By default tasks are handed out in discovery order and results come back in
+that order. With a scheduler (core.scheduler) the plan decides the dispatch
+order (largest first, small files bundled) and results are taken as tasks
+finish, so a big file still being parsed does not hold back the rest.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from core.profiling import active_memory_tracer
+from core.timings import IngestionTimings, merge_file_timing, new_file_timing
+from processors.json_processor import JSONProcessor
+from processors.record_batch import RecordBatch
+from processors.schema_inference import SchemaAccumulator
+from readers.json_stream_reader import JSONArrayStreamReader
+from readers.json_lines_reader import (JSONLinesReader, format_line_errors, is_json_lines_file,
+                                       split_byte_ranges)
+
+
+# JSON Lines files larger than this are split across several worker tasks
+JSON_LINES_CHUNK_BYTES = 64 * 1024 * 1024
+
+# Range size when streaming: a worker result is held whole until the writer
+# takes it, so smaller ranges keep the parent's memory close to flat
+STREAMING_JSON_LINES_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+class FileProcessingError(Exception):
+    """Raised in the parent process for a file that failed inside a worker."""
+    pass
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """
+    Normalise a requested job count.
+
+    Args:
+        jobs: Requested number of worker processes; 0 or None means one per CPU core
+
+    Returns:
+        int: Number of worker processes to use (at least 1)
+    """
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+def process_file_batches(processor: JSONProcessor, file_path: Path,
+                         item_path: Optional[str] = None,
+                         batch_size: int = 1000,
+                         line_errors: Optional[List[str]] = None,
+                         start: int = 0,
+                         end: Optional[int] = None,
+                         schema: Optional[SchemaAccumulator] = None,
+                         columnar: bool = False,
+                         timing: Optional[Dict[str, Any]] = None,
+                         line_error_log: Optional[Dict[str, Any]] = None
+                         ) -> Iterator[Union[List[Dict[str, Any]], RecordBatch]]:
+    """
+    Read, process and tag one file's records batch by batch.
+
+    JSON Lines files (.jsonl/.ndjson) are read line by line; malformed lines are
+    skipped and reported through line_errors instead of failing the file. The
+    next batch is read before the current one is yielded, so the file's line
+    errors are reported by the time its last batch reaches the caller.
+
+    Args:
+        processor: JSON processor used to transform records
+        file_path: Path to the JSON file
+        item_path: Optional dotted key path to the record array (JSON files only)
+        batch_size: Number of raw records read per batch
+        line_errors: Optional list that receives '<file> line <n>: <message>' entries
+        start: Byte offset to start from (JSON Lines ranges only)
+        end: Byte offset to stop at (JSON Lines ranges only)
+        schema: Optional accumulator that observes every batch before it is yielded
+        columnar: Yield columnar RecordBatch objects instead of lists of dicts
+        timing: Optional per-file counters (core.timings.new_file_timing) that
+            receive bytes, records and decode/transform/schema seconds
+        line_error_log: Optional {'errors': [...], 'count': n} that receives the
+            unformatted line errors, so the ranges of a file can be merged
+
+    Yields:
+        Processed records (list of dicts or RecordBatch) with '_source_file'
+        lineage metadata
+    """
+    if is_json_lines_file(file_path):
+        reader = JSONLinesReader(file_path, start=start, end=end)
+    else:
+        reader = JSONArrayStreamReader(file_path, item_path=item_path)
+
+    clock = time.perf_counter
+    tracer = active_memory_tracer()
+    if timing is not None:
+        size = os.path.getsize(file_path)
+        timing['bytes'] += (min(end, size) if end is not None else size) - min(start, size)
+
+    def read_batch(raw_batches):
+        started = clock()
+        batch = next(raw_batches, None)
+        if timing is not None:
+            timing['decode'] += clock() - started
+        if tracer is not None:
+            tracer.mark('decode')
+        return batch
+
+    reported = False
+
+    def report_errors():
+        if not isinstance(reader, JSONLinesReader):
+            return
+        if line_errors is not None:
+            line_errors.extend(reader.format_errors())
+        if line_error_log is not None:
+            line_error_log['errors'].extend(reader.errors)
+            line_error_log['count'] += reader.error_count
+
+    try:
+        raw_batches = reader.iter_batches(batch_size)
+        batch = read_batch(raw_batches)
+        while batch is not None:
+            started = clock()
+            # Add source file metadata for data lineage
+            if columnar:
+                processed_data = processor.process_columnar(batch)
+                processed_data.set_column('_source_file', file_path.name)
+            else:
+                processed_data = processor.process_data(batch)
+                for record in processed_data:
+                    record['_source_file'] = file_path.name
+            transformed = clock()
+            if tracer is not None:
+                tracer.mark('transform')
+            if processed_data and schema is not None:
+                # Raw records still carry value types; keys are the same
+                schema.observe_batch(batch)
+                schema.add_column('_source_file')
+            if tracer is not None:
+                tracer.mark('schema')
+            if timing is not None:
+                timing['transform'] += transformed - started
+                timing['schema'] += clock() - transformed
+                timing['records'] += len(processed_data)
+
+            # Read ahead so the reader is exhausted before the last batch is handed on
+            batch = read_batch(raw_batches)
+            if batch is None:
+                reported = True
+                report_errors()
+            if processed_data:
+                yield processed_data
+                if tracer is not None:
+                    # The consumer's work on the batch (the insert when streaming)
+                    tracer.mark('insert')
+        if not reported:
+            reported = True
+            report_errors()
+    finally:
+        # Closed early: report what was read so far
+        if not reported:
+            report_errors()
+
+
+def process_file_task(file_path: str, item_path: Optional[str] = None,
+                      batch_size: int = 1000, start: int = 0,
+                      end: Optional[int] = None,
+                      typed_columns: bool = False,
+                      columnar: bool = False) -> Dict[str, Any]:
+    """
+    Worker entry point: fully process one file (or byte range) in a child process.
+
+    Errors are returned rather than raised so one bad file never breaks the pool.
+    Columnar batches pickle far smaller than lists of dicts on wide data. The
+    whole file (or byte range) is processed before anything is returned, so the
+    result holds all of its records; only JSON Lines files can be split to
+    bound that.
+
+    Returns:
+        Dict with 'batches' (processed record batches), 'schema' (SchemaAccumulator
+        for the records), 'line_errors' (bad JSON Lines entries as
+        {'errors': [{'line', 'message'}], 'count': n}), 'timing'
+        (per-file stage counters for the range) and 'error'
+    """
+    line_errors = {'errors': [], 'count': 0}
+    schema = SchemaAccumulator(infer_types=typed_columns)
+    timing = new_file_timing()
+    try:
+        processor = JSONProcessor(typed_values=typed_columns)
+        batches = list(process_file_batches(processor, Path(file_path), item_path,
+                                            batch_size, None, start, end, schema,
+                                            columnar, timing, line_errors))
+        return {'batches': batches, 'schema': schema, 'line_errors': line_errors,
+                'timing': timing, 'error': None}
+    except Exception as e:
+        return {'batches': [], 'schema': None, 'line_errors': line_errors,
+                'timing': timing, 'error': str(e)}
+
+
+def process_units_task(units: List[Tuple[str, int, Optional[int]]],
+                       item_path: Optional[str] = None,
+                       batch_size: int = 1000,
+                       typed_columns: bool = False,
+                       columnar: bool = False) -> List[Dict[str, Any]]:
+    """
+    Worker entry point for a scheduled task: process each (file path, start,
+    end) unit in turn, so a bundle of small files costs one round trip.
+
+    Returns:
+        One process_file_task result per unit, in unit order
+    """
+    return [process_file_task(file_path, item_path, batch_size, start, end, typed_columns, columnar)
+            for file_path, start, end in units]
+
+
+def build_tasks(file_paths: Iterable[Path],
+                chunk_bytes: Optional[int] = None) -> List[Tuple[Path, int, Optional[int]]]:
+    """
+    Build (file path, start, end) tasks, splitting large JSON Lines files by byte range.
+
+    Args:
+        file_paths: Files to process
+        chunk_bytes: Target byte range size for JSON Lines files
+            (defaults to JSON_LINES_CHUNK_BYTES)
+
+    Returns:
+        List of tasks; ranges of one file are consecutive and in file order
+    """
+    return list(iter_tasks(file_paths, chunk_bytes))
+
+
+def iter_tasks(file_paths: Iterable[Path],
+               chunk_bytes: Optional[int] = None) -> Iterator[Tuple[Path, int, Optional[int]]]:
+    """
+    Lazy build_tasks: files are only split when their tasks are requested, so
+    file_paths may be a discovery iterator that is still walking the tree.
+    """
+    chunk_bytes = chunk_bytes or JSON_LINES_CHUNK_BYTES
+    for file_path in file_paths:
+        if is_json_lines_file(file_path):
+            try:
+                ranges = split_byte_ranges(file_path, chunk_bytes)
+            except OSError:
+                # Let the worker report the unreadable file
+                ranges = [(0, None)]
+            for start, end in ranges:
+                yield file_path, start, end
+        else:
+            yield file_path, 0, None
+
+
+def iter_parallel_results(tasks: Iterable[Tuple[Path, int, Optional[int]]], jobs: int,
+                          item_path: Optional[str] = None,
+                          batch_size: int = 1000,
+                          typed_columns: bool = False,
+                          columnar: bool = False) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+    """
+    Process tasks in a process pool and yield results in input order.
+
+    At most two tasks per worker are in flight, so finished results waiting
+    behind a slow file never pile up without bound in the parent.
+
+    Args:
+        tasks: (file path, start, end) tasks from build_tasks / iter_tasks,
+            pulled only as workers free up
+        jobs: Number of worker processes
+        item_path: Optional dotted key path to the record array
+        batch_size: Number of raw records read per batch inside workers
+        typed_columns: Infer column types and keep values typed inside workers
+        columnar: Return RecordBatch objects from workers
+
+    Yields:
+        Tuple of (file path, task result dict)
+    """
+    max_in_flight = jobs * 2
+    pending = deque()
+    remaining = iter(tasks)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        def submit_next() -> bool:
+            task = next(remaining, None)
+            if task is None:
+                return False
+            file_path, start, end = task
+            try:
+                future = executor.submit(process_file_task, str(file_path), item_path,
+                                         batch_size, start, end, typed_columns, columnar)
+            except Exception as e:
+                # Pool is broken; record the failure so the file is still reported
+                future = Future()
+                future.set_exception(e)
+            pending.append((file_path, future))
+            return True
+
+        while len(pending) < max_in_flight and submit_next():
+            pass
+
+        while pending:
+            file_path, future = pending.popleft()
+            try:
+                result = future.result()
+            except Exception as e:
+                # Worker crashed (e.g. killed); report against this file and carry on
+                result = {'batches': [], 'schema': None, 'line_errors': None,
+                          'error': f"Worker failed: {str(e)}"}
+            submit_next()
+            yield file_path, result
+
+
+def iter_scheduled_results(tasks: Iterable[Any], jobs: int,
+                           item_path: Optional[str] = None,
+                           batch_size: int = 1000,
+                           typed_columns: bool = False,
+                           columnar: bool = False) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+    """
+    Process scheduled tasks in a process pool and yield results as tasks finish.
+
+    The byte ranges of a split file are still yielded consecutively and in
+    file order (so they can be regrouped per file): once its first range is
+    out, results of other tasks finishing meanwhile wait until the file's
+    last range has been yielded. As with iter_parallel_results, at most two
+    tasks per worker are submitted but not yet yielded, unless the pool would
+    otherwise sit idle.
+
+    Args:
+        tasks: core.scheduler.ScheduledTask objects in dispatch order
+        jobs: Number of worker processes
+        item_path: Optional dotted key path to the record array
+        batch_size: Number of raw records read per batch inside workers
+        typed_columns: Infer column types and keep values typed inside workers
+        columnar: Return RecordBatch objects from workers
+
+    Yields:
+        Tuple of (file path, task result dict), one per work unit
+    """
+    max_in_flight = jobs * 2
+    remaining = iter(tasks)
+    running = {}
+    # Finished whole files and bundles: (units, results) in completion order
+    finished = deque()
+    # Finished ranges of split files: (file path, part) -> (parts, result)
+    ranges = {}
+    # Split file being yielded: [file path, next part, parts]
+    current = None
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        def fill():
+            while len(running) + len(finished) + len(ranges) < max_in_flight or not running:
+                task = next(remaining, None)
+                if task is None:
+                    return
+                units = [(str(unit.file_path), unit.start, unit.end) for unit in task.units]
+                try:
+                    future = executor.submit(process_units_task, units, item_path, batch_size,
+                                             typed_columns, columnar)
+                except Exception as e:
+                    # Pool is broken; record the failure so the files are still reported
+                    future = Future()
+                    future.set_exception(e)
+                running[future] = task.units
+
+        fill()
+        while running or finished or ranges:
+            if current is not None:
+                key = (current[0], current[1])
+                if key in ranges:
+                    current[1] += 1
+                    file_path = current[0]
+                    if current[1] == current[2]:
+                        current = None
+                    yield file_path, ranges.pop(key)[1]
+                    fill()
+                    continue
+            elif finished:
+                units, results = finished.popleft()
+                for unit, result in zip(units, results):
+                    yield unit.file_path, result
+                fill()
+                continue
+            else:
+                first = next((key for key in ranges if key[1] == 0), None)
+                if first is not None:
+                    current = [first[0], 0, ranges[first][0]]
+                    continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                units = running.pop(future)
+                try:
+                    results = future.result()
+                except Exception as e:
+                    # Worker crashed (e.g. killed); report against these files and carry on
+                    results = [{'batches': [], 'schema': None, 'line_errors': None,
+                                'error': f"Worker failed: {str(e)}"} for _ in units]
+                if units[0].parts > 1:
+                    ranges[(units[0].file_path, units[0].part)] = (units[0].parts, results[0])
+                else:
+                    finished.append((units, results))
+            fill()
+
+
+def iter_file_batches(file_paths: Iterable[Path], processor: JSONProcessor,
+                      item_path: Optional[str] = None,
+                      batch_size: int = 1000,
+                      line_errors: Optional[List[str]] = None,
+                      typed_columns: bool = False,
+                      columnar: bool = False,
+                      timings: Optional[IngestionTimings] = None
+                      ) -> Iterator[Tuple[Path, Iterator[List[Dict[str, Any]]], SchemaAccumulator]]:
+    """
+    Process files one after another in this process.
+
+    With typed_columns the processor should be created with typed_values=True
+    so nulls reach the database as NULL rather than empty strings. With
+    timings, each file's decode/transform/schema times are recorded there.
+
+    Yields:
+        Tuple of (file path, batch stream, file schema); the schema has observed
+        every batch by the time that batch is yielded
+    """
+    for file_path in file_paths:
+        schema = SchemaAccumulator(infer_types=typed_columns)
+        timing = timings.for_file(file_path) if timings is not None else None
+        batches = process_file_batches(processor, file_path, item_path, batch_size,
+                                       line_errors, schema=schema, columnar=columnar,
+                                       timing=timing)
+        yield file_path, batches, schema
+
+
+def iter_parallel_file_batches(file_paths: Iterable[Path], jobs: int,
+                               item_path: Optional[str] = None,
+                               batch_size: int = 1000,
+                               line_errors: Optional[List[str]] = None,
+                               typed_columns: bool = False,
+                               columnar: bool = False,
+                               timings: Optional[IngestionTimings] = None,
+                               scheduler=None,
+                               file_sizes: Optional[Dict[Path, int]] = None,
+                               chunk_bytes: Optional[int] = None
+                               ) -> Iterator[Tuple[Path, Iterator[List[Dict[str, Any]]], SchemaAccumulator]]:
+    """
+    Process files in a process pool and regroup byte-range results per file.
+
+    Yields the same (file path, batch stream, file schema) triples as
+    iter_file_batches, so the caller cannot tell whether a file was parsed by
+    one worker or several. Worker schemas and timings are merged rather than
+    recomputed.
+
+    Without a scheduler files are dispatched and yielded in input order. With
+    a core.scheduler.SizeAwareScheduler the whole file list is planned first
+    (using file_sizes where known) and files are yielded as they finish.
+
+    Up to two results per worker (each a whole file or JSON Lines byte range
+    of processed records) wait in this process for the caller, so memory
+    grows with jobs and the size of the largest task. chunk_bytes sets the
+    JSON Lines range size when no scheduler is given (the scheduler has its own).
+    """
+    if scheduler is not None:
+        results = iter_scheduled_results(scheduler.plan(file_paths, file_sizes), jobs, item_path,
+                                         batch_size, typed_columns, columnar)
+    else:
+        results = iter_parallel_results(iter_tasks(file_paths, chunk_bytes), jobs, item_path,
+                                        batch_size, typed_columns, columnar)
+
+    for file_path, group in groupby(results, key=lambda item: item[0]):
+        schema = SchemaAccumulator(infer_types=typed_columns)
+        timing = timings.for_file(file_path) if timings is not None else None
+        yield file_path, result_batches((result for _, result in group), line_errors, schema,
+                                        timing, file_path.name), schema
+
+
+def result_batches(results: Iterator[Dict[str, Any]],
+                   line_errors: Optional[List[str]] = None,
+                   schema: Optional[SchemaAccumulator] = None,
+                   timing: Optional[Dict[str, Any]] = None,
+                   file_name: str = '') -> Iterator[List[Dict[str, Any]]]:
+    """
+    Turn worker results for one file back into the batch stream used by the serial path.
+
+    The line errors of all ranges are merged and reported once, capped at
+    JSONLinesReader.MAX_REPORTED_ERRORS for the whole file, before the file's
+    last batch is yielded (or when the stream fails or is closed).
+
+    Raises:
+        FileProcessingError: If a worker reported an error for the file
+    """
+    errors = []
+    error_count = 0
+    reported = False
+
+    def report_errors():
+        if line_errors is not None:
+            line_errors.extend(format_line_errors(file_name, errors, error_count))
+
+    def collect_errors(result):
+        nonlocal error_count
+        log = result['line_errors']
+        if log:
+            room = JSONLinesReader.MAX_REPORTED_ERRORS - len(errors)
+            errors.extend(log['errors'][:max(room, 0)])
+            error_count += log['count']
+
+    results = iter(results)
+    try:
+        result = next(results, None)
+        while result is not None:
+            collect_errors(result)
+            if timing is not None:
+                merge_file_timing(timing, result.get('timing'))
+            if result['error']:
+                raise FileProcessingError(result['error'])
+            if schema is not None and result['schema'] is not None:
+                schema.merge(result['schema'])
+            batches = result['batches']
+            for batch in batches[:-1]:
+                yield batch
+            # Look ahead so the file's errors are complete before its last batch
+            result = next(results, None)
+            if result is None:
+                reported = True
+                report_errors()
+            if batches:
+                yield batches[-1]
+    finally:
+        if not reported:
+            # Ranges not reached (failed or closed early) still carry their errors
+            try:
+                for result in results:
+                    collect_errors(result)
+            finally:
+                report_errors()
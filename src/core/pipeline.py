@@ -0,0 +1,280 @@
+"""
+Pipelined Ingestion for Generic Data Ingestion Framework.
+
+Runs the read/parse stage in a background thread that hands record batches to
+the writer through a bounded queue. Disk reads, JSON parsing (in this thread
+or in worker processes) and SQLite writes then overlap, so wall time follows
+the slowest stage instead of the sum of all stages. The calling thread stays
+the single SQLite writer, so connections and transactions never cross threads.
+"""
+
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from processors.schema_inference import SchemaAccumulator
+
+
+# Batches buffered between the read/parse stage and the writer
+DEFAULT_QUEUE_SIZE = 8
+
+# How often blocked stages re-check for shutdown (seconds)
+_POLL_INTERVAL = 0.1
+
+# Queue message kinds
+_BATCH = 'batch'
+_FILE_END = 'file_end'
+_FILE_ERROR = 'file_error'
+_FAILED = 'failed'
+_DONE = 'done'
+
+
+class PipelineStopped(Exception):
+    """Raised inside the read/parse stage when the writer shuts the pipeline down."""
+    pass
+
+
+class BatchPipeline:
+    """
+    Bounded producer/consumer pipeline between file parsing and the database writer.
+
+    Usage:
+        pipeline = BatchPipeline()
+        file_batches = iter_file_batches(files, processor, line_errors=pipeline.source_errors)
+        for file_path, batches, file_schema in pipeline.run(file_batches, line_errors):
+            for batch in batches:
+                connector.insert_data(table_name, batch)
+        print(pipeline.metrics())
+
+    The source yields (file path, batch stream, schema accumulator) triples as
+    produced by core.parallel. run() yields the same triples on the calling
+    thread; the schema accumulator it hands out is updated as batches are
+    taken from the queue and receives the file's complete schema once the
+    file has been read. A full queue blocks the read/parse stage
+    (backpressure); leaving the loop early, or an error, stops it cleanly.
+    """
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        Initialize the pipeline.
+
+        Args:
+            queue_size: Maximum number of batches waiting for the writer
+        """
+        self.queue_size = max(1, queue_size)
+        self.logger = logging.getLogger('data_ingestion.pipeline')
+
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+        # Line errors reported by the source; only touched by the background thread
+        self.source_errors: List[str] = []
+
+        self._batches = 0
+        self._depth_total = 0
+        self._max_depth = 0
+        self._producer_wait = 0.0
+        self._consumer_wait = 0.0
+
+    def run(self, file_batches: Iterator[Tuple[Path, Iterator[List[Dict[str, Any]]], SchemaAccumulator]],
+            line_errors: Optional[List[str]] = None
+            ) -> Iterator[Tuple[Path, Iterator[List[Dict[str, Any]]], SchemaAccumulator]]:
+        """
+        Read and parse files in a background thread and yield them here.
+
+        Args:
+            file_batches: Source of (file path, batch stream, schema) triples; it is
+                consumed entirely by the background thread
+            line_errors: Optional list that receives each file's line errors once
+                the file has been read; the source must report into
+                self.source_errors instead, which belongs to the background thread
+
+        Yields:
+            Tuple of (file path, batch stream, file schema) for each file, in order
+        """
+        self._queue = queue.Queue(maxsize=self.queue_size)
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._produce, args=(file_batches,),
+                                        name='ingestion-reader', daemon=True)
+        self._thread.start()
+
+        try:
+            item = self._get()
+            while item[0] != _DONE:
+                if item[0] == _FAILED:
+                    raise item[2]
+
+                file_path, source_schema = item[1], item[3]
+                file_schema = SchemaAccumulator(infer_types=source_schema.infer_types)
+                stream = self._file_stream(item, file_schema, line_errors)
+                yield file_path, stream, file_schema
+
+                # Discard whatever the caller did not consume of this file
+                try:
+                    for _ in stream:
+                        pass
+                except Exception:
+                    pass
+                item = self._get()
+        finally:
+            self._stop()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Queue-depth and wait metrics for the stages on either side of the queue.
+
+        A stage that spends long waiting is faster than the one it waits on:
+        read/parse waiting on a full queue means the writer is the bottleneck.
+
+        Returns:
+            Dict of queue size, batches passed, max/mean queue depth and
+            per-stage wait times in seconds
+        """
+        return {
+            'queue_size': self.queue_size,
+            'batches': self._batches,
+            'max_queue_depth': self._max_depth,
+            'mean_queue_depth': round(self._depth_total / self._batches, 2) if self._batches else 0,
+            'stage_wait_seconds': {
+                'read_parse': round(self._producer_wait, 3),
+                'write': round(self._consumer_wait, 3),
+            },
+            'bottleneck': 'write' if self._producer_wait > self._consumer_wait else 'read_parse',
+        }
+
+    def _file_stream(self, item: tuple, file_schema: SchemaAccumulator,
+                     line_errors: Optional[List[str]]) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield one file's batches from the queue, keeping its schema current.
+
+        Closing the stream early skips the rest of the file's batches, so its
+        line errors are still reported and the next file starts cleanly.
+        """
+        try:
+            while True:
+                kind = item[0]
+                if kind == _BATCH:
+                    for name, column_type in item[4]:
+                        file_schema.add_column(name, column_type)
+                    yield item[2]
+                elif kind == _FILE_END:
+                    # The reader is done with this file, so its schema can be shared
+                    file_schema.merge(item[3])
+                    if line_errors is not None:
+                        line_errors.extend(item[4])
+                    return
+                elif kind == _FILE_ERROR:
+                    if line_errors is not None:
+                        line_errors.extend(item[4])
+                    raise item[2]
+                else:
+                    raise RuntimeError(f"Unexpected pipeline message: {kind}")
+                item = self._get()
+        except GeneratorExit:
+            self._skip_file(line_errors)
+            raise
+
+    def _skip_file(self, line_errors: Optional[List[str]]):
+        """Discard the rest of a file whose stream was closed, keeping its line errors."""
+        try:
+            item = self._get()
+            while item[0] == _BATCH:
+                item = self._get()
+        except RuntimeError:
+            # The read/parse stage is already gone
+            return
+        if item[0] in (_FILE_END, _FILE_ERROR):
+            if line_errors is not None:
+                line_errors.extend(item[4])
+        else:
+            # Run-level message: leave it for run()
+            self._queue.put(item)
+
+    def _produce(self, file_batches):
+        """Background thread: read and parse every file into the queue."""
+        source_errors = self.source_errors
+        try:
+            for file_path, batches, file_schema in file_batches:
+                sent_types = {}
+                try:
+                    for batch in batches:
+                        # New columns, and with type inference columns whose type changed
+                        changed = [(name, column_type)
+                                   for name, column_type in file_schema.columns.items()
+                                   if name not in sent_types or sent_types[name] != column_type]
+                        sent_types.update(changed)
+                        self._put((_BATCH, file_path, batch, file_schema, changed))
+                except PipelineStopped:
+                    raise
+                except Exception as e:
+                    self._put((_FILE_ERROR, file_path, e, file_schema, self._take(source_errors)))
+                    continue
+                self._put((_FILE_END, file_path, None, file_schema, self._take(source_errors)))
+            self._put((_DONE,))
+        except PipelineStopped:
+            self.logger.debug("Read/parse stage stopped by writer")
+        except Exception as e:
+            # The source itself failed (not a single file); stop the run
+            try:
+                self._put((_FAILED, None, e, None))
+            except PipelineStopped:
+                pass
+        finally:
+            close = getattr(file_batches, 'close', None)
+            if close:
+                close()
+
+    def _put(self, item: tuple):
+        """Queue an item, blocking while the queue is full (backpressure)."""
+        if item[0] == _BATCH:
+            depth = self._queue.qsize()
+            self._batches += 1
+            self._depth_total += depth
+            self._max_depth = max(self._max_depth, depth)
+
+        start = time.perf_counter()
+        while True:
+            if self._stopping.is_set():
+                raise PipelineStopped()
+            try:
+                self._queue.put(item, timeout=_POLL_INTERVAL)
+                break
+            except queue.Full:
+                continue
+        self._producer_wait += time.perf_counter() - start
+
+    def _get(self) -> tuple:
+        """Take the next item, waiting for the read/parse stage if the queue is empty."""
+        start = time.perf_counter()
+        try:
+            while True:
+                try:
+                    return self._queue.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    if not self._thread.is_alive() and self._queue.empty():
+                        raise RuntimeError("Read/parse stage stopped unexpectedly")
+        finally:
+            self._consumer_wait += time.perf_counter() - start
+
+    def _stop(self):
+        """Stop the background thread and wait for it to finish."""
+        self._stopping.set()
+        while self._thread.is_alive():
+            # Unblock a pending put and let the thread notice the stop flag
+            try:
+                while True:
+                    self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._thread.join(_POLL_INTERVAL)
+
+    @staticmethod
+    def _take(errors: List[str]) -> List[str]:
+        """Move the collected line errors out of a list."""
+        taken = list(errors)
+        del errors[:len(taken)]
+        return taken
@@ -0,0 +1,273 @@
+"""
+Run Profiling for Generic Data Ingestion Framework.
+
+Optional CPU and memory profiling of a process_directory run, switched on
+with --profile:
+
+    cpu     cProfile over the whole run; the raw profile is written to a file
+            (open it with pstats, snakeviz, ...) and the top functions by
+            cumulative time are returned.
+    memory  tracemalloc over the whole run; reports the peak traced memory of
+            each stage (scan, decode, transform, schema, insert) and the
+            source lines holding the most memory at the run's high point.
+
+When profiling is off no profiler object exists and stage hooks are a single
+`is not None` check per batch.
+
+Both profilers observe the calling thread's work: with --pipeline the reader
+thread is not in the CPU profile (and its stages interleave with the writer's
+in the memory profile), and worker processes (--jobs) are not covered.
+"""
+
+import cProfile
+import logging
+import pstats
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from core.timings import STAGES
+
+
+PROFILE_MODES = ('cpu', 'memory')
+
+# Number of functions / allocation sites reported
+DEFAULT_TOP = 20
+
+# Stack depth recorded per allocation (1 keeps tracemalloc overhead low)
+_TRACE_FRAMES = 1
+
+# A new allocation snapshot is taken when traced memory grows by this factor
+_SNAPSHOT_GROWTH = 1.1
+
+_active_memory_tracer: Optional['MemoryProfiler'] = None
+
+
+def _reset_peak():
+    """Restart peak tracking (Python 3.9+; on 3.8 peaks span the whole run so far)."""
+    reset_peak = getattr(tracemalloc, 'reset_peak', None)
+    if reset_peak is not None:
+        reset_peak()
+
+
+def active_memory_tracer() -> Optional['MemoryProfiler']:
+    """The running memory profiler, or None (the common case) when memory profiling is off."""
+    return _active_memory_tracer
+
+
+def create_profiler(mode: Optional[str], output_path: Optional[Union[str, Path]] = None,
+                    top: int = DEFAULT_TOP) -> Optional[Union['CPUProfiler', 'MemoryProfiler']]:
+    """
+    Create a profiler for a run.
+
+    Args:
+        mode: 'cpu', 'memory' or None (no profiling)
+        output_path: Where the CPU profile is written
+        top: Number of functions / allocation sites to report
+
+    Returns:
+        Profiler with start(), stop() and report(), or None when mode is None
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if not mode:
+        return None
+    if mode == 'cpu':
+        return CPUProfiler(output_path or 'ingestion.prof', top)
+    if mode == 'memory':
+        return MemoryProfiler(top)
+    raise ValueError(f"Unknown profile mode '{mode}'. Use one of: {', '.join(PROFILE_MODES)}")
+
+
+class CPUProfiler:
+    """
+    cProfile wrapper for one run.
+
+    Usage:
+        profiler = CPUProfiler('run.prof')
+        profiler.start()
+        ...
+        profiler.stop()
+        profiler.report()['top_functions']
+    """
+
+    mode = 'cpu'
+
+    def __init__(self, output_path: Union[str, Path], top: int = DEFAULT_TOP):
+        """
+        Initialize the profiler.
+
+        Args:
+            output_path: File receiving the raw cProfile data
+            top: Number of functions reported by cumulative time
+        """
+        self.output_path = Path(output_path)
+        self.top = top
+        self.logger = logging.getLogger('data_ingestion.profiling')
+        self._profile = cProfile.Profile()
+        self._running = False
+
+    def start(self):
+        """Start collecting."""
+        self._profile.enable()
+        self._running = True
+
+    def stop(self):
+        """Stop collecting and write the profile file (safe to call twice)."""
+        if not self._running:
+            return
+        self._profile.disable()
+        self._running = False
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(str(self.output_path))
+        self.logger.info(f"CPU profile written to {self.output_path}")
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Summary of the profile.
+
+        Returns:
+            Dict with 'mode', 'output' (profile file) and 'top_functions': one
+            entry per function with call count, own and cumulative seconds
+        """
+        stats = pstats.Stats(self._profile)
+        entries = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+
+        top_functions = []
+        for (filename, line, name), (_, calls, total, cumulative, _) in entries[:self.top]:
+            location = f"{filename}:{line}" if line else filename
+            top_functions.append({
+                'function': f"{name} ({location})",
+                'calls': calls,
+                'own_seconds': round(total, 6),
+                'cumulative_seconds': round(cumulative, 6),
+            })
+
+        return {'mode': self.mode, 'output': str(self.output_path), 'top_functions': top_functions}
+
+
+class MemoryProfiler:
+    """
+    tracemalloc-based peak memory per stage.
+
+    Stage code calls mark(stage) when a stage segment ends; the peak traced
+    memory since the previous mark is attributed to that stage, both as an
+    absolute peak and as the increase over the memory live when the segment
+    began (what the stage itself allocated at most).
+
+    Usage:
+        profiler = MemoryProfiler()
+        profiler.start()
+        profiler.mark(None)      # discard setup
+        ...decode a batch...
+        profiler.mark('decode')
+        profiler.stop()
+        profiler.report()['stages']['decode']['peak_bytes']
+    """
+
+    mode = 'memory'
+
+    def __init__(self, top: int = DEFAULT_TOP):
+        """
+        Initialize the profiler.
+
+        Args:
+            top: Number of allocation sites reported
+        """
+        self.top = top
+        self.logger = logging.getLogger('data_ingestion.profiling')
+        self.stage_peaks: Dict[str, int] = {}
+        self.stage_increases: Dict[str, int] = {}
+        self.peak_bytes = 0
+        self._segment_start = 0
+        self._started_tracing = False
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._snapshot_size = 0
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        """Start tracing allocations and make this the active tracer."""
+        global _active_memory_tracer
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(_TRACE_FRAMES)
+            self._started_tracing = True
+        _reset_peak()
+        self._segment_start = tracemalloc.get_traced_memory()[0]
+        self._thread = threading.get_ident()
+        self._running = True
+        _active_memory_tracer = self
+
+    def mark(self, stage: Optional[str]):
+        """
+        Close the current stage segment.
+
+        Args:
+            stage: Stage the segment belongs to, or None to discard it
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        _reset_peak()
+        if peak > self.peak_bytes:
+            self.peak_bytes = peak
+        if stage is not None:
+            if peak > self.stage_peaks.get(stage, 0):
+                self.stage_peaks[stage] = peak
+            increase = peak - self._segment_start
+            if increase > self.stage_increases.get(stage, 0):
+                self.stage_increases[stage] = increase
+        self._segment_start = current
+
+        # Keep a snapshot of the largest live memory seen, for allocation sites
+        if current > self._snapshot_size * _SNAPSHOT_GROWTH and \
+                threading.get_ident() == self._thread:
+            self._snapshot = tracemalloc.take_snapshot()
+            self._snapshot_size = current
+
+    def stop(self):
+        """Stop tracing (safe to call twice)."""
+        global _active_memory_tracer
+        if not self._running:
+            return
+        self.mark(None)
+        if self._snapshot is None:
+            self._snapshot = tracemalloc.take_snapshot()
+        if _active_memory_tracer is self:
+            _active_memory_tracer = None
+        if self._started_tracing:
+            tracemalloc.stop()
+        self._running = False
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Summary of the memory profile.
+
+        Returns:
+            Dict with 'mode', overall 'peak_bytes', 'stages' (stage -> peak
+            bytes and largest increase within the stage) and 'top_allocations' (source lines holding the most memory
+            when live memory was highest)
+        """
+        top_allocations: List[Dict[str, Any]] = []
+        if self._snapshot is not None:
+            snapshot = self._snapshot.filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            ))
+            for stat in snapshot.statistics('lineno')[:self.top]:
+                frame = stat.traceback[0]
+                top_allocations.append({
+                    'location': f"{frame.filename}:{frame.lineno}",
+                    'size_bytes': stat.size,
+                    'blocks': stat.count,
+                })
+
+        return {
+            'mode': self.mode,
+            'peak_bytes': self.peak_bytes,
+            'live_bytes_at_snapshot': self._snapshot_size,
+            'stages': {stage: {'peak_bytes': self.stage_peaks[stage],
+                               'peak_increase_bytes': self.stage_increases.get(stage, 0)}
+                       for stage in STAGES if stage in self.stage_peaks},
+            'top_allocations': top_allocations,
+        }
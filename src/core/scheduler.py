@@ -0,0 +1,221 @@
+"""
+Size-Aware Task Scheduling for Generic Data Ingestion Framework.
+
+With several worker processes, the order files are handed out decides how
+long the run takes: a 3 GB file dispatched last leaves every other worker
+idle while it is parsed. SizeAwareScheduler plans the worker tasks from file
+sizes (those FileScanner read during discovery):
+
+    - JSON Lines files above chunk_bytes are split into byte ranges
+    - files below tiny_bytes are bundled, up to bundle_bytes / bundle_files
+      per task, so thousands of 200-byte files do not each pay a round trip
+      to a worker
+    - tasks are dispatched largest first (a split file counts with its whole
+      size and its ranges stay consecutive), so the long tail is small files
+
+What the scheduler decided is reported by statistics() and returned with the
+run result under 'schedule'.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from core.parallel import JSON_LINES_CHUNK_BYTES
+from readers.json_lines_reader import is_json_lines_file, split_byte_ranges
+
+
+# Dispatch strategies for parallel runs: discovery order, or planned by size
+SCHEDULES = ('fifo', 'size')
+
+# Files smaller than this are bundled with other small files
+TINY_FILE_BYTES = 256 * 1024
+
+# Bundles are closed once they reach this many bytes or files
+BUNDLE_BYTES = 4 * 1024 * 1024
+BUNDLE_FILES = 256
+
+# Largest files listed by name in the statistics
+_REPORTED_LARGEST = 5
+
+
+class WorkUnit(NamedTuple):
+    """One file, or one byte range of a split JSON Lines file."""
+    file_path: Path
+    start: int
+    end: Optional[int]
+    part: int
+    parts: int
+
+
+class ScheduledTask(NamedTuple):
+    """Work sent to a worker in one call: a range, a whole file or a bundle of files."""
+    kind: str
+    units: List[WorkUnit]
+    size: int
+
+
+class SizeAwareScheduler:
+    """
+    Plans worker tasks from file sizes: largest first, tiny files bundled,
+    large JSON Lines files split.
+
+    Usage:
+        scheduler = SizeAwareScheduler()
+        tasks = scheduler.plan(json_files, scanner.file_sizes)
+        for task in tasks:           # ScheduledTask(kind, units, size)
+            ...
+        scheduler.statistics()
+    """
+
+    RANGE = 'range'
+    FILE = 'file'
+    BUNDLE = 'bundle'
+
+    def __init__(self, chunk_bytes: Optional[int] = None,
+                 tiny_bytes: int = TINY_FILE_BYTES,
+                 bundle_bytes: int = BUNDLE_BYTES,
+                 bundle_files: int = BUNDLE_FILES):
+        """
+        Initialize the scheduler.
+
+        Args:
+            chunk_bytes: Target byte range size for JSON Lines files
+                (defaults to JSON_LINES_CHUNK_BYTES)
+            tiny_bytes: Files below this size are bundled; 0 disables bundling
+            bundle_bytes: Maximum bytes of files in one bundle
+            bundle_files: Maximum number of files in one bundle
+        """
+        self.chunk_bytes = max(1, chunk_bytes or JSON_LINES_CHUNK_BYTES)
+        self.tiny_bytes = tiny_bytes
+        self.bundle_bytes = max(1, bundle_bytes)
+        self.bundle_files = max(1, bundle_files)
+        self.logger = logging.getLogger('data_ingestion.scheduler')
+        self._stats: Dict[str, Any] = self._empty_stats()
+
+    def plan(self, file_paths: Iterable[Path],
+             sizes: Optional[Dict[Path, int]] = None) -> List[ScheduledTask]:
+        """
+        Turn a file list into worker tasks in dispatch order.
+
+        Args:
+            file_paths: Files to process
+            sizes: Known file sizes in bytes (e.g. FileScanner.file_sizes);
+                files missing from it are stat'ed
+
+        Returns:
+            Tasks, largest first; the ranges of a split file are consecutive
+            and in file order
+        """
+        sizes = sizes or {}
+        sized = []
+        for file_path in file_paths:
+            size = sizes.get(file_path)
+            if size is None:
+                try:
+                    size = os.path.getsize(file_path)
+                except OSError:
+                    # Let the worker report the unreadable file
+                    size = 0
+            sized.append((size, file_path))
+
+        # Largest first; ties by path so the plan does not depend on listing order
+        sized.sort(key=lambda item: (-item[0], str(item[1])))
+
+        groups: List[List[ScheduledTask]] = []
+        tiny = []
+        for size, file_path in sized:
+            if size < self.tiny_bytes:
+                tiny.append((size, file_path))
+            elif size > self.chunk_bytes and is_json_lines_file(file_path):
+                groups.append(self._split(file_path, size))
+            else:
+                groups.append([ScheduledTask(self.FILE, [WorkUnit(file_path, 0, None, 0, 1)], size)])
+        groups.extend([bundle] for bundle in self._bundle(tiny))
+
+        # Stable sort: bundles go after single files of the same size
+        groups.sort(key=lambda group: -sum(task.size for task in group))
+        tasks = [task for group in groups for task in group]
+
+        self._record(sized, tasks)
+        return tasks
+
+    def statistics(self) -> Dict[str, Any]:
+        """Decisions of the last plan() call, for the run result."""
+        return dict(self._stats)
+
+    def _split(self, file_path: Path, size: int) -> List[ScheduledTask]:
+        """One task per byte range of a large JSON Lines file."""
+        try:
+            ranges = split_byte_ranges(file_path, self.chunk_bytes)
+        except OSError:
+            ranges = [(0, None)]
+        tasks = []
+        for part, (start, end) in enumerate(ranges):
+            range_size = (end if end is not None else size) - start
+            unit = WorkUnit(file_path, start, end, part, len(ranges))
+            tasks.append(ScheduledTask(self.RANGE if len(ranges) > 1 else self.FILE,
+                                       [unit], range_size))
+        return tasks
+
+    def _bundle(self, tiny: List[tuple]) -> List[ScheduledTask]:
+        """Pack small files (largest first) into bundles."""
+        bundles = []
+        units: List[WorkUnit] = []
+        bundle_size = 0
+        for size, file_path in tiny:
+            if units and (bundle_size + size > self.bundle_bytes or len(units) >= self.bundle_files):
+                bundles.append(self._bundle_task(units, bundle_size))
+                units, bundle_size = [], 0
+            units.append(WorkUnit(file_path, 0, None, 0, 1))
+            bundle_size += size
+        if units:
+            bundles.append(self._bundle_task(units, bundle_size))
+        return bundles
+
+    def _bundle_task(self, units: List[WorkUnit], size: int) -> ScheduledTask:
+        """A bundle of several files; a lone small file stays a plain file task."""
+        return ScheduledTask(self.BUNDLE if len(units) > 1 else self.FILE, units, size)
+
+    def _record(self, sized: List[tuple], tasks: List[ScheduledTask]):
+        """Summarise a plan."""
+        stats = self._empty_stats()
+        stats['files'] = len(sized)
+        stats['bytes'] = sum(size for size, _ in sized)
+        stats['tasks'] = len(tasks)
+        split_files = set()
+        for task in tasks:
+            if task.kind == self.BUNDLE:
+                stats['bundles'] += 1
+                stats['bundled_files'] += len(task.units)
+            elif task.kind == self.RANGE:
+                stats['ranges'] += 1
+                split_files.add(task.units[0].file_path)
+        stats['split_files'] = len(split_files)
+        stats['largest_task_bytes'] = max((task.size for task in tasks), default=0)
+        stats['largest_files'] = [{'file': file_path.name, 'bytes': size}
+                                  for size, file_path in sized[:_REPORTED_LARGEST]]
+        self._stats = stats
+
+        self.logger.info(f"Scheduled {stats['files']} files as {stats['tasks']} tasks, largest first "
+                         f"({stats['bundles']} bundles of {stats['bundled_files']} small files, "
+                         f"{stats['split_files']} files split into {stats['ranges']} ranges)")
+
+    def _empty_stats(self) -> Dict[str, Any]:
+        """Statistics before anything is planned."""
+        return {
+            'strategy': 'size',
+            'files': 0,
+            'bytes': 0,
+            'tasks': 0,
+            'bundles': 0,
+            'bundled_files': 0,
+            'split_files': 0,
+            'ranges': 0,
+            'largest_task_bytes': 0,
+            'largest_files': [],
+            'tiny_file_bytes': self.tiny_bytes,
+            'bundle_bytes': self.bundle_bytes,
+            'chunk_bytes': self.chunk_bytes,
+        }
@@ -0,0 +1,213 @@
+"""
+Spill-to-Disk Batch Buffer for Generic Data Ingestion Framework.
+
+Batch (non-streaming) mode keeps every processed batch until the final save
+so the table can be created from the unified schema of the whole run. A
+SpillBuffer holds those batches in memory up to a byte budget; beyond it new
+batches are pickled into a scratch SQLite file and read back one at a time
+when the buffer is iterated, so one oversized drop cannot exhaust memory.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from processors.record_batch import RecordBatch
+
+
+Batch = Union[List[Dict[str, Any]], RecordBatch]
+
+# Records sampled per batch when estimating its in-memory size
+_SAMPLE_RECORDS = 8
+
+# Spilled batches read back per query while iterating
+_READ_CHUNK = 16
+
+
+def estimate_batch_bytes(batch: Batch) -> int:
+    """
+    Rough in-memory size of a batch, from a small sample of its records.
+
+    Counts containers, keys and values shallowly (nested values are already
+    JSON strings after processing), which is close enough to enforce a budget
+    without walking every record.
+    """
+    count = len(batch)
+    if not count:
+        return sys.getsizeof(batch)
+
+    if isinstance(batch, RecordBatch):
+        total = sys.getsizeof(batch.arrays)
+        for array in batch.arrays:
+            sample = array[:_SAMPLE_RECORDS]
+            average = sum(sys.getsizeof(value) for value in sample) / len(sample)
+            total += sys.getsizeof(array) + int(average * count)
+        return total
+
+    sample = batch[:_SAMPLE_RECORDS]
+    per_record = sum(sys.getsizeof(record) +
+                     sum(sys.getsizeof(value) for value in record.values())
+                     for record in sample) / len(sample)
+    # Keys are shared between records (interned by the JSON decoder)
+    return sys.getsizeof(batch) + int(per_record * count)
+
+
+class SpillBuffer:
+    """
+    Ordered batch store that moves to a scratch SQLite file above a memory budget.
+
+    Usage:
+        buffer = SpillBuffer(budget_bytes=512 * 1024 * 1024)
+        checkpoint = buffer.checkpoint()
+        try:
+            buffer.extend(file_batches)
+        except Exception:
+            buffer.rollback(checkpoint)   # drop a partly read file
+        for batch in buffer:              # memory first, then disk, in order
+            connector.insert_data(table, batch)
+        buffer.close()
+
+    Without a budget it behaves like a plain list.
+    """
+
+    def __init__(self, budget_bytes: Optional[int] = None, directory: Optional[str] = None):
+        """
+        Initialize the buffer.
+
+        Args:
+            budget_bytes: Estimated bytes of batches kept in memory before
+                spilling; None never spills
+            directory: Where the scratch file is created (system temp by default)
+        """
+        self.budget_bytes = budget_bytes
+        self.directory = directory
+        self.logger = logging.getLogger('data_ingestion.spill')
+
+        self._memory: List[Batch] = []
+        self._memory_sizes: List[int] = []
+        self.memory_bytes = 0
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._path: Optional[str] = None
+        self.spilled_batches = 0
+        self.spilled_bytes = 0
+        self.spilled_records = 0
+
+    def __len__(self) -> int:
+        """Number of batches held."""
+        return len(self._memory) + self.spilled_batches
+
+    def __iter__(self) -> Iterator[Batch]:
+        """Yield every batch in insertion order, reading spilled ones back lazily."""
+        yield from self._memory
+        if not self.spilled_batches:
+            return
+
+        last_id = 0
+        while True:
+            rows = self._connection.execute(
+                "SELECT id, payload FROM spilled_batches WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, _READ_CHUNK)
+            ).fetchall()
+            if not rows:
+                return
+            for last_id, payload in rows:
+                yield pickle.loads(payload)
+
+    def append(self, batch: Batch):
+        """Add a batch, spilling it to disk if the memory budget is used up."""
+        size = estimate_batch_bytes(batch) if self.budget_bytes is not None else 0
+        if self.budget_bytes is None or (not self.spilled_batches and
+                                         self.memory_bytes + size <= self.budget_bytes):
+            self._memory.append(batch)
+            self._memory_sizes.append(size)
+            self.memory_bytes += size
+            return
+        self._spill(batch)
+
+    def extend(self, batches: Iterable[Batch]) -> int:
+        """
+        Add batches one at a time (so a large file never sits in memory whole).
+
+        Returns:
+            Number of records added
+        """
+        records = 0
+        for batch in batches:
+            self.append(batch)
+            records += len(batch)
+        return records
+
+    def checkpoint(self) -> Tuple[int, int]:
+        """Position to roll back to if the following batches must be discarded."""
+        return len(self._memory), self.spilled_batches
+
+    def rollback(self, checkpoint: Tuple[int, int]):
+        """Discard every batch added after a checkpoint."""
+        memory_count, spilled_count = checkpoint
+        del self._memory[memory_count:]
+        del self._memory_sizes[memory_count:]
+        self.memory_bytes = sum(self._memory_sizes)
+
+        if self.spilled_batches > spilled_count:
+            # Spilled ids are 1..n in insertion order
+            removed = self._connection.execute(
+                "SELECT COALESCE(SUM(records), 0), COALESCE(SUM(LENGTH(payload)), 0) "
+                "FROM spilled_batches WHERE id > ?", (spilled_count,)
+            ).fetchone()
+            self._connection.execute("DELETE FROM spilled_batches WHERE id > ?", (spilled_count,))
+            self.spilled_records -= removed[0]
+            self.spilled_bytes -= removed[1]
+            self.spilled_batches = spilled_count
+
+    def stats(self) -> Dict[str, Any]:
+        """Budget use and spill figures for the run result."""
+        return {
+            'budget_bytes': self.budget_bytes,
+            'memory_batches': len(self._memory),
+            'memory_bytes_estimated': self.memory_bytes,
+            'spilled_batches': self.spilled_batches,
+            'spilled_records': self.spilled_records,
+            'spilled_bytes': self.spilled_bytes,
+        }
+
+    def close(self):
+        """Drop all batches and delete the scratch file."""
+        self._memory = []
+        self._memory_sizes = []
+        self.memory_bytes = 0
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        if self._path is not None:
+            try:
+                os.remove(self._path)
+            except OSError as e:
+                self.logger.warning(f"Could not remove spill file {self._path}: {e}")
+            self._path = None
+
+    def _spill(self, batch: Batch):
+        """Write one batch to the scratch file."""
+        if self._connection is None:
+            handle, self._path = tempfile.mkstemp(prefix='ingest_spill_', suffix='.db', dir=self.directory)
+            os.close(handle)
+            # Scratch data: no journal and no fsync, the file is deleted afterwards
+            self._connection = sqlite3.connect(self._path, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=OFF")
+            self._connection.execute("PRAGMA synchronous=OFF")
+            self._connection.execute(
+                "CREATE TABLE spilled_batches (id INTEGER PRIMARY KEY, records INTEGER, payload BLOB)"
+            )
+            self.logger.info(f"Memory budget of {self.budget_bytes} bytes reached; "
+                             f"spilling batches to {self._path}")
+
+        payload = pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL)
+        self.spilled_batches += 1
+        self._connection.execute("INSERT INTO spilled_batches (id, records, payload) VALUES (?, ?, ?)",
+                                 (self.spilled_batches, len(batch), payload))
+        self.spilled_records += len(batch)
+        self.spilled_bytes += len(payload)
@@ -0,0 +1,125 @@
+"""
+Stage Timings for Generic Data Ingestion Framework.
+
+Breaks an ingestion run down into its stages - scan, decode, transform,
+schema inference and insert - overall and per file, with record and byte
+counts. Stages are timed with time.perf_counter once per batch, never per
+record, so the breakdown is always collected.
+
+Decode, transform and schema are measured where files are parsed (in this
+process, the pipeline reader thread or a worker process) and therefore
+overlap with each other and with inserts when --jobs or --pipeline is used;
+with several workers their seconds are summed across workers.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+STAGES = ('scan', 'decode', 'transform', 'schema', 'insert')
+
+# Stages measured per file by core.parallel.process_file_batches
+FILE_STAGES = ('decode', 'transform', 'schema')
+
+
+def new_file_timing() -> Dict[str, Any]:
+    """Empty per-file counters filled in by process_file_batches."""
+    return {'bytes': 0, 'records': 0, 'decode': 0.0, 'transform': 0.0, 'schema': 0.0}
+
+
+def merge_file_timing(target: Dict[str, Any], source: Optional[Dict[str, Any]]):
+    """Add one file timing (e.g. from a worker's byte range) into another."""
+    if source:
+        for key, value in source.items():
+            target[key] = target.get(key, 0) + value
+
+
+def _stage(seconds: float, records: int, size: int) -> Dict[str, Any]:
+    """Report entry for one stage."""
+    return {
+        'seconds': round(seconds, 6),
+        'records': records,
+        'bytes': size,
+        'records_per_second': round(records / seconds, 1) if seconds > 0 else None,
+        'bytes_per_second': round(size / seconds, 1) if seconds > 0 else None,
+    }
+
+
+class IngestionTimings:
+    """
+    Collects stage timings for one process_directory run.
+
+    Usage:
+        timings = IngestionTimings()
+        timings.record_scan(scanner.get_scan_statistics())
+        file_batches = iter_file_batches(files, processor, timings=timings)
+        ...
+        timings.record_insert(seconds, records, file_path)
+        result['timings'] = timings.report()
+    """
+
+    def __init__(self):
+        """Initialize empty timings."""
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.scan = {'seconds': 0.0, 'files': 0, 'bytes': 0}
+        self.insert = {'seconds': 0.0, 'records': 0}
+
+    def for_file(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+        """Counters for one file, created on first use (files keep discovery order)."""
+        key = str(file_path)
+        timing = self.files.get(key)
+        if timing is None:
+            timing = self.files[key] = new_file_timing()
+        return timing
+
+    def record_scan(self, scan_stats: Dict[str, Any]):
+        """Take the scan stage from FileScanner.get_scan_statistics()."""
+        self.scan['seconds'] += scan_stats.get('scan_seconds', 0.0)
+        self.scan['files'] += scan_stats.get('files_classified', 0)
+        self.scan['bytes'] += scan_stats.get('bytes_classified', 0)
+
+    def record_insert(self, seconds: float, records: int,
+                      file_path: Optional[Union[str, Path]] = None):
+        """
+        Add insert time; with file_path it is also attributed to that file.
+
+        Args:
+            seconds: Time spent inserting and committing
+            records: Records written
+            file_path: File the records came from (streaming mode)
+        """
+        self.insert['seconds'] += seconds
+        self.insert['records'] += records
+        if file_path is not None:
+            timing = self.for_file(file_path)
+            timing['insert'] = timing.get('insert', 0.0) + seconds
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build the breakdown stored in the process_directory result.
+
+        Returns:
+            Dict with 'stages' (stage -> seconds, records, bytes and rates) and
+            'files' (one entry per file with its bytes, records and per-stage
+            seconds; 'insert_seconds' is None when files were written together)
+        """
+        decoded_bytes = sum(timing['bytes'] for timing in self.files.values())
+        decoded_records = sum(timing['records'] for timing in self.files.values())
+
+        stages = {'scan': _stage(self.scan['seconds'], decoded_records, self.scan['bytes'])}
+        stages['scan']['files'] = self.scan['files']
+        for stage in FILE_STAGES:
+            seconds = sum(timing[stage] for timing in self.files.values())
+            stages[stage] = _stage(seconds, decoded_records, decoded_bytes)
+        stages['insert'] = _stage(self.insert['seconds'], self.insert['records'], decoded_bytes)
+
+        files = []
+        for path, timing in self.files.items():
+            entry = {'file': path, 'bytes': timing['bytes'], 'records': timing['records']}
+            for stage in FILE_STAGES:
+                entry[f'{stage}_seconds'] = round(timing[stage], 6)
+            insert = timing.get('insert')
+            entry['insert_seconds'] = round(insert, 6) if insert is not None else None
+            files.append(entry)
+
+        return {'stages': stages, 'files': files}
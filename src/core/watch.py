@@ -0,0 +1,305 @@
+"""
+Watch Mode for Generic Data Ingestion Framework.
+
+Keeps ingesting a directory as files land in it. One connector, one JSON
+processor and the known table columns stay alive between polls; each poll
+re-lists the directory (cheap with a scan index), stats the JSON files and
+picks those that are new or changed since they were last handled.
+
+A file is only read once it is stable: its mtime must be at least
+settle_seconds old (or its size and mtime unchanged for that long), so files
+still being written (or copied) are left for a later poll. Stable files go
+through the incremental manifest (new, changed or touched-but-identical) and
+are written in micro-batches of up to max_batch_files files per transaction
+(group commit). If any file of a
+micro-batch fails, the batch is rolled back and its files are retried one
+transaction each, so one bad file does not hold back the others.
+
+Rows are tagged with their source path and tracked in the manifest exactly
+as with --incremental, so a restarted watcher skips what is already loaded
+and a rewritten file replaces its old rows.
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.manifest import IngestionManifest
+from core.parallel import iter_file_batches
+from processors.json_processor import JSONProcessor
+from scanners.file_scanner import FileScanner
+
+
+DEFAULT_POLL_INTERVAL = 2.0
+DEFAULT_SETTLE_SECONDS = 2.0
+DEFAULT_BATCH_FILES = 100
+
+
+class DirectoryWatcher:
+    """
+    Polls a directory and ingests new or changed files as they become stable.
+
+    Usage:
+        watcher = DirectoryWatcher(app, 'landing/', 'output.db')
+        try:
+            watcher.run()            # until stop() or Ctrl+C
+        finally:
+            watcher.close()
+        watcher.totals
+    """
+
+    def __init__(self, app, directory: str, output_db: str = "output.db",
+                 table_name: str = "processed_data",
+                 poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+                 max_batch_files: int = DEFAULT_BATCH_FILES,
+                 batch_size: int = 1000, item_path: Optional[str] = None,
+                 typed_columns: bool = False, load_profile: Optional[str] = None,
+                 columnar: bool = False, scan_index: Optional[str] = None):
+        """
+        Open the output database and load the manifest.
+
+        Args:
+            app: DataIngestionApplication whose connector factory and write
+                helpers are used
+            directory: Directory to watch
+            output_db: SQLite database file
+            table_name: Target table
+            poll_interval: Seconds between polls
+            settle_seconds: Minimum age of a file's mtime before it is read
+            max_batch_files: Files written per transaction
+            batch_size: Records read, processed and written at a time
+            item_path: Dotted key path to the record array inside each file
+            typed_columns: Store columns with inferred types
+            load_profile: SQLite bulk-load profile for the connection; the
+                connection stays open for the whole watch, so 'bulk' runs with
+                NORMAL instead of EXCLUSIVE locking and readers are not locked
+                out between group commits
+            columnar: Carry records as columnar RecordBatch objects
+            scan_index: Persistent directory index file for the polls
+
+        Raises:
+            RuntimeError: If the manifest cannot be loaded
+        """
+        self.app = app
+        self.table_name = table_name
+        self.poll_interval = poll_interval
+        self.settle_seconds = settle_seconds
+        self.max_batch_files = max(1, max_batch_files)
+        self.batch_size = batch_size
+        self.item_path = item_path
+        self.typed_columns = typed_columns
+        self.columnar = columnar
+        self.logger = logging.getLogger('data_ingestion.watch')
+
+        self.scanner = FileScanner(directory, index_path=scan_index)
+        # Discovery is repeated every poll; only its warnings are worth logging
+        self.scanner.logger = logging.getLogger('data_ingestion.watch.scan')
+        self.scanner.logger.setLevel(logging.WARNING)
+        self.processor = JSONProcessor(typed_values=typed_columns)
+        self.connector = app.connector_factory.create_sqlite_connector(output_db, load_profile)
+        self.connector.release_exclusive_lock()
+        self.known_columns = self.connector.get_column_types(table_name)
+        self.manifest = IngestionManifest(self.scanner, table_name)
+        if not self.manifest.load(self.connector):
+            self.connector.disconnect()
+            raise RuntimeError("Could not load ingestion manifest")
+
+        # (size, mtime) of every file already handled, so unchanged files cost one stat
+        self._handled: Dict[Path, Tuple[int, int]] = {}
+        # Files waiting to settle: (size, mtime) and when that stat was first seen
+        self._settling: Dict[Path, Tuple[Tuple[int, int], float]] = {}
+        self._stop = threading.Event()
+        self.totals = {'polls': 0, 'files_ingested': 0, 'files_unchanged': 0,
+                       'records': 0, 'commits': 0, 'errors': []}
+
+    def run(self, max_polls: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Poll until stop() is called (or max_polls polls have run).
+
+        Returns:
+            Running totals: polls, files ingested / found unchanged, records,
+            commits and error messages
+        """
+        self.logger.info(f"Watching {self.scanner.root_directory} every {self.poll_interval}s "
+                         f"(files settle for {self.settle_seconds}s)")
+        while not self._stop.is_set():
+            self.poll()
+            if max_polls is not None and self.totals['polls'] >= max_polls:
+                break
+            self._stop.wait(self.poll_interval)
+        return self.totals
+
+    def stop(self):
+        """Ask run() to return after the current poll."""
+        self._stop.set()
+
+    def close(self):
+        """Close the database connection."""
+        if self.connector:
+            self.connector.disconnect()
+            self.connector = None
+
+    def poll(self) -> Dict[str, Any]:
+        """
+        Run one poll: find stable new or changed files and ingest them.
+
+        Returns:
+            Counts for this poll: files ingested, records and commits
+        """
+        self.totals['polls'] += 1
+        before = (self.totals['files_ingested'], self.totals['records'], self.totals['commits'])
+
+        ready = self._stable_changed_files()
+        to_ingest = self._classify(ready)
+        for start in range(0, len(to_ingest), self.max_batch_files):
+            self._ingest_group(to_ingest[start:start + self.max_batch_files])
+
+        files, records, commits = (self.totals['files_ingested'] - before[0],
+                                   self.totals['records'] - before[1],
+                                   self.totals['commits'] - before[2])
+        if files:
+            self.logger.info(f"Ingested {records} records from {files} files ({commits} commits)")
+        return {'files_ingested': files, 'records': records, 'commits': commits}
+
+    def _stable_changed_files(self) -> List[Tuple[Path, Tuple[int, int]]]:
+        """Files whose stat data differs from when they were last handled and that have settled."""
+        discovered = self.scanner.discover_files(file_types=['json'], recursive=True, ordered=True)
+        now = time.time()
+        present = set()
+        ready = []
+
+        for file_path in discovered.get('json', []):
+            present.add(file_path)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if self._handled.get(file_path) == signature:
+                continue
+            if now - stat.st_mtime < self.settle_seconds:
+                # Still being written (or only just landed), unless its stat data
+                # has not moved for settle_seconds (covers clock skew on network mounts)
+                settling = self._settling.get(file_path)
+                if settling is None or settling[0] != signature:
+                    self._settling[file_path] = (signature, now)
+                    continue
+                if now - settling[1] < self.settle_seconds:
+                    continue
+            self._settling.pop(file_path, None)
+            ready.append((file_path, signature))
+
+        # Forget deleted files so a file landing again under the same name is picked up
+        for tracked in (self._handled, self._settling):
+            for file_path in list(tracked):
+                if file_path not in present:
+                    del tracked[file_path]
+        return ready
+
+    def _classify(self, ready: List[Tuple[Path, Tuple[int, int]]]) -> List[Tuple[Path, Tuple[int, int], tuple]]:
+        """Check stable files against the manifest; unchanged ones are marked handled."""
+        to_ingest = []
+        refreshed = False
+        for file_path, signature in ready:
+            state, fingerprint = self.manifest.classify(file_path)
+            if state == self.manifest.UNCHANGED:
+                if self.manifest.is_stale(fingerprint):
+                    self.manifest.refresh(self.connector, fingerprint)
+                    refreshed = True
+                self._handled[file_path] = signature
+                self.totals['files_unchanged'] += 1
+            else:
+                to_ingest.append((file_path, signature, (state, fingerprint)))
+        if refreshed:
+            self.connector.commit()
+        return to_ingest
+
+    def _ingest_group(self, group: List[Tuple[Path, Tuple[int, int], tuple]]):
+        """Write a micro-batch of files in one transaction, falling back to one per file."""
+        # Creating the table commits, so files get their own transaction until it exists
+        while group and not self.known_columns:
+            self._ingest_file(*group[0])
+            group = group[1:]
+        if not group:
+            return
+
+        line_errors: List[str] = []
+        states = {file_path: (signature, file_state) for file_path, signature, file_state in group}
+        written = []
+        try:
+            for file_path, batches, file_schema in iter_file_batches(
+                    [file_path for file_path, _, _ in group], self.processor, self.item_path,
+                    self.batch_size, line_errors, self.typed_columns, self.columnar):
+                signature, file_state = states[file_path]
+                records = self._write_file(file_path, batches, file_schema, file_state, commit=False)
+                written.append((file_path, signature, records))
+            if not self.connector.commit():
+                raise RuntimeError("Database commit failed")
+        except Exception as e:
+            self.logger.warning(f"Group of {len(group)} files failed ({e}); retrying file by file")
+            self._reset_after_rollback()
+            for entry in group:
+                self._ingest_file(*entry)
+            return
+
+        self.totals['commits'] += 1
+        for file_path, signature, records in written:
+            self._handled[file_path] = signature
+            self.totals['files_ingested'] += 1
+            self.totals['records'] += records
+        self._report_line_errors(line_errors)
+
+    def _ingest_file(self, file_path: Path, signature: Tuple[int, int], file_state: tuple):
+        """Write one file in its own transaction; errors are recorded, not raised."""
+        line_errors: List[str] = []
+        batches = None
+        # Whatever happens the file is not retried until it changes again
+        self._handled[file_path] = signature
+        try:
+            for _, batches, file_schema in iter_file_batches(
+                    [file_path], self.processor, self.item_path, self.batch_size, line_errors,
+                    self.typed_columns, self.columnar):
+                records = self._write_file(file_path, batches, file_schema, file_state, commit=True)
+        except Exception as e:
+            if batches is not None:
+                # Reports the line errors read before the failure
+                batches.close()
+            error_msg = f"Error processing {file_path.name}: {str(e)}"
+            self.totals['errors'].append(error_msg)
+            self.logger.error(f"  ✗ {error_msg}")
+            # The manifest entry recorded in memory was rolled back with the file
+            self.manifest.load(self.connector)
+            return
+        finally:
+            self._report_line_errors(line_errors)
+
+        self.totals['commits'] += 1
+        self.totals['files_ingested'] += 1
+        self.totals['records'] += records
+
+    def _write_file(self, file_path: Path, batches, file_schema, file_state: tuple, commit: bool) -> int:
+        """Tag a file's batches with its source path and write them."""
+        batches = self.app._tag_source_path(batches, file_state[1]['file_path'])
+        file_schema.add_column(IngestionManifest.SOURCE_PATH_COLUMN)
+        return self.app._stream_file_to_database(
+            self.connector, batches, file_schema, file_path.name, self.table_name,
+            self.known_columns, self.manifest, file_state, commit=commit
+        )
+
+    def _reset_after_rollback(self):
+        """Roll back the open transaction and re-read state it may have changed."""
+        self.connector.rollback()
+        self.known_columns.clear()
+        self.known_columns.update(self.connector.get_column_types(self.table_name))
+        self.manifest.load(self.connector)
+
+    def _report_line_errors(self, line_errors: List[str]):
+        """Record lines skipped in JSON Lines files."""
+        for line_error in line_errors:
+            error_msg = f"Error processing {line_error}"
+            self.totals['errors'].append(error_msg)
+            self.logger.warning(f"  ⚠ {error_msg}")
@@ -1,12 +1,16 @@
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Union, Tuple
 import os
 import shutil
 from datetime import datetime
 import hashlib
 
+from processors.json_backend import get_backend
+from readers.json_stream_reader import JSONArrayStreamReader
+from readers.mapped_file import MAPPED_ENCODINGS, map_file
+
 
 class FileHandler:
 
@@ -133,7 +137,13 @@ class FileHandler:
     def read_json_file(self, file_path: Union[str, Path],
                        encoding: str = 'utf-8-sig',
                        fallback_encodings: List[str] = None) -> Any:
+        """
+        Read a whole JSON document, trying fallback encodings in turn.
 
+        UTF-8 files are memory-mapped and parsed straight from the mapped
+        bytes (see readers.mapped_file), so the file is never held as a
+        decoded str next to its raw bytes; other encodings are read as text.
+        """
         path = Path(file_path)
 
         # Validate file access
@@ -149,11 +159,16 @@ class FileHandler:
             fallback_encodings = ['utf-8', 'latin-1', 'cp1252', 'ascii']
 
         encodings_to_try = [encoding] + fallback_encodings
+        loads = get_backend().loads
 
         for enc in encodings_to_try:
             try:
-                with open(path, 'r', encoding=enc) as f:
-                    data = json.load(f)
+                if enc.lower() in MAPPED_ENCODINGS:
+                    with map_file(path, strip_bom=enc.lower() == 'utf-8-sig') as content:
+                        data = loads(content)
+                else:
+                    with open(path, 'r', encoding=enc) as f:
+                        data = loads(f.read())
 
                 self._log_operation("READ_JSON", str(path), True, f"encoding: {enc}")
                 self.logger.debug(f"Successfully read JSON file with {enc}: {path}")
@@ -178,6 +193,31 @@ class FileHandler:
                 self.logger.error(f"Unexpected error reading JSON file {path}: {e}")
                 raise
 
+    def iter_json_batches(self, file_path: Union[str, Path],
+                          item_path: Optional[str] = None,
+                          batch_size: int = 1000,
+                          encoding: str = 'utf-8-sig') -> Iterator[List[Any]]:
+        """
+        Read a JSON array file incrementally in batches of records.
+
+        Unlike read_json_file, only the current batch is held in memory, so
+        very large top-level arrays (or arrays under item_path, e.g.
+        'data.records') can be read regardless of available RAM.
+        """
+        path = Path(file_path)
+
+        # Validate file access up front rather than on first iteration
+        is_valid, error_msg = self.validate_file_access(path, 'read')
+        if not is_valid:
+            if "does not exist" in error_msg:
+                raise FileNotFoundError(error_msg)
+            else:
+                raise PermissionError(error_msg)
+
+        reader = JSONArrayStreamReader(path, item_path=item_path, encoding=encoding)
+        self._log_operation("STREAM_JSON", str(path), True, f"item_path: {item_path}")
+        return reader.iter_batches(batch_size)
+
     def write_json_file(self, data: Any, file_path: Union[str, Path],
                         indent: int = 2, ensure_ascii: bool = False,
                         backup_existing: bool = True) -> bool:
@@ -358,12 +398,17 @@ class FileHandler:
             self.logger.debug(f"Error getting file size for {file_path}: {e}")
             return -1
 
+    def get_file_hash(self, file_path: Union[str, Path], algorithm: str = 'md5') -> Optional[str]:
+        """Calculate the content hash of a file of any size (None on error)"""
+        return self._calculate_file_hash(Path(file_path), algorithm)
+
     def _calculate_file_hash(self, file_path: Path, algorithm: str = 'md5') -> str:
         """Calculate file hash"""
         try:
             hash_obj = hashlib.new(algorithm)
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
+                # 1 MiB reads keep hashing of multi-GB files I/O bound
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
                     hash_obj.update(chunk)
             return hash_obj.hexdigest()
         except Exception as e:
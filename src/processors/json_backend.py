@@ -0,0 +1,192 @@
+"""
+Pluggable JSON Backends for Generic Data Ingestion Framework.
+Author: Moez Khan (SRN: 23097401)
+FYP Project - University of Hertfordshire
+
+Decoding files is most of the CPU time per record. This module picks the
+JSON engine once per process: orjson when it is installed, otherwise the
+standard library. Nested values are encoded by the stdlib whatever the
+backend, so the stored text does not change with it. Every backend keeps the
+stdlib's behaviour for input it does not handle itself (NaN/Infinity,
+integers beyond 64 bits, lone surrogates), and malformed input always raises
+the stdlib's json.JSONDecodeError with the stdlib's message.
+
+Selection order: select_backend() / --json-backend, then the
+DATA_INGESTOR_JSON_BACKEND environment variable, then the first available
+backend in PREFERRED_BACKENDS.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+
+# Environment variable naming the backend; also how worker processes inherit it
+BACKEND_ENV_VAR = 'DATA_INGESTOR_JSON_BACKEND'
+
+# Backends tried in order when none is selected explicitly
+PREFERRED_BACKENDS = ('orjson', 'json')
+
+logger = logging.getLogger('data_ingestion.json_backend')
+
+
+def _text(data: Union[str, bytes, memoryview]) -> Union[str, bytes]:
+    """Decode a memoryview for json.loads, which takes str, bytes or bytearray only."""
+    return str(data, 'utf-8') if isinstance(data, memoryview) else data
+
+
+class JSONBackend:
+    """
+    Standard library backend and base class for faster engines.
+
+    Subclasses override loads/dumps and available().
+    """
+
+    name = 'json'
+
+    @classmethod
+    def available(cls) -> bool:
+        """Whether the backend's engine is installed."""
+        return True
+
+    def loads(self, data: Union[str, bytes, memoryview]) -> Any:
+        """
+        Decode a JSON document.
+
+        A memoryview (e.g. a mapped file, see readers.mapped_file) must hold
+        UTF-8; the stdlib parses str, so it is decoded here once.
+
+        Raises:
+            json.JSONDecodeError: If the document is malformed
+            UnicodeDecodeError: If a memoryview is not valid UTF-8
+        """
+        return json.loads(_text(data))
+
+    def dumps(self, value: Any) -> str:
+        """Encode a value as a JSON string."""
+        return json.dumps(value)
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    orjson backend: several times faster decoding.
+
+    Nested values are still encoded by the stdlib: orjson's output is compact
+    ('[1,2]' instead of '[1, 2]'), so stored text would depend on the backend
+    and tables loaded before and after a switch would mix both forms.
+    """
+
+    name = 'orjson'
+
+    @classmethod
+    def available(cls) -> bool:
+        return orjson is not None
+
+    def loads(self, data: Union[str, bytes, memoryview]) -> Any:
+        try:
+            # Parses bytes and memoryviews in place, without decoding to str first
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Accepts what only the stdlib allows; otherwise raises its error
+            return json.loads(_text(data))
+
+
+# Registry of backend name -> class
+BACKENDS: Dict[str, type] = {
+    'json': JSONBackend,
+    'orjson': OrjsonBackend,
+}
+
+_instances: Dict[str, JSONBackend] = {}
+_selected: Optional[str] = None
+
+
+def register_backend(backend_class: type):
+    """Register an additional backend class under its name."""
+    BACKENDS[backend_class.name] = backend_class
+
+
+def available_backends() -> list:
+    """Names of the registered backends whose engine is installed."""
+    return [name for name, backend_class in BACKENDS.items() if backend_class.available()]
+
+
+def _resolve(name: Optional[str]) -> str:
+    """Turn a requested name ('auto'/None included) into an available backend name."""
+    if name and name != 'auto':
+        backend_class = BACKENDS.get(name)
+        if backend_class is None:
+            raise ValueError(f"Unknown JSON backend '{name}'. Available: {', '.join(BACKENDS)}")
+        if not backend_class.available():
+            raise ValueError(f"JSON backend '{name}' is not installed")
+        return name
+
+    for candidate in PREFERRED_BACKENDS:
+        if candidate in BACKENDS and BACKENDS[candidate].available():
+            return candidate
+    return 'json'
+
+
+def select_backend(name: Optional[str] = None) -> JSONBackend:
+    """
+    Choose the process-wide backend (call once at startup).
+
+    The choice is exported through BACKEND_ENV_VAR so worker processes use
+    the same backend. To choose a backend for one run only, save
+    backend_selection() first and pass it to restore_backend() afterwards.
+
+    Args:
+        name: Backend name, or None/'auto' for the fastest installed one
+
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    global _selected
+    _selected = _resolve(name)
+    os.environ[BACKEND_ENV_VAR] = _selected
+    logger.debug(f"Selected JSON backend: {_selected}")
+    return get_backend()
+
+
+def backend_selection() -> Tuple[Optional[str], Optional[str]]:
+    """The current selection and BACKEND_ENV_VAR value, for restore_backend()."""
+    return _selected, os.environ.get(BACKEND_ENV_VAR)
+
+
+def restore_backend(selection: Tuple[Optional[str], Optional[str]]):
+    """
+    Undo select_backend() calls made since backend_selection() was taken.
+
+    Args:
+        selection: Value returned by backend_selection()
+    """
+    global _selected
+    _selected, exported = selection
+    if exported is None:
+        os.environ.pop(BACKEND_ENV_VAR, None)
+    else:
+        os.environ[BACKEND_ENV_VAR] = exported
+
+
+def get_backend(name: Optional[str] = None) -> JSONBackend:
+    """
+    Get a backend instance.
+
+    Args:
+        name: Specific backend name; defaults to the selected backend
+    """
+    if name is None:
+        name = _selected or _resolve(os.environ.get(BACKEND_ENV_VAR))
+    else:
+        name = _resolve(name)
+
+    backend = _instances.get(name)
+    if backend is None:
+        backend = _instances[name] = BACKENDS[name]()
+    return backend
@@ -0,0 +1,164 @@
+"""
+Columnar Record Batch for Generic Data Ingestion Framework.
+Author: Moez Khan (SRN: 23097401)
+FYP Project - University of Hertfordshire
+
+A RecordBatch holds processed records as one list per column plus a shared
+column list, instead of one dict per record. Wide, repetitive data then needs
+no per-record dicts between parsing and writing, batches pickle compactly
+between worker processes, and the database connector can bind rows straight
+from the column lists.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class RecordBatch:
+    """
+    Columnar batch of records sharing one schema.
+
+    Missing values (a key absent from some records) are None, which is written
+    as NULL - the same result as inserting the records as dicts.
+
+    Usage:
+        batch = RecordBatch.from_records([{'id': 1}, {'id': 2, 'name': 'x'}])
+        batch.columns            # ['id', 'name']
+        batch.column('name')     # [None, 'x']
+        connector.insert_data('people', batch)
+    """
+
+    __slots__ = ('columns', 'arrays', 'num_rows')
+
+    def __init__(self, columns: List[str], arrays: List[List[Any]], num_rows: Optional[int] = None):
+        """
+        Initialize a batch from column names and equal-length value lists.
+
+        Args:
+            columns: Column names
+            arrays: One list of values per column, in the same order
+            num_rows: Number of rows (required when there are no columns)
+
+        Raises:
+            ValueError: If the column lists are inconsistent
+        """
+        if len(columns) != len(arrays):
+            raise ValueError(f"RecordBatch has {len(columns)} columns but {len(arrays)} arrays")
+        if num_rows is None:
+            num_rows = len(arrays[0]) if arrays else 0
+        if any(len(array) != num_rows for array in arrays):
+            raise ValueError("RecordBatch column arrays must all have the same length")
+
+        self.columns = list(columns)
+        self.arrays = arrays
+        self.num_rows = num_rows
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> 'RecordBatch':
+        """
+        Build a batch from dict records; columns are in first-seen order.
+
+        Args:
+            records: Records to convert (non-dict items are skipped)
+        """
+        builder = RecordBatchBuilder()
+        for record in records:
+            if isinstance(record, dict):
+                builder.append(record)
+        return builder.finish()
+
+    def __len__(self) -> int:
+        """Number of rows in the batch."""
+        return self.num_rows
+
+    def __repr__(self) -> str:
+        return f"RecordBatch(rows={self.num_rows}, columns={self.columns})"
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Get the values of one column.
+
+        Raises:
+            KeyError: If the column does not exist
+        """
+        try:
+            return self.arrays[self.columns.index(name)]
+        except ValueError:
+            raise KeyError(name)
+
+    def set_column(self, name: str, value: Any):
+        """
+        Set a column to the same value in every row (e.g. lineage metadata).
+
+        Replaces the column if it already exists.
+        """
+        array = [value] * self.num_rows
+        if name in self.columns:
+            self.arrays[self.columns.index(name)] = array
+        else:
+            self.columns.append(name)
+            self.arrays.append(array)
+
+    def rows(self) -> Iterator[tuple]:
+        """Iterate over rows as tuples in column order."""
+        if not self.arrays:
+            return iter([()] * self.num_rows)
+        return zip(*self.arrays)
+
+    def to_records(self, drop_missing: bool = False) -> List[Dict[str, Any]]:
+        """
+        Convert back to dict records.
+
+        Args:
+            drop_missing: Omit None values instead of including them as keys
+        """
+        columns = self.columns
+        if drop_missing:
+            return [{name: value for name, value in zip(columns, row) if value is not None}
+                    for row in self.rows()]
+        return [dict(zip(columns, row)) for row in self.rows()]
+
+    def to_pydict(self) -> Dict[str, List[Any]]:
+        """Column name to values mapping, e.g. for pandas.DataFrame(batch.to_pydict())."""
+        return dict(zip(self.columns, self.arrays))
+
+
+class RecordBatchBuilder:
+    """
+    Appends records column by column without keeping the record dicts.
+
+    Columns that first appear part-way through are back-filled with None and
+    columns missing from a record are padded lazily, so each value is touched
+    once.
+    """
+
+    __slots__ = ('_arrays', 'num_rows')
+
+    def __init__(self):
+        """Initialize an empty builder."""
+        self._arrays: Dict[str, List[Any]] = {}
+        self.num_rows = 0
+
+    def append(self, record: Dict[str, Any]):
+        """Append one record (already processed values)."""
+        self.append_items(record.items())
+
+    def append_items(self, items) -> None:
+        """Append one record given as (column, value) pairs."""
+        arrays = self._arrays
+        row = self.num_rows
+        for name, value in items:
+            array = arrays.get(name)
+            if array is None:
+                arrays[name] = array = [None] * row
+            elif len(array) < row:
+                array.extend([None] * (row - len(array)))
+            array.append(value)
+        self.num_rows = row + 1
+
+    def finish(self) -> RecordBatch:
+        """Pad short columns and return the batch."""
+        rows = self.num_rows
+        for array in self._arrays.values():
+            if len(array) < rows:
+                array.extend([None] * (rows - len(array)))
+        return RecordBatch(list(self._arrays), list(self._arrays.values()), rows)
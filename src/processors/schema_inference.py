@@ -0,0 +1,246 @@
+"""
+Streaming Schema Inference for Generic Data Ingestion Framework.
+Author: Moez Khan (SRN: 23097401)
+FYP Project - University of Hertfordshire
+
+Builds the unified table schema from every record rather than a sample, so
+fields that only appear late in a dataset are never dropped. Accumulators
+are cheap to update per record and can be merged across files or workers.
+
+With type inference enabled, each column also gets a SQLite storage type
+(INTEGER, REAL, TEXT, or JSON_TEXT for nested objects and arrays) so numeric
+data is stored as numbers. A column only falls back to TEXT on a real conflict.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+# Declared type for nested values serialised to JSON. A plain 'JSON' column
+# would get NUMERIC affinity in SQLite; the TEXT suffix gives TEXT affinity
+JSON_TYPE = 'JSON_TEXT'
+
+# Column type for each raw JSON value class; None carries no type information
+VALUE_TYPES = {
+    bool: 'INTEGER',
+    int: 'INTEGER',
+    float: 'REAL',
+    str: 'TEXT',
+    dict: JSON_TYPE,
+    list: JSON_TYPE,
+}
+
+# Fallback for conflicting types and columns that only ever held nulls
+DEFAULT_TYPE = 'TEXT'
+
+# Types whose SQLite affinity converts numeric-looking text (e.g. '007' to 7)
+NUMERIC_TYPES = ('INTEGER', 'REAL')
+
+
+def merge_types(current: Optional[str], observed: Optional[str]) -> Optional[str]:
+    """
+    Combine two inferred column types.
+
+    INTEGER and REAL widen to REAL; any other disagreement falls back to TEXT.
+    None (no non-null value seen yet) yields to the other type.
+    """
+    if current is None or current == observed:
+        return observed
+    if observed is None:
+        return current
+    if {current, observed} == {'INTEGER', 'REAL'}:
+        return 'REAL'
+    return DEFAULT_TYPE
+
+
+class SchemaAccumulator:
+    """
+    Single-pass accumulator of the column set (and optionally types) seen across records.
+
+    Per-record cost is a tuple of the record's keys and one set lookup: records
+    that repeat an already-seen key shape (the common case) do no further work.
+    Column order is first-seen order, which stays stable as the schema grows.
+    Type inference adds one class lookup per value and should observe raw
+    records, before nested values are serialised to strings.
+    """
+
+    # Stop remembering shapes on extremely heterogeneous data to bound memory
+    MAX_TRACKED_SHAPES = 10000
+
+    def __init__(self, infer_types: bool = False):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            infer_types: Track a storage type per column instead of using TEXT throughout
+        """
+        self.infer_types = infer_types
+        self.columns: Dict[str, Optional[str]] = {}
+        self.records_observed = 0
+        self._seen_shapes: Set[tuple] = set()
+
+    def observe(self, record: Dict[str, Any]) -> List[str]:
+        """
+        Observe one record.
+
+        Args:
+            record: Record to observe (non-dict values are ignored)
+
+        Returns:
+            List of columns seen for the first time
+        """
+        if not isinstance(record, dict):
+            return []
+
+        self.records_observed += 1
+        shape = tuple(record)
+        if shape in self._seen_shapes:
+            new_columns = []
+        else:
+            if len(self._seen_shapes) < self.MAX_TRACKED_SHAPES:
+                self._seen_shapes.add(shape)
+            new_columns = self._add_columns(shape)
+
+        if self.infer_types:
+            self._observe_types((record,))
+
+        return new_columns
+
+    def observe_batch(self, records: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Observe a batch of records.
+
+        Args:
+            records: Records to observe
+
+        Returns:
+            List of columns seen for the first time in this batch
+        """
+        records = [record for record in records if isinstance(record, dict)]
+        self.records_observed += len(records)
+
+        seen_shapes = self._seen_shapes
+        new_columns = []
+        for record in records:
+            shape = tuple(record)
+            if shape not in seen_shapes:
+                if len(seen_shapes) < self.MAX_TRACKED_SHAPES:
+                    seen_shapes.add(shape)
+                new_columns.extend(self._add_columns(shape))
+
+        if self.infer_types:
+            self._observe_types(records)
+
+        return new_columns
+
+    def add_column(self, name: str, column_type: Optional[str] = None) -> List[str]:
+        """
+        Register a column that is added outside the observed records (e.g. metadata).
+
+        Args:
+            name: Column name
+            column_type: Optional known type, merged with any type already inferred
+
+        Returns:
+            List containing the column if it is new, otherwise empty
+        """
+        new_columns = self._add_columns((name,))
+        if self.infer_types and column_type:
+            self.columns[name] = merge_types(self.columns[name], column_type)
+        return new_columns
+
+    def merge(self, other: 'SchemaAccumulator') -> List[str]:
+        """
+        Merge another accumulator (from another file or worker) into this one.
+
+        Args:
+            other: Accumulator to merge
+
+        Returns:
+            List of columns that were new to this accumulator
+        """
+        self.records_observed += other.records_observed
+        new_columns = self._add_columns(other.columns)
+        if self.infer_types:
+            for name, column_type in other.columns.items():
+                self.columns[name] = merge_types(self.columns[name], column_type)
+        return new_columns
+
+    def missing_from(self, known_columns: Iterable[str]) -> List[str]:
+        """
+        Get the columns not present in a set of known (e.g. existing table) columns.
+
+        Args:
+            known_columns: Column names already present
+
+        Returns:
+            List of column names in first-seen order
+        """
+        known = set(known_columns)
+        return [name for name in self.columns if name not in known]
+
+    def text_conflicts(self, stored_types: Dict[str, str]) -> List[str]:
+        """
+        Get the columns stored with a numeric type that now hold values needing TEXT.
+
+        Args:
+            stored_types: Declared type per column of the existing table
+
+        Returns:
+            List of column names in first-seen order
+        """
+        if not self.infer_types:
+            return []
+        return [name for name, column_type in self.columns.items()
+                if stored_types.get(name) in NUMERIC_TYPES
+                and merge_types(stored_types[name], column_type) == DEFAULT_TYPE]
+
+    def to_schema(self, columns: Optional[Iterable[str]] = None,
+                  sort: bool = True) -> List[Dict[str, Any]]:
+        """
+        Build a create_table / add_columns schema from the accumulated columns.
+
+        Design Decision: TEXT-based storage for complete data preservation
+        Referenced in: Implementation section (page 21) - "All fields as TEXT"
+        With type inference the inferred types are used; columns that only
+        held nulls, or had conflicting values, stay TEXT.
+
+        Args:
+            columns: Optional subset of column names to include
+            sort: Sort columns by name (matches the original schema layout)
+
+        Returns:
+            List of column definitions
+        """
+        names = list(self.columns) if columns is None else [c for c in columns if c in self.columns]
+        if sort:
+            names.sort()
+        return [{'name': name, 'type': self.column_type(name), 'nullable': True}
+                for name in names]
+
+    def column_type(self, name: str) -> str:
+        """Get the storage type for a column (TEXT unless types are inferred)."""
+        if not self.infer_types:
+            return DEFAULT_TYPE
+        return self.columns.get(name) or DEFAULT_TYPE
+
+    def _observe_types(self, records: Iterable[Dict[str, Any]]):
+        """Fold the value types of a batch of records into the column types."""
+        columns = self.columns
+        value_types = VALUE_TYPES
+        for record in records:
+            for name, value in record.items():
+                if value is None:
+                    continue
+                observed = value_types.get(value.__class__, DEFAULT_TYPE)
+                current = columns[name]
+                if current != observed and current != DEFAULT_TYPE:
+                    columns[name] = merge_types(current, observed)
+
+    def _add_columns(self, names: Iterable[str]) -> List[str]:
+        """Add columns in order, returning the ones that were new."""
+        new_columns = []
+        for name in names:
+            if name not in self.columns:
+                self.columns[name] = None
+                new_columns.append(name)
+        return new_columns
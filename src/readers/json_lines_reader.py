@@ -0,0 +1,214 @@
+"""
+JSON Lines / NDJSON Reader for Generic Data Ingestion Framework.
+
+Parses one record per line in bounded batches. A malformed line is recorded
+with its line number and skipped, so one bad line never drops the whole file.
+Large files can be split into byte ranges that are read independently by
+parallel workers; every line belongs to exactly one range (the one containing
+its first byte).
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from processors.json_backend import get_backend
+from readers.mapped_file import advise_sequential
+
+
+# Extensions that hold one JSON document per line
+JSON_LINES_EXTENSIONS = ('.jsonl', '.ndjson')
+
+
+def is_json_lines_file(file_path: Union[str, Path]) -> bool:
+    """Check whether a file uses the JSON Lines format based on its extension."""
+    return Path(file_path).suffix.lower() in JSON_LINES_EXTENSIONS
+
+
+def split_byte_ranges(file_path: Union[str, Path],
+                      chunk_bytes: int) -> List[Tuple[int, Optional[int]]]:
+    """
+    Split a JSON Lines file into byte ranges for parallel reading.
+
+    Ranges do not need to fall on line boundaries; JSONLinesReader assigns each
+    line to the range that contains its first byte.
+
+    Args:
+        file_path: Path to the JSON Lines file
+        chunk_bytes: Target size of each range in bytes
+
+    Returns:
+        List of (start, end) offsets; the last range has end None (read to EOF)
+    """
+    size = os.path.getsize(file_path)
+    chunk_bytes = max(1, chunk_bytes)
+
+    if size <= chunk_bytes:
+        return [(0, None)]
+
+    starts = list(range(0, size, chunk_bytes))
+    return [(start, starts[i + 1] if i + 1 < len(starts) else None)
+            for i, start in enumerate(starts)]
+
+
+def format_line_errors(file_name: str, errors: List[Dict[str, Any]], error_count: int) -> List[str]:
+    """
+    Format line errors as '<file> line <n>: <message>' strings.
+
+    Args:
+        file_name: File name used as the message prefix
+        errors: Detailed errors ({'line', 'message'}) that are listed
+        error_count: Total number of bad lines, including those not listed
+
+    Returns:
+        List of messages, with a summary line when errors were truncated
+    """
+    messages = [f"{file_name} line {error['line']}: {error['message']}" for error in errors]
+
+    hidden = error_count - len(errors)
+    if hidden > 0:
+        messages.append(f"{file_name}: {hidden} more invalid lines not shown")
+
+    return messages
+
+
+class JSONLinesReader:
+    """
+    Streaming reader for JSON Lines (.jsonl) and NDJSON (.ndjson) files.
+
+    Usage:
+        reader = JSONLinesReader('events.ndjson')
+        for batch in reader.iter_batches(1000):
+            processor.process_data(batch)
+        for error in reader.errors:
+            print(error['line'], error['message'])
+    """
+
+    # Only the first few bad lines are kept in detail; the rest are counted
+    MAX_REPORTED_ERRORS = 10
+
+    def __init__(self, file_path: Union[str, Path], start: int = 0,
+                 end: Optional[int] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            file_path: Path to the JSON Lines file
+            start: Byte offset where this reader's range begins
+            end: Byte offset where the range ends (None reads to end of file)
+        """
+        self.file_path = Path(file_path)
+        self.start = max(0, start)
+        self.end = end
+        self.logger = logging.getLogger('data_ingestion.json_lines_reader')
+        self.backend = get_backend()
+
+        self.errors: List[Dict[str, Any]] = []
+        self.error_count = 0
+        self.lines_read = 0
+        self._first_line_number = 1 if self.start == 0 else None
+
+    def iter_records(self) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield (line_number, record) for every valid line in the range.
+
+        Blank lines are skipped; malformed lines are recorded in self.errors.
+        """
+        loads = self.backend.loads
+        with open(self.file_path, 'rb') as handle:
+            advise_sequential(handle.fileno(), self.start,
+                              self.end - self.start if self.end is not None else 0)
+            pos = self.start
+            if self.start > 0:
+                # Skip the tail of a line that started in the previous range
+                handle.seek(self.start - 1)
+                pos = self.start - 1 + len(handle.readline())
+
+            index = 0
+            while self.end is None or pos < self.end:
+                line = handle.readline()
+                if not line:
+                    break
+                pos += len(line)
+                index += 1
+
+                if not line.strip():
+                    continue
+
+                try:
+                    # Backends fall back to json.loads, which detects UTF-8/16/32
+                    # and a UTF-8 BOM from bytes
+                    record = loads(line)
+                except ValueError as e:
+                    self._record_error(index, e)
+                    continue
+
+                yield index, record
+
+            self.lines_read = index
+
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[Any]]:
+        """
+        Yield lists of up to batch_size parsed records.
+
+        Args:
+            batch_size: Maximum number of records per batch
+        """
+        batch_size = max(1, batch_size)
+        batch = []
+
+        for _, record in self.iter_records():
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def format_errors(self) -> List[str]:
+        """
+        Format recorded line errors as '<file> line <n>: <message>' strings.
+
+        Returns:
+            List of messages, with a summary line when errors were truncated
+        """
+        return format_line_errors(self.file_path.name, self.errors, self.error_count)
+
+    def _record_error(self, index: int, error: Exception):
+        """Record a bad line with its absolute line number."""
+        self.error_count += 1
+        if len(self.errors) >= self.MAX_REPORTED_ERRORS:
+            return
+
+        line_number = self._line_number_offset() + index
+        self.errors.append({'line': line_number, 'message': str(error)})
+        self.logger.debug(f"Invalid JSON on {self.file_path.name} line {line_number}: {error}")
+
+    def _line_number_offset(self) -> int:
+        """
+        Number of lines before this range, counted lazily on the first error.
+
+        Clean files never pay for counting the newlines in earlier ranges.
+        """
+        if self._first_line_number is None:
+            newlines = 0
+            with open(self.file_path, 'rb') as handle:
+                remaining = self.start
+                while remaining > 0:
+                    block = handle.read(min(remaining, 1024 * 1024))
+                    if not block:
+                        break
+                    newlines += block.count(b'\n')
+                    remaining -= len(block)
+
+                # A line straddling the range start belongs to the previous range
+                if self.start > 0:
+                    handle.seek(self.start - 1)
+                    if handle.read(1) != b'\n':
+                        newlines += 1
+
+            self._first_line_number = newlines + 1
+
+        return self._first_line_number - 1
@@ -0,0 +1,304 @@
+"""
+Incremental JSON Array Reader for Generic Data Ingestion Framework.
+
+Yields the elements of a top-level JSON array (or of an array nested under a
+configurable key path such as ``data.records``) one at a time, so the largest
+file that can be ingested is limited by disk space rather than memory. Only a
+bounded text window and the current element are held in memory at once.
+
+When a faster JSON backend is selected, files up to WHOLE_FILE_LIMIT bytes
+are memory-mapped and decoded in one call instead; anything that backend
+rejects is re-read incrementally so error messages stay the same.
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Union
+
+from processors.json_backend import JSONBackend, get_backend
+from readers.mapped_file import MAPPED_ENCODINGS, advise_sequential, map_file
+
+
+class JSONStreamError(ValueError):
+    """Raised when a streamed JSON document is malformed or the item path is missing."""
+    pass
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Characters at the end of the window that may belong to a truncated token
+# (covers '-Infinity', '\\uXXXX' escapes and numbers cut after '.' or 'e')
+_TRUNCATION_MARGIN = 16
+
+
+class _TextWindow:
+    """
+    Sliding window over a text file used by the incremental reader.
+
+    Keeps track of how many lines and columns have been discarded so that
+    parse errors report positions relative to the whole file.
+    """
+
+    def __init__(self, handle, chunk_size: int):
+        self.handle = handle
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+        # Position bookkeeping for error messages
+        self.chars_discarded = 0
+        self.lines_discarded = 0
+        self.column_offset = 0
+
+    def fill(self) -> bool:
+        """Read more text into the window. Returns False at end of file."""
+        if self.eof:
+            return False
+
+        # Grow reads when a single value spans the window to avoid rescanning
+        chunk = self.handle.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+
+        discarded = self.buffer[:self.pos]
+        if discarded:
+            newlines = discarded.count('\n')
+            if newlines:
+                self.lines_discarded += newlines
+                self.column_offset = len(discarded) - discarded.rfind('\n') - 1
+            else:
+                self.column_offset += len(discarded)
+            self.chars_discarded += len(discarded)
+
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self.fill():
+                break
+        return self.buffer[self.pos] if self.pos < len(self.buffer) else ''
+
+    def expect(self, char: str, message: str):
+        """Consume a structural character or raise a positioned error."""
+        if self.peek() != char:
+            self.error(message, self.pos)
+        self.pos += 1
+
+    def decode_value(self, decoder: json.JSONDecoder) -> Any:
+        """
+        Decode the next complete JSON value, reading more text as needed.
+
+        More text is only read when the value may have been cut off by the
+        window edge; a syntax error earlier in the window is raised at once,
+        so a malformed file is not read to the end first.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                # Unterminated strings report where the string starts
+                truncated = (e.pos >= len(self.buffer) - _TRUNCATION_MARGIN or
+                             e.msg.startswith('Unterminated string'))
+                if truncated and self.fill():
+                    continue
+                self.error(e.msg, e.pos)
+
+            # A number or literal ending at the window edge may be truncated
+            # ('12' of '123', or '1' of '1.5' cut after the '.')
+            if end >= len(self.buffer) - _TRUNCATION_MARGIN and self.fill():
+                continue
+
+            self.pos = end
+            return value
+
+    def error(self, message: str, buffer_pos: int):
+        """Raise a JSONStreamError positioned relative to the whole file."""
+        line_in_buffer = self.buffer.count('\n', 0, buffer_pos)
+        line = self.lines_discarded + line_in_buffer + 1
+        if line_in_buffer:
+            column = buffer_pos - self.buffer.rfind('\n', 0, buffer_pos)
+        else:
+            column = self.column_offset + buffer_pos + 1
+        char = self.chars_discarded + buffer_pos
+        raise JSONStreamError(f"{message}: line {line} column {column} (char {char})")
+
+
+class JSONArrayStreamReader:
+    """
+    Incremental reader for large JSON array documents.
+
+    Usage:
+        reader = JSONArrayStreamReader('orders.json', item_path='data')
+        for batch in reader.iter_batches(1000):
+            processor.process_data(batch)
+
+    A top-level value that is not an array (or a path that resolves to a
+    non-array value) is yielded as a single record, matching how the
+    application treats single-object files.
+    """
+
+    DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB of text per read
+    WHOLE_FILE_LIMIT = 16 * 1024 * 1024  # Largest file decoded in one call by a fast backend
+
+    def __init__(self, file_path: Union[str, Path], item_path: Optional[str] = None,
+                 encoding: str = 'utf-8-sig', chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the reader.
+
+        Args:
+            file_path: Path to the JSON file
+            item_path: Optional dotted key path to the array, e.g. 'data.records'
+            encoding: Text encoding of the file (BOM-tolerant UTF-8 by default)
+            chunk_size: Number of characters read from disk at a time
+        """
+        self.file_path = Path(file_path)
+        self.item_path = item_path
+        self.path_segments = [seg for seg in item_path.split('.') if seg] if item_path else []
+        self.encoding = encoding
+        self.chunk_size = max(1, chunk_size)
+        self.logger = logging.getLogger('data_ingestion.json_stream_reader')
+        self._decoder = json.JSONDecoder()
+        self.backend = get_backend()
+
+    def iter_records(self) -> Iterator[Any]:
+        """
+        Yield array elements one at a time.
+
+        Raises:
+            JSONStreamError: If the document is malformed or the item path is missing
+        """
+        records = self._load_whole_file()
+        if records is not None:
+            yield from records
+            return
+
+        with open(self.file_path, 'r', encoding=self.encoding) as handle:
+            advise_sequential(handle.fileno())
+            window = _TextWindow(handle, self.chunk_size)
+
+            yield from self._iter_value(window, self.path_segments)
+
+            # Reject trailing content the same way json.load does
+            if window.peek():
+                window.error("Extra data", window.pos)
+
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[Any]]:
+        """
+        Yield lists of up to batch_size array elements.
+
+        Args:
+            batch_size: Maximum number of records per batch
+        """
+        batch_size = max(1, batch_size)
+        batch = []
+
+        for record in self.iter_records():
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def _load_whole_file(self) -> Optional[list]:
+        """
+        Decode a small file in one call with a fast backend.
+
+        Returns:
+            The file's records, or None when the incremental reader should be used
+            (stdlib backend, large file, other encoding, or any decode/path problem)
+        """
+        if type(self.backend) is JSONBackend or self.encoding.lower() not in MAPPED_ENCODINGS:
+            return None
+
+        try:
+            if self.file_path.stat().st_size > self.WHOLE_FILE_LIMIT:
+                return None
+            # Parsed from the mapped pages: no read buffer and no decoded copy
+            with map_file(self.file_path, strip_bom=self.encoding.lower() == 'utf-8-sig') as content:
+                value = self.backend.loads(content)
+        except (OSError, ValueError):
+            return None
+
+        for segment in self.path_segments:
+            if not isinstance(value, dict) or segment not in value:
+                return None
+            value = value[segment]
+
+        return value if isinstance(value, list) else [value]
+
+    def _iter_value(self, window: _TextWindow, segments: List[str]) -> Iterator[Any]:
+        """Yield the records of the value at the current position."""
+        char = window.peek()
+
+        if segments:
+            if char != '{':
+                window.error(f"Item path '{self.item_path}' requires an object", window.pos)
+            yield from self._iter_object_path(window, segments)
+        elif char == '[':
+            yield from self._iter_array(window)
+        else:
+            yield window.decode_value(self._decoder)
+
+    def _iter_array(self, window: _TextWindow) -> Iterator[Any]:
+        """Yield each element of the array starting at the current position."""
+        window.expect('[', "Expecting '['")
+
+        if window.peek() == ']':
+            window.pos += 1
+            return
+
+        while True:
+            yield window.decode_value(self._decoder)
+
+            char = window.peek()
+            if char == ',':
+                window.pos += 1
+            elif char == ']':
+                window.pos += 1
+                return
+            else:
+                window.error("Expecting ',' delimiter", window.pos)
+
+    def _iter_object_path(self, window: _TextWindow, segments: List[str]) -> Iterator[Any]:
+        """Walk an object, descending into the key named by the first path segment."""
+        window.expect('{', "Expecting '{'")
+        found = False
+
+        if window.peek() == '}':
+            window.pos += 1
+        else:
+            while True:
+                if window.peek() != '"':
+                    window.error("Expecting property name enclosed in double quotes", window.pos)
+                key = window.decode_value(self._decoder)
+                window.expect(':', "Expecting ':' delimiter")
+
+                if key == segments[0] and not found:
+                    found = True
+                    yield from self._iter_value(window, segments[1:])
+                else:
+                    # Sibling values are decoded and discarded one at a time
+                    window.decode_value(self._decoder)
+
+                char = window.peek()
+                if char == ',':
+                    window.pos += 1
+                elif char == '}':
+                    window.pos += 1
+                    break
+                else:
+                    window.error("Expecting ',' delimiter", window.pos)
+
+        if not found:
+            raise JSONStreamError(f"Item path '{self.item_path}' not found in {self.file_path.name}")
@@ -0,0 +1,90 @@
+"""
+Memory-Mapped File Access for Generic Data Ingestion Framework.
+
+Reading a JSON file in text mode holds it twice: the bytes read from disk and
+the decoded str handed to the parser. map_file() instead maps the file and
+exposes its pages as a read-only memoryview, which orjson parses directly, so
+UTF-8 input is never copied or decoded before parsing. (The stdlib json
+module only parses str; its backend decodes the view once, which still skips
+the read buffer.)
+
+On Linux the kernel is told the file will be read front to back
+(posix_fadvise / madvise SEQUENTIAL), so readahead is more aggressive and
+pages already parsed can be dropped early. The hints are best effort and
+silently skipped where the platform or file system does not support them.
+"""
+
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+
+# Encodings whose bytes can be handed to the parser as they are
+MAPPED_ENCODINGS = ('utf-8', 'utf-8-sig')
+
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+
+def advise_sequential(fd: int, offset: int = 0, length: int = 0):
+    """
+    Hint that a file descriptor will be read sequentially (no-op where unsupported).
+
+    Args:
+        fd: Open file descriptor
+        offset: Start of the region that will be read
+        length: Length of the region; 0 means to the end of the file
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fd, offset, length, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        # e.g. pipes, or file systems that reject the hint
+        pass
+
+
+@contextmanager
+def map_file(file_path: Union[str, Path], strip_bom: bool = True) -> Iterator[memoryview]:
+    """
+    Map a file read-only and yield its contents as a memoryview.
+
+    The view is only valid inside the with block; parse it there and keep
+    the decoded values, not the view.
+
+    Args:
+        file_path: File to map
+        strip_bom: Leave a leading UTF-8 byte order mark out of the view
+
+    Yields:
+        memoryview over the file's bytes (empty for an empty file)
+
+    Raises:
+        OSError: If the file cannot be opened or mapped
+    """
+    with open(file_path, 'rb') as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0:
+            # Empty files cannot be mapped
+            yield memoryview(b'')
+            return
+
+        advise_sequential(handle.fileno())
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if hasattr(mapped, 'madvise'):
+                try:
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            view = memoryview(mapped)
+            content = view[len(_UTF8_BOM):] if strip_bom and view[:3] == _UTF8_BOM else view
+            try:
+                yield content
+            finally:
+                # The map can only be closed once no view exports its buffer
+                content.release()
+                view.release()
+        finally:
+            mapped.close()
@@ -0,0 +1,176 @@
+"""
+Persistent Directory Index for FileScanner.
+
+Remembers, per directory, its modification time and what it contained: the
+names of its subdirectories and its files (with sizes for files of a
+supported type). Adding, removing or renaming an entry changes a directory's
+mtime, so a directory whose mtime is unchanged since the last scan can be
+taken from the index instead of being listed again.
+
+The index is a small SQLite file, separate from the output database so it
+can be shared by runs writing to different targets. Listings are stored raw
+(before ignore/include/exclude patterns are applied), so changing patterns
+between runs does not invalidate it.
+
+Limits: a file rewritten in place does not change its directory's mtime, so
+sizes taken from the index can be stale (the file list itself is not); and a
+directory modified within MTIME_GRACE_SECONDS of being listed is not stored,
+because a later change in the same mtime tick would go unnoticed.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+
+# Directories changed this recently are re-listed next time (coarse mtime clocks)
+MTIME_GRACE_SECONDS = 2
+
+# File entry as stored: name and size (None for files of unsupported types)
+FileRow = Tuple[str, Optional[int]]
+
+
+class IndexedEntry:
+    """
+    File entry restored from the index, standing in for an os.DirEntry.
+
+    Only the size is recorded, so stat() returns the entry itself with
+    st_size set.
+    """
+
+    __slots__ = ('name', 'path', 'st_size')
+
+    def __init__(self, name: str, path: str, size: Optional[int]):
+        self.name = name
+        self.path = path
+        self.st_size = size
+
+    def stat(self) -> 'IndexedEntry':
+        """Recorded size as st_size (raises OSError if it was never recorded)."""
+        if self.st_size is None:
+            raise OSError(f"Size of {self.path} not recorded in the scan index")
+        return self
+
+
+class DirectoryIndex:
+    """
+    Directory listings cached by directory mtime.
+
+    Usage:
+        index = DirectoryIndex('scan_index.db')
+        listing = index.lookup(directory, mtime_ns)      # None: list it
+        index.record(directory, mtime_ns, subdirectories, files)
+        index.save(root, prune=True)
+
+    lookup() and record() only touch in-memory state and may be called from
+    scanner worker threads; save() writes to disk from the scanning thread.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the index and load it into memory.
+
+        Args:
+            path: SQLite file holding the index
+        """
+        self.path = str(path)
+        self.logger = logging.getLogger('data_ingestion.directory_index')
+        self._entries: Dict[str, Tuple[int, str, str]] = {}
+        self._updates: Dict[str, Tuple[int, str, str]] = {}
+        self._visited: Set[str] = set()
+
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS directory_index ("
+                    "directory TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, "
+                    "subdirectories TEXT NOT NULL, files TEXT NOT NULL)"
+                )
+            for directory, mtime_ns, subdirectories, files in connection.execute(
+                    "SELECT directory, mtime_ns, subdirectories, files FROM directory_index"):
+                self._entries[directory] = (mtime_ns, subdirectories, files)
+        finally:
+            connection.close()
+        self.logger.debug(f"Loaded {len(self._entries)} directories from scan index {self.path}")
+
+    def __len__(self) -> int:
+        """Number of directories in the index."""
+        return len(self._entries)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connection to the index file."""
+        return sqlite3.connect(self.path)
+
+    def lookup(self, directory: str, mtime_ns: int) -> Optional[Tuple[List[str], List[FileRow]]]:
+        """
+        Cached listing of a directory, if it has not changed.
+
+        Args:
+            directory: Absolute directory path
+            mtime_ns: Current modification time of the directory
+
+        Returns:
+            (subdirectory names, file rows) or None when the directory must be listed
+        """
+        self._visited.add(directory)
+        entry = self._entries.get(directory)
+        if entry is None or entry[0] != mtime_ns:
+            return None
+        files = [(name, size) for name, size in json.loads(entry[2])]
+        return json.loads(entry[1]), files
+
+    def record(self, directory: str, mtime_ns: int, subdirectories: List[str], files: List[FileRow]):
+        """
+        Store a fresh listing (kept in memory until save()).
+
+        Args:
+            directory: Absolute directory path
+            mtime_ns: Modification time the listing belongs to
+            subdirectories: Names of subdirectories (symlinks excluded)
+            files: (name, size or None) for each file
+        """
+        self._visited.add(directory)
+        if time.time_ns() - mtime_ns < MTIME_GRACE_SECONDS * 1_000_000_000:
+            return
+        self._updates[directory] = (mtime_ns, json.dumps(subdirectories), json.dumps(files))
+
+    def save(self, root: str, prune: bool = True):
+        """
+        Write new listings and drop directories that no longer exist.
+
+        Args:
+            root: Root of the scan that just finished
+            prune: Remove entries under root that the scan did not visit
+                (only valid after a full recursive scan)
+        """
+        removed = []
+        if prune:
+            prefix = os.path.join(root, '')
+            removed = [directory for directory in self._entries
+                       if (directory == root or directory.startswith(prefix))
+                       and directory not in self._visited]
+
+        if self._updates or removed:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO directory_index (directory, mtime_ns, subdirectories, files) "
+                        "VALUES (?, ?, ?, ?)",
+                        [(directory,) + entry for directory, entry in self._updates.items()]
+                    )
+                    connection.executemany("DELETE FROM directory_index WHERE directory = ?",
+                                           [(directory,) for directory in removed])
+            finally:
+                connection.close()
+
+        self.logger.debug(f"Scan index: {len(self._updates)} directories updated, {len(removed)} removed")
+        self._entries.update(self._updates)
+        for directory in removed:
+            del self._entries[directory]
+        self._updates = {}
+        self._visited = set()
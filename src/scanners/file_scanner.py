@@ -1,9 +1,13 @@
 import logging
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Generator, Tuple
-import fnmatch
 from collections import defaultdict
 import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from scanners.directory_index import DirectoryIndex, IndexedEntry
+from scanners.pattern_matcher import PatternMatcher
 
 
 class FileScanner:
@@ -29,7 +33,9 @@ class FileScanner:
         '.pqt': 'parquet'
     }
 
-    # File patterns to ignore
+    # File and directory names to ignore (matching directories are not descended into);
+    # see scanners.pattern_matcher for the pattern forms accepted here and in
+    # include/exclude patterns
     IGNORE_PATTERNS = [
         '.*',  # Hidden files
         '~*',  # Backup files
@@ -43,12 +49,15 @@ class FileScanner:
         '.DS_Store'  # macOS metadata
     ]
 
-    def __init__(self, root_directory: str):
+    def __init__(self, root_directory: str, index_path: Optional[str] = None):
         """
         Initialize file scanner
 
         Args:
             root_directory (str): Root directory to scan
+            index_path (str, optional): Persistent directory index file; when
+                given, directories whose mtime is unchanged since the previous
+                scan are taken from the index instead of being listed
         """
         self.root_directory = Path(root_directory).resolve()
         self.logger = logging.getLogger('data_ingestion.file_scanner')
@@ -56,13 +65,22 @@ class FileScanner:
         # Validate root directory
         self._validate_root_directory()
 
+        self.index = DirectoryIndex(index_path) if index_path else None
+
+        # Size in bytes of every file classified by the last scan
+        self.file_sizes: Dict[Path, int] = {}
+
         # Statistics
         self.scan_stats = {
             'directories_scanned': 0,
+            'directories_pruned': 0,
+            'directories_from_index': 0,
             'files_found': 0,
             'files_classified': 0,
             'files_ignored': 0,
-            'errors_encountered': 0
+            'errors_encountered': 0,
+            'bytes_classified': 0,
+            'scan_seconds': 0.0
         }
 
     def _validate_root_directory(self):
@@ -80,7 +98,9 @@ class FileScanner:
     def discover_files(self, file_types: List[str] = None,
                        recursive: bool = True,
                        include_patterns: List[str] = None,
-                       exclude_patterns: List[str] = None) -> Dict[str, List[Path]]:
+                       exclude_patterns: List[str] = None,
+                       threads: int = 1,
+                       ordered: bool = False) -> Dict[str, List[Path]]:
         """
         Discover and classify files in the directory
 
@@ -88,86 +108,301 @@ class FileScanner:
             file_types (List[str], optional): File types to include
             recursive (bool): Whether to scan subdirectories
             include_patterns (List[str], optional): Patterns to include
-            exclude_patterns (List[str], optional): Additional patterns to exclude
+            exclude_patterns (List[str], optional): Additional patterns to exclude;
+                like IGNORE_PATTERNS they also prune matching directories.
+                Patterns are basenames ('*.tmp'), paths relative to the root
+                ('archive/2023/*') or directory components ('build/')
+            threads (int): Directories listed concurrently. Above 1 a thread
+                pool lists subdirectories in parallel, which hides per-call
+                latency on network file systems (NFS, SMB); files and
+                statistics are the same as with the serial walk
+            ordered (bool): Sort each type's files by path, so the result
+                does not depend on listing order or thread timing
 
         Returns:
             Dict[str, List[Path]]: Dictionary mapping file types to file paths
         """
+        if file_types is None:
+            file_types = list(set(self.FILE_TYPE_MAPPINGS.values()))
+
+        discovered_files = {file_type: [] for file_type in file_types}
+        for file_type, file_path in self.iter_files(file_types, recursive, include_patterns,
+                                                    exclude_patterns, threads):
+            discovered_files[file_type].append(file_path)
+
+        if ordered:
+            for file_list in discovered_files.values():
+                file_list.sort()
+
+        return discovered_files
+
+    def iter_files(self, file_types: List[str] = None,
+                   recursive: bool = True,
+                   include_patterns: List[str] = None,
+                   exclude_patterns: List[str] = None,
+                   threads: int = 1) -> Generator[Tuple[str, Path], None, None]:
+        """
+        Discover and classify files, yielding each one as soon as it is found
+
+        Lets processing start while the rest of the tree is still being
+        listed. Arguments are those of discover_files. Statistics are reset
+        when iteration starts and complete once the iterator is exhausted
+        (the directory index is saved then too); scan_seconds only counts
+        time spent scanning, not time the consumer spends between files.
+        file_sizes maps each yielded file to the size read while scanning.
+
+        Yields:
+            Tuple[str, Path]: File type and file path, in listing order
+        """
         self.logger.info(f"Starting file discovery in: {self.root_directory}")
 
         # Reset statistics
         self._reset_stats()
+        self.file_sizes = {}
+        elapsed = 0.0
+        resumed = time.perf_counter()
 
         # Set default file types
         if file_types is None:
             file_types = list(set(self.FILE_TYPE_MAPPINGS.values()))
+        type_counts = {file_type: 0 for file_type in file_types}
 
-        # Initialize results
-        discovered_files = {file_type: [] for file_type in file_types}
-
-        # Combine exclude patterns
-        all_exclude_patterns = self.IGNORE_PATTERNS.copy()
-        if exclude_patterns:
-            all_exclude_patterns.extend(exclude_patterns)
+        # Compile ignore, exclude and include patterns once for the whole scan
+        exclude = PatternMatcher.compile(tuple(self.IGNORE_PATTERNS) + tuple(exclude_patterns or ()))
+        include = PatternMatcher.compile(tuple(include_patterns)) if include_patterns else None
+        needs_path = exclude.needs_path or (include is not None and include.needs_path)
 
         try:
             # Scan files
-            for file_path in self._scan_directory(recursive):
+            for entry in self._scan_directory(recursive, exclude, threads):
                 self.scan_stats['files_found'] += 1
+                relative_path = self._relative_path(entry.path) if needs_path else None
 
                 # Check if file should be ignored
-                if self._should_ignore_file(file_path, all_exclude_patterns):
+                if exclude.matches(entry.name, relative_path):
                     self.scan_stats['files_ignored'] += 1
                     continue
 
                 # Check include patterns if specified
-                if include_patterns and not self._matches_patterns(file_path, include_patterns):
+                if include is not None and not include.matches(entry.name, relative_path):
                     continue
 
-                # Classify file
-                file_type = self._classify_file(file_path)
+                # Classify file (a Path is only built for files that are kept)
+                file_type = self.FILE_TYPE_MAPPINGS.get(os.path.splitext(entry.name)[1].lower())
 
-                if file_type and file_type in file_types:
-                    discovered_files[file_type].append(file_path)
+                if file_type and file_type in type_counts:
+                    type_counts[file_type] += 1
                     self.scan_stats['files_classified'] += 1
-                    self.logger.debug(f"Classified {file_type}: {file_path.name}")
+                    file_path = Path(entry.path)
+                    size = self._file_size(entry)
+                    self.scan_stats['bytes_classified'] += size
+                    self.file_sizes[file_path] = size
+                    self.logger.debug(f"Classified {file_type}: {entry.name}")
 
-            # Log results
-            self._log_discovery_results(discovered_files)
+                    elapsed += time.perf_counter() - resumed
+                    self.scan_stats['scan_seconds'] = elapsed
+                    yield file_type, file_path
+                    resumed = time.perf_counter()
+
+            if self.index is not None:
+                # A non-recursive scan did not visit subdirectories, so keep their entries
+                self.index.save(str(self.root_directory), prune=recursive)
+
+            self.scan_stats['scan_seconds'] = elapsed + time.perf_counter() - resumed
 
-            return discovered_files
+            # Log results
+            self._log_discovery_results(type_counts)
 
         except Exception as e:
             self.scan_stats['errors_encountered'] += 1
             self.logger.error(f"Error during file discovery: {e}")
             raise
 
-    def _scan_directory(self, recursive: bool) -> Generator[Path, None, None]:
+    def _scan_directory(self, recursive: bool,
+                        exclude: Optional[PatternMatcher] = None,
+                        threads: int = 1) -> Generator[os.DirEntry, None, None]:
         """
-        Scan directory and yield file paths
+        Walk the directory tree with os.scandir and yield file entries
+
+        The file type cached on each DirEntry is used, so listing a directory
+        costs no stat call per entry. Subdirectories whose name matches an
+        exclude pattern (.git, node_modules, __pycache__, ...) are pruned
+        without being listed, and symlinked directories are not followed.
+        Directories that cannot be read are logged and skipped.
 
         Args:
             recursive (bool): Whether to scan recursively
+            exclude (PatternMatcher, optional): Patterns of directories to prune
+            threads (int): Directories listed concurrently (1 walks serially)
 
         Yields:
-            Path: File paths found
+            os.DirEntry: File entries found (name, path and cached stat)
         """
-        if recursive:
-            pattern = "**/*"
-        else:
-            pattern = "*"
+        if threads > 1 and recursive:
+            yield from self._scan_directory_parallel(exclude, threads)
+            return
+
+        pending = [str(self.root_directory)]
+
+        while pending:
+            files, subdirectories, counts = self._list_directory(pending.pop(), recursive, exclude)
+            self._add_counts(counts)
+            yield from files
+
+            # Depth first, visiting subdirectories in listing order
+            pending.extend(reversed(subdirectories))
+
+    def _scan_directory_parallel(self, exclude: Optional[PatternMatcher],
+                                 threads: int) -> Generator[os.DirEntry, None, None]:
+        """
+        Walk the directory tree listing up to `threads` directories at once
+
+        Each listed subdirectory is submitted to the pool as soon as its parent
+        has been read; entries are yielded (and statistics counted) on the
+        calling thread as listings complete, so the order varies between runs.
+
+        Args:
+            exclude (PatternMatcher, optional): Patterns of directories to prune
+            threads (int): Maximum directories listed concurrently
+
+        Yields:
+            os.DirEntry: File entries found
+        """
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix='file-scan') as pool:
+            running = {pool.submit(self._list_directory, str(self.root_directory), True, exclude, True)}
+
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirectories, counts = future.result()
+                    self._add_counts(counts)
+                    for subdirectory in subdirectories:
+                        running.add(pool.submit(self._list_directory, subdirectory, True, exclude, True))
+                    yield from files
+
+    def _list_directory(self, directory: str, recursive: bool,
+                        exclude: Optional[PatternMatcher] = None,
+                        prefetch_sizes: bool = False) -> Tuple[List[os.DirEntry], List[str], Dict[str, int]]:
+        """
+        List one directory, or take its listing from the directory index
+        when its mtime is unchanged since it was last listed
+
+        Safe to call from worker threads: statistics are returned rather than
+        updated here.
+
+        Args:
+            directory (str): Directory to list
+            recursive (bool): Whether subdirectories are returned for descent
+            exclude (PatternMatcher, optional): Patterns of directories to prune
+            prefetch_sizes (bool): Stat files with a supported extension now,
+                so their size is cached on the DirEntry for the calling thread
+
+        Returns:
+            Tuple: File entries, subdirectory paths to descend into, and
+            counts to add to scan_stats
+        """
+        files = []
+        subdirectories = []
+        counts = {'directories_scanned': 0, 'directories_pruned': 0,
+                  'directories_from_index': 0, 'errors_encountered': 0}
+        needs_path = exclude is not None and exclude.needs_path
 
         try:
-            for path in self.root_directory.glob(pattern):
-                if path.is_file():
-                    yield path
-                elif path.is_dir() and recursive:
-                    self.scan_stats['directories_scanned'] += 1
+            listing = None
+            if self.index is not None:
+                mtime_ns = os.stat(directory).st_mtime_ns
+                listing = self.index.lookup(directory, mtime_ns)
+
+            if listing is not None:
+                counts['directories_from_index'] += 1
+                subdirectory_names, file_rows = listing
+                files = [IndexedEntry(name, os.path.join(directory, name), size) for name, size in file_rows]
+            else:
+                subdirectory_names, file_rows = self._read_directory(directory, counts, prefetch_sizes)
+                files = [entry for entry, _ in file_rows]
+                if self.index is not None:
+                    self.index.record(directory, mtime_ns, subdirectory_names,
+                                      [(entry.name, size) for entry, size in file_rows])
+            counts['directories_scanned'] += 1
         except PermissionError as e:
+            counts['errors_encountered'] += 1
             self.logger.warning(f"Permission denied accessing: {e}")
-        except Exception as e:
-            self.logger.error(f"Error scanning directory: {e}")
-            raise
+            return files, subdirectories, counts
+        except FileNotFoundError as e:
+            # Removed while the scan was running
+            self.logger.warning(f"Directory vanished during scan: {e}")
+            return files, subdirectories, counts
+
+        if recursive:
+            for name in subdirectory_names:
+                path = os.path.join(directory, name)
+                if exclude and exclude.matches(name, self._relative_path(path) if needs_path else None,
+                                               is_dir=True):
+                    counts['directories_pruned'] += 1
+                    continue
+                subdirectories.append(path)
+
+        return files, subdirectories, counts
+
+    def _read_directory(self, directory: str, counts: Dict[str, int],
+                        prefetch_sizes: bool) -> Tuple[List[str], List[Tuple[os.DirEntry, Optional[int]]]]:
+        """
+        Read one directory with os.scandir
+
+        Args:
+            directory (str): Directory to read
+            counts (Dict[str, int]): Counts of the listing (errors are added)
+            prefetch_sizes (bool): Stat files with a supported extension now
+
+        Returns:
+            Tuple: Subdirectory names (symlinks excluded) and file entries with
+            their size when it was read (supported types only)
+        """
+        subdirectory_names = []
+        file_rows = []
+        record_sizes = prefetch_sizes or self.index is not None
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectory_names.append(entry.name)
+                    elif entry.is_file():
+                        size = None
+                        if record_sizes and \
+                                os.path.splitext(entry.name)[1].lower() in self.FILE_TYPE_MAPPINGS:
+                            try:
+                                size = entry.stat().st_size
+                            except OSError:
+                                pass
+                        file_rows.append((entry, size))
+                except OSError as e:
+                    counts['errors_encountered'] += 1
+                    self.logger.warning(f"Cannot read entry {entry.path}: {e}")
+
+        return subdirectory_names, file_rows
+
+    def _add_counts(self, counts: Dict[str, int]):
+        """Add the counts returned by _list_directory to scan_stats"""
+        for key, value in counts.items():
+            self.scan_stats[key] += value
+
+    def _relative_path(self, path: str) -> str:
+        """'/'-separated path of a scanned entry relative to the root directory"""
+        prefix = os.path.join(str(self.root_directory), '')
+        if path.startswith(prefix):
+            relative = path[len(prefix):]
+        else:
+            relative = os.path.relpath(path, self.root_directory)
+        return relative if os.sep == '/' else relative.replace(os.sep, '/')
+
+    @staticmethod
+    def _file_size(file_path) -> int:
+        """Size of a file (Path or os.DirEntry) in bytes (0 if it vanished since it was listed)"""
+        try:
+            return file_path.stat().st_size
+        except OSError:
+            return 0
 
     def _classify_file(self, file_path: Path) -> Optional[str]:
         """
@@ -193,13 +428,15 @@ class FileScanner:
         Returns:
             bool: True if file should be ignored
         """
-        filename = file_path.name
+        return self._path_matches(file_path, exclude_patterns)
 
-        for pattern in exclude_patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-
-        return False
+    def _path_matches(self, file_path: Path, patterns: List[str]) -> bool:
+        """Match a file path against patterns, compiled once per pattern list"""
+        matcher = PatternMatcher.compile(tuple(patterns))
+        relative_path = None
+        if matcher.needs_path:
+            relative_path = self._relative_path(str(file_path))
+        return matcher.matches(file_path.name, relative_path)
 
     def _matches_patterns(self, file_path: Path, patterns: List[str]) -> bool:
         """
@@ -212,13 +449,7 @@ class FileScanner:
         Returns:
             bool: True if file matches any pattern
         """
-        filename = file_path.name
-
-        for pattern in patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-
-        return False
+        return self._path_matches(file_path, patterns)
 
     def get_file_details(self, file_path: Path) -> Dict:
         """
@@ -311,25 +542,31 @@ class FileScanner:
         """Reset scan statistics"""
         self.scan_stats = {
             'directories_scanned': 0,
+            'directories_pruned': 0,
+            'directories_from_index': 0,
             'files_found': 0,
             'files_classified': 0,
             'files_ignored': 0,
-            'errors_encountered': 0
+            'errors_encountered': 0,
+            'bytes_classified': 0,
+            'scan_seconds': 0.0
         }
 
-    def _log_discovery_results(self, discovered_files: Dict[str, List[Path]]):
+    def _log_discovery_results(self, type_counts: Dict[str, int]):
         """Log discovery results"""
-        total_discovered = sum(len(files) for files in discovered_files.values())
 
         self.logger.info(f"File discovery completed:")
         self.logger.info(f"  Total files found: {self.scan_stats['files_found']}")
         self.logger.info(f"  Files classified: {self.scan_stats['files_classified']}")
         self.logger.info(f"  Files ignored: {self.scan_stats['files_ignored']}")
         self.logger.info(f"  Directories scanned: {self.scan_stats['directories_scanned']}")
+        self.logger.info(f"  Directories pruned: {self.scan_stats['directories_pruned']}")
+        if self.index is not None:
+            self.logger.info(f"  Directories from index: {self.scan_stats['directories_from_index']}")
 
-        for file_type, files in discovered_files.items():
-            if files:
-                self.logger.info(f"  {file_type.upper()}: {len(files)} files")
+        for file_type, count in type_counts.items():
+            if count:
+                self.logger.info(f"  {file_type.upper()}: {count} files")
 
     def get_scan_statistics(self) -> Dict:
         """
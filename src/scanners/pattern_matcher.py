@@ -0,0 +1,112 @@
+"""
+Precompiled include/exclude pattern matching for FileScanner.
+
+A list of fnmatch-style patterns is compiled once into at most three regular
+expressions, so testing an entry costs one regex match per pattern kind
+instead of one fnmatch call per pattern. Three kinds of pattern are
+supported:
+
+    *.tmp, .git*       basename: matched against the file or directory name
+    archive/2023/*     full path: contains '/', matched against the path
+                       relative to the scan root (a leading '/' is ignored)
+    build/, logs_*/    directory component: ends with '/', matches a
+                       directory of that name and everything beneath it
+
+As with fnmatch, '*' also matches '/' inside full-path patterns, and names
+are compared case-insensitively where the platform's paths are.
+"""
+
+import fnmatch
+import os
+import re
+from functools import lru_cache
+from typing import Iterable, Optional, Pattern, Tuple
+
+
+# Case-insensitive file systems (Windows) match names regardless of case, as fnmatch does
+_FLAGS = re.IGNORECASE if os.path.normcase('A') != 'A' else 0
+
+
+def _compile(patterns: Iterable[str]) -> Optional[Pattern]:
+    """Combine fnmatch patterns into one regex (None when there are none)."""
+    translated = [fnmatch.translate(pattern) for pattern in patterns]
+    if not translated:
+        return None
+    return re.compile('|'.join(translated), _FLAGS)
+
+
+class PatternMatcher:
+    """
+    Matches directory entries against a compiled set of patterns.
+
+    Usage:
+        matcher = PatternMatcher.compile(['.*', '*.tmp', 'archive/old/*', 'build/'])
+        matcher.matches('notes.tmp', 'sub/notes.tmp')        # True
+        matcher.matches('build', 'src/build', is_dir=True)   # True
+        matcher.needs_path                                   # True: pass relative paths
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Compile patterns.
+
+        Args:
+            patterns: fnmatch-style basename, full-path or directory-component patterns
+        """
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+
+        names, paths, directories = [], [], []
+        for pattern in self.patterns:
+            if pattern.endswith('/'):
+                directories.append(pattern.rstrip('/'))
+            elif '/' in pattern:
+                paths.append(pattern.lstrip('/'))
+            else:
+                names.append(pattern)
+
+        self._names = _compile(names)
+        self._paths = _compile(paths)
+        self._directories = _compile(directories)
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def compile(cls, patterns: Tuple[str, ...]) -> 'PatternMatcher':
+        """Matcher for a tuple of patterns, compiled once and reused."""
+        return cls(patterns)
+
+    def __bool__(self) -> bool:
+        """False for a matcher without patterns."""
+        return bool(self.patterns)
+
+    @property
+    def needs_path(self) -> bool:
+        """Whether matches() needs the relative path (full-path or directory patterns)."""
+        return self._paths is not None or self._directories is not None
+
+    def matches(self, name: str, relative_path: Optional[str] = None, is_dir: bool = False) -> bool:
+        """
+        Check an entry against the patterns.
+
+        Args:
+            name: Entry name (no directory part)
+            relative_path: '/'-separated path from the scan root, needed only
+                when needs_path is True
+            is_dir: Whether the entry is a directory
+
+        Returns:
+            bool: True if any pattern matches
+        """
+        if self._names is not None and self._names.match(name):
+            return True
+        if relative_path is None:
+            return False
+        if self._paths is not None and self._paths.match(relative_path):
+            return True
+        if self._directories is not None:
+            components = relative_path.split('/')
+            if not is_dir:
+                components.pop()
+            for component in components:
+                if self._directories.match(component):
+                    return True
+        return False
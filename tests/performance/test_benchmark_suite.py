@@ -0,0 +1,86 @@
+import unittest
+import tempfile
+import shutil
+import json
+from pathlib import Path
+import sys
+import os
+
+# Add repository root (benchmarks package) and src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from benchmarks.data_generator import DatasetGenerator, parse_size
+from benchmarks.suite import STAGES, compare_reports, run_case
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_generator_is_deterministic(self):
+        """Same parameters and seed give byte-identical files; records are split over files."""
+        params = dict(records=1001, width=8, nesting=2, heterogeneity=0.5, files=3)
+
+        first = DatasetGenerator(**params).write(self.test_dir / "a")
+        second = DatasetGenerator(**params).write(self.test_dir / "b")
+
+        self.assertEqual(first['bytes'], second['bytes'])
+        for path_a, path_b in zip(first['paths'], second['paths']):
+            self.assertEqual(Path(path_a).read_bytes(), Path(path_b).read_bytes())
+
+        records = [record for path in first['paths'] for record in json.loads(Path(path).read_text())]
+        self.assertEqual([record['id'] for record in records], list(range(1, 1002)))
+        # Heterogeneous fields vary their key names between records
+        self.assertGreater(len({key for record in records for key in record}), 9)
+
+    def test_parse_size_presets(self):
+        """Presets and plain counts are accepted; non-positive sizes are rejected."""
+        self.assertEqual(parse_size('10k'), 10_000)
+        self.assertEqual(parse_size('10M'), 10_000_000)
+        self.assertEqual(parse_size('2500'), 2500)
+        with self.assertRaises(ValueError):
+            parse_size(0)
+
+    def test_run_case_reports_every_stage(self):
+        """A small case reports records/sec and bytes/sec for each stage and end to end."""
+        generator = DatasetGenerator(records=500, width=6, heterogeneity=0.3, files=2, file_format='jsonl')
+
+        report = run_case(generator, batch_size=100, work_dir=self.test_dir, streaming=True)
+
+        self.assertEqual(report['dataset']['records'], 500)
+        self.assertEqual(set(report['stages']), set(STAGES))
+        for figures in list(report['stages'].values()) + [report['end_to_end']]:
+            self.assertIn('records_per_second', figures)
+            self.assertIn('bytes_per_second', figures)
+        self.assertTrue(report['end_to_end']['options']['streaming'])
+
+    def test_run_case_creates_missing_work_dir(self):
+        """A work directory that does not exist yet is created rather than failing."""
+        work_dir = self.test_dir / "new" / "work"
+
+        report = run_case(DatasetGenerator(records=50, width=3), end_to_end=False, work_dir=work_dir)
+
+        self.assertEqual(report['dataset']['records'], 50)
+        self.assertTrue(work_dir.is_dir())
+
+    def test_compare_reports_flags_regressions(self):
+        """Stages slower than the tolerance allows are reported as regressions."""
+        def report(decode_rps, insert_rps):
+            return {'cases': {'case': {'stages': {
+                'decode': {'seconds': 1.0, 'records_per_second': decode_rps},
+                'insert': {'seconds': 1.0, 'records_per_second': insert_rps},
+            }}}}
+
+        comparison = compare_reports(report(80.0, 130.0), report(100.0, 100.0), tolerance=0.1)
+
+        statuses = {entry['stage']: entry['status'] for entry in comparison['comparisons']}
+        self.assertEqual(statuses, {'decode': 'regression', 'insert': 'improvement'})
+        self.assertEqual(comparison['regressions'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
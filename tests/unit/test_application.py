@@ -129,6 +129,454 @@ class TestDataIngestionApplication(unittest.TestCase):
         preview = self.app.get_database_preview(self.test_db.name, "processed_data")
         self.assertEqual(len(preview), 2)
         
+    def test_process_directory_streaming_mode(self):
+        """Test streaming mode writes every file and widens the table for new fields"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        
+        # Copy files with different structures to the test directory
+        for filename in ["customers_orders.json", "orders_data.json"]:
+            shutil.copy(self.src_dir / filename, self.test_dir)
+        
+        # Act
+        result = self.app.process_directory(self.test_dir, self.test_db.name,
+                                            streaming=True, batch_size=1)
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertTrue(result['streaming'])
+        self.assertEqual(result['processed_files'], 2)
+        self.assertEqual(result['database_records'], 2)
+        
+        preview = self.app.get_database_preview(self.test_db.name, "processed_data")
+        self.assertEqual(len(preview), 2)
+        for column in ("id", "name", "order_id", "total", "_source_file"):
+            self.assertIn(column, preview[0])
+        
+    def test_process_directory_streaming_mode_with_errors(self):
+        """Test streaming mode keeps going after a malformed file"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        for filename in ["customers_orders.json", "malformed.json"]:
+            shutil.copy(self.src_dir / filename, self.test_dir)
+        
+        # Act
+        result = self.app.process_directory(self.test_dir, self.test_db.name, streaming=True)
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertEqual(result['processed_files'], 1)
+        self.assertEqual(len(result['errors']), 1)
+        self.assertIn('malformed.json', result['errors'][0])
+        
+    def test_process_directory_parallel_jobs(self):
+        """Test parallel parsing keeps per-file error reporting"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        for filename in ["customers_orders.json", "orders_data.json", "malformed.json"]:
+            shutil.copy(self.src_dir / filename, self.test_dir)
+        
+        # Act
+        result = self.app.process_directory(self.test_dir, self.test_db.name, jobs=2)
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertEqual(result['jobs'], 2)
+        self.assertEqual(result['processed_files'], 2)
+        self.assertEqual(result['total_records'], 2)
+        self.assertEqual(len(result['errors']), 1)
+        self.assertIn('malformed.json', result['errors'][0])
+
+    def test_process_directory_schedule(self):
+        """Test the opt-in size-aware schedule is reported and loads the same rows as fifo"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        for filename in ["customers_orders.json", "orders_data.json", "large_customers.json"]:
+            shutil.copy(self.src_dir / filename, self.test_dir)
+
+        # Act
+        sized = self.app.process_directory(self.test_dir, self.test_db.name, table_name="sized", jobs=2,
+                                           schedule='size')
+        fifo = self.app.process_directory(self.test_dir, self.test_db.name, table_name="fifo", jobs=2)
+
+        # Assert
+        self.assertTrue(sized['success'])
+        self.assertEqual(sized['schedule']['strategy'], 'size')
+        self.assertEqual(sized['schedule']['files'], 3)
+        self.assertEqual(sized['schedule']['largest_files'][0]['file'], "large_customers.json")
+        self.assertIsNone(fifo['schedule'])
+        self.assertEqual(sized['database_records'], fifo['database_records'])
+        self.assertFalse(self.app.process_directory(self.test_dir, self.test_db.name,
+                                                    schedule='random')['success'])
+
+    def test_process_directory_parallel_streaming_splits_json_lines(self):
+        """Test streaming with workers splits JSON Lines files into small ranges"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        # Large enough not to be bundled as a tiny file
+        lines = ['{"id": %d, "name": "%s"}' % (i, "x" * 100) for i in range(3000)]
+        (self.test_dir / "events.jsonl").write_text('\n'.join(lines), encoding='utf-8')
+
+        # Act
+        with patch('core.application.STREAMING_JSON_LINES_CHUNK_BYTES', 64 * 1024):
+            result = self.app.process_directory(self.test_dir, self.test_db.name, jobs=2,
+                                                streaming=True, schedule='size')
+
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertEqual(result['schedule']['split_files'], 1)
+        self.assertGreater(result['schedule']['ranges'], 5)
+        self.assertEqual(result['database_records'], 3000)
+
+    def test_process_directory_load_profile(self):
+        """Test the load profile is used for writing and reported in the result"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        shutil.copy(self.src_dir / "large_customers.json", self.test_dir)
+        
+        for streaming in (False, True):
+            # Act
+            result = self.app.process_directory(self.test_dir, self.test_db.name,
+                                                table_name=f"profile_{int(streaming)}",
+                                                streaming=streaming, load_profile='fast')
+            
+            # Assert
+            self.assertTrue(result['success'])
+            self.assertEqual(result['load_profile'], 'fast')
+            self.assertEqual(result['database_records'], result['total_records'])
+        
+    def test_process_directory_pipeline(self):
+        """Test pipeline mode writes the same data and reports queue metrics"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        for filename in ["customers_orders.json", "large_customers.json", "malformed.json"]:
+            shutil.copy(self.src_dir / filename, self.test_dir)
+        
+        for streaming in (False, True):
+            # Act
+            result = self.app.process_directory(self.test_dir, self.test_db.name,
+                                                table_name=f"pipeline_{int(streaming)}",
+                                                streaming=streaming, pipeline=True, batch_size=5)
+            
+            # Assert
+            self.assertTrue(result['success'])
+            self.assertEqual(result['processed_files'], 2)
+            self.assertEqual(result['failed_files'], 1)
+            self.assertEqual(result['database_records'], result['total_records'])
+            self.assertGreater(result['pipeline']['batches'], 0)
+        
+    def test_process_directory_columnar(self):
+        """Test columnar batches produce the same rows as dict records"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        for filename in ["customers_orders.json", "large_customers.json", "nested_data.json"]:
+            shutil.copy(self.src_dir / filename, self.test_dir)
+        
+        expected = self.app.process_directory(self.test_dir, self.test_db.name, table_name="rows_dict")
+        for streaming, jobs in ((False, 1), (True, 1), (True, 2)):
+            table_name = f"rows_columnar_{int(streaming)}_{jobs}"
+            
+            # Act
+            result = self.app.process_directory(self.test_dir, self.test_db.name, table_name=table_name,
+                                                streaming=streaming, jobs=jobs, columnar=True)
+            
+            # Assert
+            self.assertTrue(result['success'])
+            self.assertTrue(result['columnar'])
+            self.assertEqual(result['database_records'], expected['database_records'])
+            rows = self.app.get_database_preview(self.test_db.name, table_name, limit=100)
+            expected_rows = self.app.get_database_preview(self.test_db.name, "rows_dict", limit=100)
+            key = lambda row: json.dumps(row, sort_keys=True)
+            self.assertEqual(sorted(rows, key=key), sorted(expected_rows, key=key))
+        
+    def test_process_directory_json_backend(self):
+        """Test the JSON backend is selectable and reported in the result"""
+        from processors import json_backend
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        shutil.copy(self.src_dir / "nested_data.json", self.test_dir)
+
+        with patch.object(json_backend, '_selected', None), patch.dict(os.environ):
+            os.environ.pop(json_backend.BACKEND_ENV_VAR, None)
+            
+            # Act
+            default = self.app.process_directory(self.test_dir, self.test_db.name, table_name="rows_auto")
+            stdlib = self.app.process_directory(self.test_dir, self.test_db.name, table_name="rows_json",
+                                                json_backend='json')
+            
+            # Assert - the choice only applied to that run
+            self.assertIsNone(json_backend._selected)
+            self.assertNotIn(json_backend.BACKEND_ENV_VAR, os.environ)
+
+        # Assert
+        expected = 'orjson' if 'orjson' in json_backend.available_backends() else 'json'
+        self.assertEqual(default['json_backend'], expected)
+        self.assertEqual(stdlib['json_backend'], 'json')
+        self.assertEqual(default['database_records'], stdlib['database_records'])
+
+    def test_process_directory_timings(self):
+        """Test the result breaks the run down per stage and per file"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        for filename in ["customers_orders.json", "large_customers.json"]:
+            shutil.copy(self.src_dir / filename, self.test_dir)
+
+        for streaming, jobs in ((False, 1), (True, 1), (True, 2)):
+            # Act
+            result = self.app.process_directory(self.test_dir, self.test_db.name,
+                                                table_name=f"timed_{int(streaming)}_{jobs}",
+                                                streaming=streaming, jobs=jobs)
+
+            # Assert
+            timings = result['timings']
+            self.assertEqual(list(timings['stages']), ['scan', 'decode', 'transform', 'schema', 'insert'])
+            self.assertEqual(timings['stages']['insert']['records'], result['database_records'])
+            self.assertEqual(timings['stages']['scan']['files'], 2)
+            files = {Path(entry['file']).name: entry for entry in timings['files']}
+            self.assertEqual(set(files), {"customers_orders.json", "large_customers.json"})
+            for name, entry in files.items():
+                self.assertEqual(entry['bytes'], (self.test_dir / name).stat().st_size)
+                self.assertGreater(entry['decode_seconds'], 0)
+                self.assertEqual(entry['insert_seconds'] is not None, streaming)
+            self.assertEqual(sum(entry['records'] for entry in files.values()), result['total_records'])
+
+    def test_process_directory_profiling(self):
+        """Test CPU and memory profiles cover the run and are off by default"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        shutil.copy(self.src_dir / "large_customers.json", self.test_dir)
+        profile_path = self.test_dir / "run.prof"
+
+        # Act
+        plain = self.app.process_directory(self.test_dir, self.test_db.name, table_name="plain")
+        cpu = self.app.process_directory(self.test_dir, self.test_db.name, table_name="cpu",
+                                         profile='cpu', profile_output=str(profile_path), profile_top=5)
+        memory = self.app.process_directory(self.test_dir, self.test_db.name, table_name="memory",
+                                            streaming=True, profile='memory')
+
+        # Assert
+        self.assertIsNone(plain['profile'])
+        self.assertTrue(profile_path.exists())
+        self.assertEqual(len(cpu['profile']['top_functions']), 5)
+        self.assertEqual(list(memory['profile']['stages']),
+                         ['scan', 'decode', 'transform', 'schema', 'insert'])
+        self.assertGreater(memory['profile']['peak_bytes'], 0)
+        self.assertTrue(memory['profile']['top_allocations'])
+
+    def test_process_directory_memory_budget(self):
+        """Test batches over the memory budget are spilled and still all saved"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        shutil.copy(self.src_dir / "large_customers.json", self.test_dir)
+        spill_dir = Path(tempfile.mkdtemp())
+
+        # Act
+        plain = self.app.process_directory(self.test_dir, self.test_db.name, table_name="plain",
+                                           batch_size=10)
+        budgeted = self.app.process_directory(self.test_dir, self.test_db.name, table_name="budgeted",
+                                              batch_size=10, memory_budget_mb=0.001,
+                                              spill_dir=str(spill_dir))
+
+        # Assert
+        self.assertTrue(budgeted['success'])
+        self.assertEqual(plain['spill']['spilled_batches'], 0)
+        self.assertGreater(budgeted['spill']['spilled_batches'], 0)
+        self.assertEqual(budgeted['database_records'], plain['database_records'])
+        self.assertEqual(list(spill_dir.iterdir()), [])
+        import sqlite3
+        with sqlite3.connect(self.test_db.name) as conn:
+            plain_rows = conn.execute("SELECT * FROM plain").fetchall()
+            budgeted_rows = conn.execute("SELECT * FROM budgeted").fetchall()
+        self.assertEqual(budgeted_rows, plain_rows)
+        shutil.rmtree(spill_dir, ignore_errors=True)
+        for budget in (0, -1):
+            rejected = self.app.process_directory(self.test_dir, self.test_db.name, table_name="rejected",
+                                                  memory_budget_mb=budget)
+            self.assertFalse(rejected['success'])
+            self.assertIn("Memory budget", rejected['message'])
+
+    def test_process_directory_json_lines(self):
+        """Test JSON Lines files are read line by line with bad lines reported"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        lines = ['{"id": 1, "name": "John"}', '{"id": 2, broken', '', '{"id": 3, "name": "Jane"}']
+        (self.test_dir / "events.jsonl").write_text('\n'.join(lines), encoding='utf-8')
+        
+        for jobs in (1, 2):
+            # Act
+            result = self.app.process_directory(self.test_dir, self.test_db.name, jobs=jobs,
+                                                table_name=f"events_{jobs}")
+            
+            # Assert
+            self.assertTrue(result['success'])
+            self.assertEqual(result['processed_files'], 1)
+            self.assertEqual(result['total_records'], 2)
+            self.assertEqual(len(result['errors']), 1)
+            self.assertIn('events.jsonl line 2', result['errors'][0])
+        
+    def test_process_directory_json_lines_errors_per_file(self):
+        """Test line errors stay with their file when writing fails and are capped per file"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        for name in ("a.jsonl", "b.jsonl"):
+            lines = ['{"id": 1}', 'broken', '{"id": 2}', '{"id": 3}']
+            (self.test_dir / name).write_text('\n'.join(lines), encoding='utf-8')
+
+        def fail_after_first_batch(connector, batches, *args, **kwargs):
+            next(iter(batches))
+            raise RuntimeError("disk full")
+
+        # Act - the writer fails part way through every file
+        with patch.object(self.app, '_stream_file_to_database', side_effect=fail_after_first_batch):
+            result = self.app.process_directory(self.test_dir, self.test_db.name, streaming=True,
+                                                batch_size=1)
+
+        # Assert - each file's line error directly follows its own failure
+        errors = result['errors']
+        self.assertEqual(len(errors), 4)
+        for failure, line_error in zip(errors[::2], errors[1::2]):
+            name = failure[len("Error processing "):-len(": disk full")]
+            self.assertEqual(failure, f"Error processing {name}: disk full")
+            self.assertTrue(line_error.startswith(f"Error processing {name} line 2:"))
+        self.assertEqual(sorted(errors[::2]), ["Error processing a.jsonl: disk full",
+                                               "Error processing b.jsonl: disk full"])
+
+        # Arrange - a file split into several byte ranges
+        shutil.rmtree(self.test_dir)
+        self.test_dir = Path(tempfile.mkdtemp())
+        lines = [('{"id": %d}' % i) if i % 2 else 'broken' for i in range(60)]
+        (self.test_dir / "split.jsonl").write_text('\n'.join(lines), encoding='utf-8')
+
+        # Act
+        with patch('core.parallel.JSON_LINES_CHUNK_BYTES', 64):
+            result = self.app.process_directory(self.test_dir, self.test_db.name, jobs=2,
+                                                table_name="split")
+
+        # Assert
+        self.assertEqual(result['total_records'], 30)
+        self.assertEqual(len(result['errors']), 11)
+        self.assertIn('split.jsonl line 1:', result['errors'][0])
+        self.assertEqual(result['errors'][-1], "Error processing split.jsonl: 20 more invalid lines not shown")
+
+    def test_process_directory_late_fields_get_columns(self):
+        """Test fields first seen after the early records still become columns"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        records = [{"id": i} for i in range(25)] + [{"id": 25, "late_field": "x"}]
+        (self.test_dir / "late.json").write_text(json.dumps(records), encoding='utf-8')
+        
+        for streaming in (False, True):
+            table_name = f"late_{int(streaming)}"
+            
+            # Act
+            result = self.app.process_directory(self.test_dir, self.test_db.name, table_name=table_name,
+                                                streaming=streaming, batch_size=10)
+            preview = self.app.get_database_preview(self.test_db.name, table_name, limit=30)
+            
+            # Assert
+            self.assertTrue(result['success'])
+            self.assertEqual(result['database_records'], 26)
+            self.assertEqual([row['late_field'] for row in preview if row['late_field']], ['x'])
+        
+    def test_process_directory_typed_columns(self):
+        """Test typed columns store numbers as numbers and nulls as NULL"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        records = [{"id": 1, "price": 9.5, "tags": ["a"], "note": None},
+                   {"id": 2, "price": 10, "tags": [], "note": "late"}]
+        (self.test_dir / "typed.json").write_text(json.dumps(records), encoding='utf-8')
+        
+        for streaming in (False, True):
+            table_name = f"typed_{int(streaming)}"
+            
+            # Act
+            result = self.app.process_directory(self.test_dir, self.test_db.name, table_name=table_name,
+                                                streaming=streaming, typed_columns=True)
+            
+            # Assert
+            self.assertTrue(result['success'])
+            import sqlite3
+            conn = sqlite3.connect(self.test_db.name)
+            try:
+                types = {row[1]: row[2] for row in conn.execute(f'PRAGMA table_info("{table_name}")')}
+                rows = conn.execute(f'SELECT SUM(id), typeof(price), tags, note FROM "{table_name}" '
+                                    'GROUP BY id ORDER BY id').fetchall()
+            finally:
+                conn.close()
+            self.assertEqual(types['id'], 'INTEGER')
+            self.assertEqual(types['price'], 'REAL')
+            self.assertEqual(types['tags'], 'JSON_TEXT')
+            self.assertEqual(rows[0], (1, 'real', '["a"]', None))
+            self.assertEqual(rows[1][2], '[]')
+        
+    def test_process_directory_typed_columns_streaming_conflict(self):
+        """Test text reaching a typed numeric column in streaming mode is not converted"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        lines = ['{"id": 1, "code": 7}', '{"id": 2, "code": "007"}', '{"id": 3, "code": 8}']
+        (self.test_dir / "codes.jsonl").write_text('\n'.join(lines), encoding='utf-8')
+        
+        for pipeline in (False, True):
+            table_name = f"codes_{int(pipeline)}"
+            
+            # Act - one record per batch, so the column exists before "007" arrives
+            result = self.app.process_directory(self.test_dir, self.test_db.name, table_name=table_name,
+                                                streaming=True, typed_columns=True, batch_size=1,
+                                                pipeline=pipeline)
+            
+            # Assert
+            self.assertTrue(result['success'])
+            import sqlite3
+            conn = sqlite3.connect(self.test_db.name)
+            try:
+                types = {row[1]: row[2] for row in conn.execute(f'PRAGMA table_info("{table_name}")')}
+                codes = conn.execute(f'SELECT code FROM "{table_name}" ORDER BY rowid').fetchall()
+            finally:
+                conn.close()
+            self.assertEqual(types['id'], 'INTEGER')
+            self.assertEqual(types['code'], 'TEXT')
+            self.assertEqual(codes, [('7',), ('007',), ('8',)])
+        
+    def test_process_directory_incremental(self):
+        """Test incremental runs skip unchanged files and replace changed ones"""
+        # Create a clean temp directory for this specific test
+        self.test_dir = Path(tempfile.mkdtemp())
+        for filename in ["customers_orders.json", "large_customers.json"]:
+            shutil.copy(self.src_dir / filename, self.test_dir)
+        
+        for streaming in (False, True):
+            table_name = f"incremental_{int(streaming)}"
+            
+            # Act - first run loads everything
+            first = self.app.process_directory(self.test_dir, self.test_db.name, table_name=table_name,
+                                               streaming=streaming, incremental=True)
+            # Second run has nothing to do
+            second = self.app.process_directory(self.test_dir, self.test_db.name, table_name=table_name,
+                                                streaming=streaming, incremental=True)
+            
+            # Assert
+            self.assertTrue(first['success'])
+            self.assertEqual(first['skipped_files'], 0)
+            self.assertTrue(second['success'])
+            self.assertEqual(second['skipped_files'], 2)
+            self.assertEqual(second['total_records'], 0)
+            
+            # Act - change one file and run again
+            changed = self.test_dir / "customers_orders.json"
+            changed.write_text(json.dumps([{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}]))
+            third = self.app.process_directory(self.test_dir, self.test_db.name, table_name=table_name,
+                                               streaming=streaming, incremental=True)
+            
+            # Assert - old rows replaced rather than duplicated
+            self.assertEqual(third['skipped_files'], 1)
+            self.assertEqual(third['total_records'], 2)
+            rows = self.app.get_database_preview(self.test_db.name, table_name, limit=1000)
+            from_changed = [row for row in rows if row['_source_file'] == "customers_orders.json"]
+            self.assertEqual(len(from_changed), 2)
+            self.assertEqual(len(rows), first['total_records'] + 1)
+            
+            shutil.copy(self.src_dir / "customers_orders.json", self.test_dir)
+        
     def test_get_database_preview(self):
         """Test database preview functionality"""
         # Create a clean temp directory for this specific test
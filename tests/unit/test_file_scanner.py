@@ -0,0 +1,154 @@
+# tests/unit/test_file_scanner.py
+import unittest
+import tempfile
+import shutil
+import time
+import os
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from scanners.file_scanner import FileScanner
+from scanners.pattern_matcher import PatternMatcher
+
+
+class TestFileScanner(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        for relative in ("a.json", "sub/b.jsonl", "sub/deeper/c.json", "sub/notes.txt",
+                         ".git/objects/d.json", "node_modules/pkg/e.json", "sub/__pycache__/f.json",
+                         "sub/.hidden.json", "sub/g.json.tmp"):
+            path = self.test_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('[{"id": 1}]', encoding='utf-8')
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_discovery_prunes_ignored_directories(self):
+        """Test ignored directories are not descended into and only real directories are counted"""
+        # Arrange
+        scanner = FileScanner(self.test_dir)
+
+        # Act
+        found = scanner.discover_files(file_types=['json'], recursive=True)
+        stats = scanner.get_scan_statistics()
+
+        # Assert
+        names = sorted(path.relative_to(self.test_dir).as_posix() for path in found['json'])
+        self.assertEqual(names, ["a.json", "sub/b.jsonl", "sub/deeper/c.json"])
+        self.assertEqual(stats['directories_scanned'], 3)  # root, sub, sub/deeper
+        self.assertEqual(stats['directories_pruned'], 3)   # .git, node_modules, __pycache__
+        self.assertEqual(stats['files_found'], 6)
+        self.assertEqual(stats['files_ignored'], 2)
+        self.assertEqual(stats['bytes_classified'], 3 * len('[{"id": 1}]'))
+
+    def test_discovery_non_recursive_and_extra_excludes(self):
+        """Test non-recursive scans stay at the top level and extra patterns prune directories"""
+        # Arrange
+        scanner = FileScanner(self.test_dir)
+
+        # Act
+        top_level = scanner.discover_files(file_types=['json'], recursive=False)
+        pruned = scanner.discover_files(file_types=['json'], exclude_patterns=['deeper'])
+
+        # Assert
+        self.assertEqual([path.name for path in top_level['json']], ["a.json"])
+        self.assertEqual(sorted(path.name for path in pruned['json']), ["a.json", "b.jsonl"])
+
+    def test_path_and_directory_patterns(self):
+        """Test full-path and directory-component patterns prune and filter like basename ones"""
+        # Arrange
+        scanner = FileScanner(self.test_dir)
+
+        # Act
+        by_path = scanner.discover_files(file_types=['json'], exclude_patterns=['sub/deeper'])
+        by_directory = scanner.discover_files(file_types=['json'], include_patterns=['deeper/'])
+
+        # Assert
+        self.assertEqual(sorted(path.name for path in by_path['json']), ["a.json", "b.jsonl"])
+        self.assertEqual([path.name for path in by_directory['json']], ["c.json"])
+
+    def test_parallel_walk_matches_serial(self):
+        """Test the threaded walk finds the same files and statistics as the serial one"""
+        # Arrange
+        for index in range(20):
+            path = self.test_dir / f"batch_{index % 4}" / f"part_{index}.json"
+            path.parent.mkdir(exist_ok=True)
+            path.write_text('[]', encoding='utf-8')
+        scanner = FileScanner(self.test_dir)
+
+        # Act
+        serial = scanner.discover_files(file_types=['json'], ordered=True)
+        serial_stats = scanner.get_scan_statistics()
+        parallel = scanner.discover_files(file_types=['json'], threads=4, ordered=True)
+        parallel_stats = scanner.get_scan_statistics()
+
+        # Assert
+        self.assertEqual(parallel, serial)
+        self.assertEqual(serial['json'], sorted(serial['json']))
+        del serial_stats['scan_seconds'], parallel_stats['scan_seconds']
+        self.assertEqual(parallel_stats, serial_stats)
+
+    def test_directory_index_reuses_unchanged_directories(self):
+        """Test a rescan takes unchanged directories from the index and re-lists changed ones"""
+        # Arrange
+        index_path = self.test_dir.parent / (self.test_dir.name + "_index.db")
+        old = time.time() - 60
+        for directory in [self.test_dir] + [path for path in self.test_dir.rglob("*") if path.is_dir()]:
+            os.utime(directory, (old, old))
+        first = FileScanner(self.test_dir, index_path=str(index_path)).discover_files(file_types=['json'])
+
+        # Act
+        (self.test_dir / "sub" / "new.json").write_text('[]', encoding='utf-8')
+        scanner = FileScanner(self.test_dir, index_path=str(index_path))
+        second = scanner.discover_files(file_types=['json'])
+        stats = scanner.get_scan_statistics()
+
+        # Assert
+        self.assertEqual(sorted(second['json']), sorted(first['json'] + [self.test_dir / "sub" / "new.json"]))
+        self.assertEqual(stats['directories_scanned'], 3)
+        self.assertEqual(stats['directories_from_index'], 2)  # root and sub/deeper
+        self.assertEqual(stats['bytes_classified'], 3 * len('[{"id": 1}]') + 2)
+        index_path.unlink()
+
+    def test_iter_files_yields_before_scan_completes(self):
+        """Test the iterator yields classified files lazily and finishes statistics when exhausted"""
+        # Arrange
+        scanner = FileScanner(self.test_dir)
+
+        # Act
+        files = scanner.iter_files(file_types=['json'])
+        first_type, first_path = next(files)
+        partial = scanner.get_scan_statistics()['files_classified']
+        remaining = list(files)
+        stats = scanner.get_scan_statistics()
+
+        # Assert
+        self.assertEqual(first_type, 'json')
+        self.assertEqual(partial, 1)
+        self.assertEqual(len(remaining), 2)
+        self.assertEqual(stats['files_classified'], 3)
+        self.assertEqual(stats['directories_scanned'], 3)
+        self.assertGreater(stats['scan_seconds'], 0)
+
+    def test_pattern_matcher_kinds(self):
+        """Test the compiled matcher handles basename, full-path and directory patterns"""
+        # Arrange
+        matcher = PatternMatcher.compile(('*.tmp', '/archive/2023/*', 'build/'))
+
+        # Act / Assert
+        self.assertIs(matcher, PatternMatcher.compile(('*.tmp', '/archive/2023/*', 'build/')))
+        self.assertTrue(matcher.needs_path)
+        self.assertTrue(matcher.matches('x.tmp'))
+        self.assertTrue(matcher.matches('a.json', 'archive/2023/a.json'))
+        self.assertFalse(matcher.matches('a.json', 'archive/2024/a.json'))
+        self.assertTrue(matcher.matches('build', 'src/build', is_dir=True))
+        self.assertTrue(matcher.matches('a.json', 'src/build/out/a.json'))
+        self.assertFalse(matcher.matches('build', 'src/build'))
+
+
+if __name__ == '__main__':
+    unittest.main()
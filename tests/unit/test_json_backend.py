@@ -0,0 +1,110 @@
+# tests/unit/test_json_backend.py
+import unittest
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from processors import json_backend
+from processors.json_backend import (BACKEND_ENV_VAR, available_backends, backend_selection, get_backend,
+                                     restore_backend, select_backend)
+from readers.json_stream_reader import JSONArrayStreamReader
+
+HAS_ORJSON = 'orjson' in available_backends()
+
+class TestJSONBackend(unittest.TestCase):
+
+    def test_stdlib_backend_matches_json_module(self):
+        """Test the stdlib backend behaves exactly like the json module"""
+        # Arrange
+        backend = get_backend('json')
+        value = {"id": 1, "tags": ["a", "b"], "meta": {"ok": True, "score": 1.5}}
+
+        # Act / Assert
+        self.assertEqual(backend.name, 'json')
+        self.assertEqual(backend.dumps(value), json.dumps(value))
+        self.assertEqual(backend.loads(json.dumps(value)), value)
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson not installed")
+    def test_orjson_backend_round_trips_and_falls_back(self):
+        """Test orjson decodes the same values and defers to stdlib for what it rejects"""
+        # Arrange
+        backend = get_backend('orjson')
+        document = b'[{"id": 1, "name": "Jos\\u00e9", "tags": [1, 2.5, null]}]'
+
+        # Act / Assert
+        self.assertEqual(backend.loads(document), json.loads(document))
+        # Stored text must not depend on the backend
+        for value in ({"big": 2 ** 70}, [1, 2], {"nan": float('nan'), "name": "José", "none": None}):
+            self.assertEqual(backend.dumps(value), json.dumps(value))
+        self.assertTrue(backend.loads('[NaN]')[0] != backend.loads('[NaN]')[0])
+        with self.assertRaises(json.JSONDecodeError) as context:
+            backend.loads('{"id": 1,}')
+        with self.assertRaises(json.JSONDecodeError) as expected:
+            json.loads('{"id": 1,}')
+        self.assertEqual(str(context.exception), str(expected.exception))
+
+    def test_unknown_backend_rejected(self):
+        """Test selecting an unknown backend raises ValueError"""
+        with self.assertRaises(ValueError):
+            get_backend('simdjson-turbo')
+
+    def test_select_backend_exports_choice(self):
+        """Test the selected backend becomes the default and is exported for workers"""
+        with patch.object(json_backend, '_selected', None), patch.dict(os.environ):
+            # Act
+            backend = select_backend('json')
+
+            # Assert
+            self.assertIs(get_backend(), backend)
+            self.assertEqual(os.environ[BACKEND_ENV_VAR], 'json')
+
+    def test_restore_backend_undoes_selection(self):
+        """Test a saved selection puts back both the default and the exported name"""
+        with patch.object(json_backend, '_selected', None), patch.dict(os.environ):
+            # Arrange
+            os.environ.pop(BACKEND_ENV_VAR, None)
+            selection = backend_selection()
+
+            # Act
+            select_backend('json')
+            restore_backend(selection)
+
+            # Assert
+            self.assertIsNone(json_backend._selected)
+            self.assertNotIn(BACKEND_ENV_VAR, os.environ)
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson not installed")
+    def test_stream_reader_whole_file_path_matches_incremental(self):
+        """Test small files decoded in one call yield the same records and errors"""
+        # Arrange
+        temp_dir = tempfile.mkdtemp()
+        good = Path(temp_dir) / "good.json"
+        good.write_text('{"data": {"records": [{"id": 1}, {"id": 2, "x": [1]}]}}', encoding='utf-8')
+        bad = Path(temp_dir) / "bad.json"
+        bad.write_text('[{"id": 1}, {"id": 2,}]', encoding='utf-8')
+
+        fast = JSONArrayStreamReader(good, item_path='data.records')
+        fast.backend = get_backend('orjson')
+        slow = JSONArrayStreamReader(good, item_path='data.records')
+        slow.backend = get_backend('json')
+        bad_fast = JSONArrayStreamReader(bad)
+        bad_fast.backend = get_backend('orjson')
+        bad_slow = JSONArrayStreamReader(bad)
+        bad_slow.backend = get_backend('json')
+
+        # Act / Assert
+        self.assertEqual(list(fast.iter_records()), list(slow.iter_records()))
+        with self.assertRaises(ValueError) as fast_error:
+            list(bad_fast.iter_records())
+        with self.assertRaises(ValueError) as slow_error:
+            list(bad_slow.iter_records())
+        self.assertEqual(str(fast_error.exception), str(slow_error.exception))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# tests/unit/test_json_lines_reader.py
+import unittest
+import json
+import tempfile
+from pathlib import Path
+import shutil
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from readers.json_lines_reader import JSONLinesReader, split_byte_ranges, is_json_lines_file
+
+class TestJSONLinesReader(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+        # 200 records with a malformed line every 37 lines and a few blank lines
+        lines = []
+        for i in range(200):
+            if i % 37 == 10:
+                lines.append('{"id": %d, broken' % i)
+            elif i % 50 == 3:
+                lines.append('')
+            else:
+                lines.append(json.dumps({"id": i, "payload": "x" * (i % 11)}))
+        self.file_path = self.test_dir / "events.ndjson"
+        self.file_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        self.bad_lines = [i + 1 for i in range(200) if i % 37 == 10]
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_iter_batches_skips_bad_lines(self):
+        """Test valid lines are parsed and bad lines reported by line number"""
+        # Act
+        reader = JSONLinesReader(self.file_path)
+        records = [record for batch in reader.iter_batches(50) for record in batch]
+
+        # Assert
+        self.assertEqual(len(records), 200 - len(self.bad_lines) - 4)
+        self.assertEqual(reader.error_count, len(self.bad_lines))
+        self.assertEqual([error['line'] for error in reader.errors], self.bad_lines)
+        self.assertIn("events.ndjson line 11:", reader.format_errors()[0])
+
+    def test_byte_ranges_cover_every_line_once(self):
+        """Test split ranges yield the same records and line numbers as one pass"""
+        # Arrange
+        expected = list(JSONLinesReader(self.file_path).iter_records())
+
+        for chunk_bytes in (1, 13, 256, 4096):
+            # Act
+            records, bad_lines = [], []
+            for start, end in split_byte_ranges(self.file_path, chunk_bytes):
+                reader = JSONLinesReader(self.file_path, start=start, end=end)
+                records.extend(record for _, record in reader.iter_records())
+                bad_lines.extend(error['line'] for error in reader.errors)
+
+            # Assert
+            self.assertEqual(records, [record for _, record in expected])
+            self.assertEqual(sorted(bad_lines), self.bad_lines)
+
+    def test_error_details_are_capped(self):
+        """Test only the first errors are kept in detail but all are counted"""
+        # Arrange
+        path = self.test_dir / "all_bad.jsonl"
+        path.write_text('nope\n' * 25, encoding='utf-8')
+
+        # Act
+        reader = JSONLinesReader(path)
+        list(reader.iter_records())
+
+        # Assert
+        self.assertEqual(reader.error_count, 25)
+        self.assertEqual(len(reader.errors), JSONLinesReader.MAX_REPORTED_ERRORS)
+        self.assertIn("15 more invalid lines", reader.format_errors()[-1])
+
+    def test_is_json_lines_file(self):
+        """Test extension based format detection"""
+        self.assertTrue(is_json_lines_file("a.jsonl"))
+        self.assertTrue(is_json_lines_file("a.NDJSON"))
+        self.assertFalse(is_json_lines_file("a.json"))
+
+if __name__ == "__main__":
+    unittest.main()
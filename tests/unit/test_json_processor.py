@@ -108,6 +108,41 @@ class TestJSONProcessor(unittest.TestCase):
         # Assert - non-dict items should be filtered out
         self.assertEqual(result, [])
         
+    def test_compiled_transformers_match_generic_path(self):
+        """Test shape-compiled transformers convert exactly like the generic path"""
+        # Arrange
+        class Label(str):
+            pass
+        records = [
+            {"id": 1, "tags": ["a"], "meta": {}, "note": None, "ok": True, "price": 1.5},
+            {"id": 2, "tags": [], "meta": {"k": 1}, "note": "x", "ok": False, "price": 2},
+            {"label": Label("y"), "when": Path("p"), 3: "non-string key"},
+        ]
+        
+        for typed_values in (False, True):
+            processor = JSONProcessor(typed_values=typed_values)
+            
+            # Act
+            result = processor.process_data(records)
+            
+            # Assert
+            self.assertEqual(result, [processor._process_single_item(record) for record in records])
+            self.assertEqual(result[1]["tags"], "[]" if typed_values else "")
+        
+    def test_compiled_transformer_cache_is_bounded(self):
+        """Test records beyond the shape cache limit fall back to the generic path"""
+        # Arrange
+        from processors import json_processor
+        records = [{f"field_{i}": i} for i in range(20)]
+        
+        # Act
+        with patch.object(json_processor, 'MAX_COMPILED_SHAPES', 5):
+            result = self.processor.process_data(records)
+        
+        # Assert
+        self.assertEqual(len(self.processor._transformers), 5)
+        self.assertEqual(result, records)
+        
     def test_flatten_json_data_simple(self):
         """Test flattening of simple nested objects"""
         # Arrange
@@ -0,0 +1,136 @@
+# tests/unit/test_json_stream_reader.py
+import unittest
+import json
+import tempfile
+from pathlib import Path
+import shutil
+import sys
+import os
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from processors.json_backend import get_backend
+from readers.json_stream_reader import JSONArrayStreamReader, JSONStreamError, _TextWindow
+
+class TestJSONArrayStreamReader(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.src_dir = Path(__file__).parent / "unit_test_data"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _write(self, name, content):
+        path = self.test_dir / name
+        path.write_text(content, encoding='utf-8')
+        return path
+
+    def test_iter_records_matches_json_load(self):
+        """Test streamed records equal json.load output for every chunk size"""
+        # Arrange
+        source = self.src_dir / "large_customers.json"
+        with open(source, 'r') as f:
+            expected = json.load(f)
+
+        # Act / Assert - tiny chunks force values to span window boundaries
+        for chunk_size in (1, 7, 64, 1024 * 1024):
+            reader = JSONArrayStreamReader(source, chunk_size=chunk_size)
+            self.assertEqual(list(reader.iter_records()), expected)
+
+    def test_iter_batches(self):
+        """Test records are grouped into bounded batches"""
+        # Arrange
+        path = self._write("numbers.json", json.dumps([{"id": i} for i in range(25)]))
+
+        # Act
+        batches = list(JSONArrayStreamReader(path).iter_batches(10))
+
+        # Assert
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+
+    def test_item_path(self):
+        """Test reading an array nested under a dotted key path"""
+        # Arrange
+        document = {"meta": {"count": 2}, "data": {"records": [{"id": 1}, {"id": 2}]}, "next": None}
+        path = self._write("wrapped.json", json.dumps(document))
+
+        # Act
+        records = list(JSONArrayStreamReader(path, item_path="data.records", chunk_size=4).iter_records())
+
+        # Assert
+        self.assertEqual(records, [{"id": 1}, {"id": 2}])
+
+    def test_missing_item_path(self):
+        """Test a missing item path raises a clear error"""
+        # Arrange
+        path = self._write("wrapped.json", json.dumps({"data": []}))
+
+        # Act / Assert
+        with self.assertRaises(JSONStreamError) as ctx:
+            list(JSONArrayStreamReader(path, item_path="records").iter_records())
+        self.assertIn("records", str(ctx.exception))
+
+    def test_single_object_yields_one_record(self):
+        """Test a top-level object is treated as a single record"""
+        # Arrange
+        path = self._write("single.json", '{"id": 1, "name": "John"}')
+
+        # Act
+        records = list(JSONArrayStreamReader(path).iter_records())
+
+        # Assert
+        self.assertEqual(records, [{"id": 1, "name": "John"}])
+
+    def test_malformed_reports_same_position_as_json(self):
+        """Test error positions match the standard json module"""
+        # Arrange
+        content = '[\n  {"id": 1},\n  {"id": 2,,}\n]'
+        path = self._write("bad.json", content)
+        with self.assertRaises(json.JSONDecodeError) as expected:
+            json.loads(content)
+
+        # Act / Assert
+        with self.assertRaises(JSONStreamError) as ctx:
+            list(JSONArrayStreamReader(path, chunk_size=3).iter_records())
+        self.assertEqual(str(ctx.exception), str(expected.exception))
+
+    def test_early_syntax_error_raises_without_reading_to_eof(self):
+        """Test a syntax error near the start is raised before the rest of the file is read"""
+        # Arrange
+        records = ',\n'.join(json.dumps({"id": i, "text": "x" * 100}) for i in range(20000))
+        path = self._write("early_error.json", '[{"id": x},\n' + records + ']')
+        reader = JSONArrayStreamReader(path, chunk_size=4096)
+        reader.backend = get_backend('json')
+        window_sizes = []
+        fill = _TextWindow.fill
+
+        def tracking_fill(window):
+            filled = fill(window)
+            window_sizes.append(len(window.buffer))
+            return filled
+
+        # Act
+        with patch.object(_TextWindow, 'fill', tracking_fill):
+            with self.assertRaises(JSONStreamError) as ctx:
+                list(reader.iter_records())
+
+        # Assert
+        self.assertIn("line 1 column 9", str(ctx.exception))
+        self.assertLess(max(window_sizes), path.stat().st_size // 10)
+
+    def test_values_spanning_the_window_edge(self):
+        """Test long strings and numbers cut by the window edge still decode"""
+        # Arrange
+        expected = [{"s": "y" * 50, "n": 1.25, "e": -2.5e-3, "u": "é"} for _ in range(30)]
+        path = self._write("spanning.json", json.dumps(expected))
+
+        # Act / Assert
+        for chunk_size in (1, 3, 5, 17):
+            self.assertEqual(list(JSONArrayStreamReader(path, chunk_size=chunk_size).iter_records()),
+                             expected)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# tests/unit/test_mapped_file.py
+import unittest
+import json
+import os
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from handlers import file_handler
+from handlers.file_handler import FileHandler
+from processors.json_backend import available_backends, get_backend
+from readers.mapped_file import map_file
+
+
+class TestMappedFile(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_map_file_strips_bom_and_handles_empty_files(self):
+        """Test the mapped view skips a UTF-8 BOM on request and empty files map to nothing"""
+        # Arrange
+        bom_file = self.test_dir / "bom.json"
+        bom_file.write_bytes(b'\xef\xbb\xbf[1, 2]')
+        empty_file = self.test_dir / "empty.json"
+        empty_file.write_bytes(b'')
+
+        # Act
+        with map_file(bom_file) as content:
+            stripped = bytes(content)
+        with map_file(bom_file, strip_bom=False) as content:
+            raw = bytes(content)
+        with map_file(empty_file) as content:
+            empty = bytes(content)
+
+        # Assert
+        self.assertEqual(stripped, b'[1, 2]')
+        self.assertEqual(raw, b'\xef\xbb\xbf[1, 2]')
+        self.assertEqual(empty, b'')
+
+    def test_read_json_file_parses_mapped_bytes_with_every_backend(self):
+        """Test read_json_file gives the same data from the mapped path with each backend"""
+        # Arrange
+        data = [{"id": 1, "name": "José", "tags": ["a", None]}, {"id": 2, "nested": {"ok": True}}]
+        utf8_file = self.test_dir / "utf8.json"
+        utf8_file.write_bytes(b'\xef\xbb\xbf' + json.dumps(data, ensure_ascii=False).encode('utf-8'))
+        latin_file = self.test_dir / "latin.json"
+        latin_file.write_bytes(json.dumps(data, ensure_ascii=False).encode('latin-1'))
+        bad_file = self.test_dir / "bad.json"
+        bad_file.write_text('[{"id": 1,}]', encoding='utf-8')
+
+        for backend_name in available_backends():
+            with patch.object(file_handler, 'get_backend', lambda: get_backend(backend_name)):
+                handler = FileHandler()
+
+                # Act / Assert
+                self.assertEqual(handler.read_json_file(utf8_file), data)
+                # Not valid UTF-8: falls through to the text-mode encodings
+                self.assertEqual(handler.read_json_file(latin_file), data)
+                with self.assertRaises(json.JSONDecodeError):
+                    handler.read_json_file(bad_file)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# tests/unit/test_pipeline.py
+import unittest
+from pathlib import Path
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from core.pipeline import BatchPipeline
+from processors.schema_inference import SchemaAccumulator
+
+def make_source(files, line_errors=None):
+    """Yield (file path, batch stream, schema) triples like core.parallel does."""
+    for name, batches in files:
+        schema = SchemaAccumulator()
+
+        def stream(batches=batches, schema=schema, name=name):
+            for batch in batches:
+                if isinstance(batch, Exception):
+                    if line_errors is not None:
+                        line_errors.append(f"{name} line 1: bad")
+                    raise batch
+                schema.observe_batch(batch)
+                yield batch
+
+        yield Path(name), stream(), schema
+
+class TestBatchPipeline(unittest.TestCase):
+
+    def test_files_and_batches_arrive_in_order(self):
+        """Test every batch is delivered in order with its schema"""
+        # Arrange
+        files = [("a.json", [[{"id": i}] for i in range(20)]),
+                 ("b.json", [[{"id": 1, "name": "x"}]])]
+        pipeline = BatchPipeline(queue_size=2)
+
+        # Act
+        received = []
+        for file_path, batches, schema in pipeline.run(make_source(files)):
+            received.append((file_path.name, [batch[0]["id"] for batch in batches], list(schema.columns)))
+
+        # Assert
+        self.assertEqual(received, [("a.json", list(range(20)), ["id"]),
+                                    ("b.json", [1], ["id", "name"])])
+        metrics = pipeline.metrics()
+        self.assertEqual(metrics['batches'], 21)
+        self.assertLessEqual(metrics['max_queue_depth'], 2)
+
+    def test_file_error_is_raised_for_that_file_only(self):
+        """Test a failing file raises in its batch stream and later files continue"""
+        # Arrange
+        pipeline = BatchPipeline()
+        files = [("bad.json", [[{"id": 1}], ValueError("broken")]),
+                 ("good.json", [[{"id": 2}]])]
+        line_errors = []
+
+        # Act
+        outcomes = []
+        for file_path, batches, _ in pipeline.run(make_source(files, pipeline.source_errors), line_errors):
+            try:
+                outcomes.append((file_path.name, sum(len(batch) for batch in batches)))
+            except ValueError as e:
+                outcomes.append((file_path.name, str(e)))
+
+        # Assert
+        self.assertEqual(outcomes, [("bad.json", "broken"), ("good.json", 1)])
+        self.assertEqual(line_errors, ["bad.json line 1: bad"])
+
+    def test_closing_a_file_stream_skips_to_the_next_file(self):
+        """Test a stream closed part way still reports its line errors"""
+        # Arrange
+        pipeline = BatchPipeline(queue_size=1)
+        files = [("a.json", [[{"id": 1}]] * 5 + [ValueError("broken")]),
+                 ("b.json", [[{"id": 2}]])]
+        line_errors = []
+
+        # Act
+        received = []
+        for file_path, batches, _ in pipeline.run(make_source(files, pipeline.source_errors), line_errors):
+            received.append((file_path.name, next(batches)[0]["id"]))
+            batches.close()
+            received.append(list(line_errors))
+
+        # Assert
+        self.assertEqual(received, [("a.json", 1), ["a.json line 1: bad"],
+                                    ("b.json", 2), ["a.json line 1: bad"]])
+
+    def test_stopping_early_shuts_down_reader(self):
+        """Test leaving the loop early stops the reader thread"""
+        # Arrange
+        pipeline = BatchPipeline(queue_size=1)
+        files = [(f"{i}.json", [[{"id": i}]] * 50) for i in range(10)]
+
+        # Act
+        run = pipeline.run(make_source(files))
+        next(run)
+        run.close()
+
+        # Assert
+        self.assertFalse(pipeline._thread.is_alive())
+
+if __name__ == "__main__":
+    unittest.main()
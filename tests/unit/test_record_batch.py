@@ -0,0 +1,59 @@
+# tests/unit/test_record_batch.py
+import unittest
+import pickle
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from processors.record_batch import RecordBatch
+from processors.json_processor import JSONProcessor
+
+class TestRecordBatch(unittest.TestCase):
+
+    def test_from_records_pads_missing_values(self):
+        """Test columns appearing late or missing from records are filled with None"""
+        # Act
+        batch = RecordBatch.from_records([{"id": 1}, {"id": 2, "name": "x"}, {"name": "y"}])
+
+        # Assert
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.columns, ["id", "name"])
+        self.assertEqual(batch.column("id"), [1, 2, None])
+        self.assertEqual(batch.column("name"), [None, "x", "y"])
+        self.assertEqual(list(batch.rows()), [(1, None), (2, "x"), (None, "y")])
+        self.assertEqual(batch.to_records(drop_missing=True), [{"id": 1}, {"id": 2, "name": "x"}, {"name": "y"}])
+
+    def test_set_column_and_pickle(self):
+        """Test constant columns and round-tripping through pickle"""
+        # Arrange
+        batch = RecordBatch.from_records([{"id": 1}, {"id": 2}])
+
+        # Act
+        batch.set_column("_source_file", "a.json")
+        restored = pickle.loads(pickle.dumps(batch))
+
+        # Assert
+        self.assertEqual(restored.to_pydict(), {"id": [1, 2], "_source_file": ["a.json", "a.json"]})
+
+    def test_inconsistent_arrays_rejected(self):
+        """Test column arrays must have equal length"""
+        with self.assertRaises(ValueError):
+            RecordBatch(["a", "b"], [[1, 2], [1]])
+
+    def test_process_columnar_matches_process_data(self):
+        """Test columnar processing transforms values exactly like process_data"""
+        # Arrange
+        data = [{"id": 1, "tags": ["a"], "meta": {}, "note": None}, {"id": 2, "extra": 1.5}]
+        processor = JSONProcessor()
+
+        # Act
+        batch = processor.process_columnar(data)
+
+        # Assert
+        self.assertEqual(batch.to_records(drop_missing=True),
+                         [record for record in JSONProcessor().process_data(data)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# tests/unit/test_scheduler.py
+import unittest
+import os
+import sys
+import json
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from core.parallel import iter_parallel_file_batches
+from core.scheduler import SizeAwareScheduler
+
+
+class TestSizeAwareScheduler(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def write_jsonl(self, name, count):
+        path = self.test_dir / name
+        with open(path, 'w') as f:
+            for i in range(count):
+                f.write(json.dumps({"id": i, "file": name, "padding": "x" * 40}) + "\n")
+        return path
+
+    def write_json(self, name, count):
+        path = self.test_dir / name
+        with open(path, 'w') as f:
+            json.dump([{"id": i, "file": name} for i in range(count)], f)
+        return path
+
+    def test_plan_largest_first_bundles_and_splits(self):
+        """Test large JSON Lines files are split, tiny files bundled and the largest go first"""
+        # Arrange
+        big = self.write_jsonl("big.jsonl", 200)
+        medium = self.write_json("medium.json", 100)
+        tiny = [self.write_json(f"tiny_{i}.json", 1) for i in range(5)]
+        scheduler = SizeAwareScheduler(chunk_bytes=4096, tiny_bytes=100, bundle_files=3)
+
+        # Act
+        tasks = scheduler.plan(tiny + [medium, big])
+        stats = scheduler.statistics()
+
+        # Assert
+        self.assertEqual(tasks[0].units[0].file_path, big)
+        big_parts = [task.units[0].part for task in tasks if task.units[0].file_path == big]
+        self.assertEqual(big_parts, list(range(len(big_parts))))
+        self.assertGreater(len(big_parts), 1)
+        self.assertEqual(tasks[len(big_parts)].units[0].file_path, medium)
+        self.assertEqual([task.kind for task in tasks[len(big_parts) + 1:]], ['bundle', 'bundle'])
+        self.assertEqual(stats['files'], 7)
+        self.assertEqual(stats['tasks'], len(tasks))
+        self.assertEqual(stats['bundles'], 2)
+        self.assertEqual(stats['bundled_files'], 5)
+        self.assertEqual(stats['split_files'], 1)
+        self.assertEqual(stats['ranges'], len(big_parts))
+        self.assertEqual(stats['largest_files'][0]['file'], "big.jsonl")
+
+    def test_scheduled_results_regroup_per_file(self):
+        """Test each file comes back once with every record, split files in range order"""
+        # Arrange
+        files = [self.write_jsonl("big.jsonl", 300), self.write_jsonl("other.jsonl", 150)]
+        files += [self.write_json(f"tiny_{i}.json", 2) for i in range(6)]
+        scheduler = SizeAwareScheduler(chunk_bytes=2048, tiny_bytes=200)
+
+        # Act
+        records = {}
+        for file_path, batches, schema in iter_parallel_file_batches(
+                files, 2, batch_size=50, scheduler=scheduler):
+            self.assertNotIn(file_path.name, records)
+            records[file_path.name] = [record['id'] for batch in batches for record in batch]
+
+        # Assert
+        self.assertEqual(set(records), {path.name for path in files})
+        self.assertEqual(records["big.jsonl"], list(range(300)))
+        self.assertEqual(records["other.jsonl"], list(range(150)))
+        self.assertEqual(records["tiny_0.json"], [0, 1])
+        self.assertGreater(scheduler.statistics()['split_files'], 0)
+        self.assertGreater(scheduler.statistics()['bundles'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# tests/unit/test_schema_inference.py
+import unittest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from processors.schema_inference import SchemaAccumulator
+
+class TestSchemaAccumulator(unittest.TestCase):
+
+    def test_observe_reports_new_columns_in_first_seen_order(self):
+        """Test new columns are returned once, in the order they appear"""
+        # Arrange
+        accumulator = SchemaAccumulator()
+
+        # Act
+        first = accumulator.observe({"id": 1, "name": "John"})
+        repeat = accumulator.observe({"id": 2, "name": "Jane"})
+        later = accumulator.observe({"id": 3, "email": "a@b.c", "name": "Bob"})
+
+        # Assert
+        self.assertEqual(first, ["id", "name"])
+        self.assertEqual(repeat, [])
+        self.assertEqual(later, ["email"])
+        self.assertEqual(list(accumulator.columns), ["id", "name", "email"])
+        self.assertEqual(accumulator.records_observed, 3)
+
+    def test_merge_and_missing_from(self):
+        """Test accumulators from different files merge into one schema"""
+        # Arrange
+        first = SchemaAccumulator()
+        first.observe_batch([{"id": 1}, {"id": 2, "name": "John"}])
+        second = SchemaAccumulator()
+        second.observe_batch([{"id": 3, "city": "Leeds"}])
+
+        # Act
+        new_columns = first.merge(second)
+
+        # Assert
+        self.assertEqual(new_columns, ["city"])
+        self.assertEqual(first.records_observed, 3)
+        self.assertEqual(first.missing_from(["id"]), ["name", "city"])
+
+    def test_to_schema(self):
+        """Test schema output is sorted TEXT columns, optionally a subset"""
+        # Arrange
+        accumulator = SchemaAccumulator()
+        accumulator.observe({"b": 1, "a": 2})
+        accumulator.add_column("_source_file")
+
+        # Act
+        schema = accumulator.to_schema()
+        subset = accumulator.to_schema(["b", "missing"])
+
+        # Assert
+        self.assertEqual([column['name'] for column in schema], ["_source_file", "a", "b"])
+        self.assertTrue(all(column['type'] == 'TEXT' and column['nullable'] for column in schema))
+        self.assertEqual(subset, [{'name': 'b', 'type': 'TEXT', 'nullable': True}])
+
+    def test_infer_types(self):
+        """Test column types are inferred from values and widen only on conflict"""
+        # Arrange
+        accumulator = SchemaAccumulator(infer_types=True)
+
+        # Act
+        accumulator.observe_batch([
+            {"id": 1, "price": 2, "name": "a", "tags": ["x"], "flag": True, "note": None},
+            {"id": 2, "price": 2.5, "name": "b", "tags": {"k": 1}, "flag": False, "note": None},
+        ])
+        accumulator.observe({"id": 3, "price": 3, "name": 4})
+
+        # Assert
+        types = {column['name']: column['type'] for column in accumulator.to_schema()}
+        self.assertEqual(types, {"id": "INTEGER", "price": "REAL", "name": "TEXT",
+                                 "tags": "JSON_TEXT", "flag": "INTEGER", "note": "TEXT"})
+
+    def test_merge_types_across_accumulators(self):
+        """Test merged accumulators combine types per column"""
+        # Arrange
+        first = SchemaAccumulator(infer_types=True)
+        first.observe_batch([{"a": 1, "b": None, "c": 1}])
+        second = SchemaAccumulator(infer_types=True)
+        second.observe_batch([{"a": 1.5, "b": 7, "c": "x"}])
+
+        # Act
+        first.merge(second)
+
+        # Assert
+        self.assertEqual([first.column_type(name) for name in "abc"], ["REAL", "INTEGER", "TEXT"])
+
+    def test_text_conflicts(self):
+        """Test only numeric stored columns that now need TEXT are reported"""
+        # Arrange
+        accumulator = SchemaAccumulator(infer_types=True)
+        accumulator.observe_batch([{"code": "007", "n": 1.5, "empty": None, "tags": [1], "name": 3}])
+
+        # Act
+        conflicts = accumulator.text_conflicts({"code": "INTEGER", "n": "INTEGER", "empty": "INTEGER",
+                                                "tags": "REAL", "name": "TEXT"})
+
+        # Assert
+        self.assertEqual(conflicts, ["code", "tags"])
+        self.assertEqual(SchemaAccumulator().text_conflicts({"code": "INTEGER"}), [])
+
+if __name__ == "__main__":
+    unittest.main()
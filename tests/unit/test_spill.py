@@ -0,0 +1,79 @@
+# tests/unit/test_spill.py
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from core.spill import SpillBuffer, estimate_batch_bytes
+from processors.record_batch import RecordBatch
+
+
+class TestSpillBuffer(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def make_batch(self, start, size=50):
+        return [{"id": i, "name": f"name-{i:04d}"} for i in range(start, start + size)]
+
+    def test_spills_past_budget_and_keeps_order(self):
+        """Test batches beyond the budget go to disk and come back in insertion order"""
+        # Arrange
+        batches = [self.make_batch(start) for start in range(0, 500, 50)]
+        buffer = SpillBuffer(budget_bytes=estimate_batch_bytes(batches[0]) * 3, directory=self.test_dir)
+
+        # Act
+        records = buffer.extend(batches)
+
+        # Assert
+        self.assertEqual(records, 500)
+        self.assertEqual(len(buffer), 10)
+        self.assertEqual(buffer.stats()['memory_batches'], 3)
+        self.assertEqual(buffer.stats()['spilled_records'], 350)
+        self.assertEqual(list(buffer), batches)
+        self.assertEqual(len(os.listdir(self.test_dir)), 1)
+
+        buffer.close()
+        self.assertEqual(os.listdir(self.test_dir), [])
+
+    def test_rollback_discards_memory_and_spilled_batches(self):
+        """Test a rollback drops everything added after the checkpoint"""
+        # Arrange
+        buffer = SpillBuffer(budget_bytes=0, directory=self.test_dir)
+        buffer.append(self.make_batch(0))
+        checkpoint = buffer.checkpoint()
+
+        # Act
+        buffer.extend([self.make_batch(50), self.make_batch(100)])
+        buffer.rollback(checkpoint)
+        buffer.append(self.make_batch(150))
+
+        # Assert
+        self.assertEqual([batch[0]["id"] for batch in buffer], [0, 150])
+        self.assertEqual(buffer.stats()['spilled_records'], 100)
+        buffer.close()
+
+    def test_no_budget_never_spills(self):
+        """Test columnar batches stay in memory when no budget is set"""
+        # Arrange
+        batch = RecordBatch.from_records(self.make_batch(0))
+        buffer = SpillBuffer()
+
+        # Act
+        buffer.extend([batch, batch])
+
+        # Assert
+        self.assertEqual(buffer.stats()['spilled_batches'], 0)
+        self.assertEqual(list(buffer), [batch, batch])
+        self.assertGreater(estimate_batch_bytes(batch), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -156,6 +156,142 @@ class TestSQLiteConnector(unittest.TestCase):
         count = results[0]['count']
         self.assertEqual(count, 150)
         
+    def test_insert_data_mixed_key_signatures(self):
+        """Test records with different keys keep every column"""
+        # Arrange
+        self.connector.connect()
+        schema = [
+            {'name': 'id', 'type': 'INTEGER'},
+            {'name': 'name', 'type': 'TEXT'},
+            {'name': 'email', 'type': 'TEXT'}
+        ]
+        self.connector.create_table('mixed_table', schema)
+        data = [
+            {'id': 1, 'name': 'John'},
+            {'id': 2, 'email': 'jane@example.com'},
+            {'email': 'bob@example.com', 'id': 3, 'name': 'Bob'},
+            {'id': 4}
+        ]
+        
+        # Act
+        inserted_count = self.connector.insert_data('mixed_table', data, batch_size=3)
+        
+        # Assert
+        self.assertEqual(inserted_count, 4)
+        results = self.connector.execute_query("SELECT id, name, email FROM mixed_table ORDER BY id")
+        self.assertEqual([tuple(row.values()) for row in results], [
+            (1, 'John', None), (2, None, 'jane@example.com'),
+            (3, 'Bob', 'bob@example.com'), (4, None, None)
+        ])
+
+    def test_insert_data_keeps_input_order(self):
+        """Test alternating key signatures are inserted in input (rowid) order"""
+        # Arrange
+        self.connector.connect()
+        self.connector.create_table('ordered_table', [
+            {'name': 'id', 'type': 'INTEGER'},
+            {'name': 'name', 'type': 'TEXT'}
+        ])
+        data = [{'id': 1}, {'id': 2, 'name': 'b'}, {'id': 3}, {'id': 4, 'name': 'd'}]
+
+        # Act
+        self.connector.insert_data('ordered_table', data)
+
+        # Assert
+        results = self.connector.execute_query("SELECT id FROM ordered_table ORDER BY rowid")
+        self.assertEqual([row['id'] for row in results], [1, 2, 3, 4])
+        
+    def test_insert_record_batch(self):
+        """Test a columnar RecordBatch is inserted directly"""
+        # Arrange
+        from processors.record_batch import RecordBatch
+        self.connector.connect()
+        self.connector.create_table('batch_table', [{'name': 'id', 'type': 'INTEGER'},
+                                                    {'name': 'name', 'type': 'TEXT'}])
+        batch = RecordBatch(['id', 'name'], [[1, 2, 3], ['a', None, 'c']])
+        
+        # Act
+        inserted_count = self.connector.insert_data('batch_table', batch, batch_size=2)
+        
+        # Assert
+        self.assertEqual(inserted_count, 3)
+        results = self.connector.execute_query("SELECT id, name FROM batch_table ORDER BY id")
+        self.assertEqual([tuple(row.values()) for row in results], [(1, 'a'), (2, None), (3, 'c')])
+        
+    def test_widen_columns_keeps_rows(self):
+        """Test changing a column to TEXT keeps rows, rowids and the open transaction"""
+        # Arrange
+        self.connector.connect()
+        self.connector.create_table('typed_table', [{'name': 'id', 'type': 'INTEGER'},
+                                                    {'name': 'code', 'type': 'INTEGER'}])
+        self.connector.insert_data('typed_table', [{'id': 1, 'code': 7}, {'id': 2, 'code': None}])
+        
+        # Act
+        widened = self.connector.widen_columns('typed_table', ['code'])
+        self.connector.insert_data('typed_table', [{'id': 3, 'code': '007'}])
+        
+        # Assert
+        self.assertTrue(widened)
+        self.assertEqual(self.connector.get_column_types('typed_table'), {'id': 'INTEGER', 'code': 'TEXT'})
+        results = self.connector.execute_query("SELECT rowid, id, code FROM typed_table ORDER BY rowid")
+        self.assertEqual([tuple(row.values()) for row in results],
+                         [(1, 1, '7'), (2, 2, None), (3, 3, '007')])
+        
+        # Act - a widening in an uncommitted file is undone with it
+        self.connector.widen_columns('typed_table', ['id'])
+        self.connector.rollback()
+        
+        # Assert
+        self.assertEqual(self.connector.get_column_types('typed_table')['id'], 'INTEGER')
+        
+    def test_load_profile_applied_and_restored(self):
+        """Test a load profile tunes the connection and is undone on disconnect"""
+        # Arrange
+        connector = SQLiteConnector({'database': self.temp_db.name, 'load_profile': 'bulk'})
+        
+        # Act
+        connector.connect()
+        during = [connector.connection.execute(f'PRAGMA {name}').fetchone()[0]
+                  for name in ('journal_mode', 'synchronous', 'locking_mode')]
+        connector.disconnect()
+        
+        # Assert
+        self.assertEqual(during, ['memory', 0, 'exclusive'])
+        conn = sqlite3.connect(self.temp_db.name)
+        try:
+            self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'delete')
+            # Exclusive lock was released
+            conn.execute('CREATE TABLE after_load (id INTEGER)')
+        finally:
+            conn.close()
+        
+    def test_bulk_profile_rollback_and_failed_connect(self):
+        """Test rollback works under the bulk profile and a failed profile leaves no connection"""
+        # Arrange
+        connector = SQLiteConnector({'database': self.temp_db.name, 'load_profile': 'bulk'})
+        connector.connect()
+        connector.create_table('bulk_table', [{'name': 'id', 'type': 'INTEGER'}])
+        
+        # Act
+        connector.insert_data('bulk_table', [{'id': i} for i in range(100)], commit=False)
+        connector.rollback()
+        remaining = connector.execute_query("SELECT COUNT(*) AS n FROM bulk_table")[0]['n']
+        connector.disconnect()
+        
+        failing = SQLiteConnector({'database': self.temp_db.name, 'load_profile': 'bulk'})
+        with patch.object(failing, '_apply_load_profile', side_effect=sqlite3.OperationalError("locked")):
+            connected = failing.connect()
+        
+        # Assert
+        self.assertEqual(remaining, 0)
+        self.assertFalse(connected)
+        self.assertIsNone(failing.connection)
+        
+    def test_unknown_load_profile(self):
+        """Test an unknown load profile is rejected"""
+        with self.assertRaises(ValueError):
+            SQLiteConnector({'database': self.temp_db.name, 'load_profile': 'turbo'})
+        
     def test_execute_query_select(self):
         """Test query execution with results"""
         # Arrange
@@ -0,0 +1,137 @@
+# tests/unit/test_watch.py
+import unittest
+import tempfile
+import shutil
+import sqlite3
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from core.application import DataIngestionApplication
+from core.watch import DirectoryWatcher
+
+
+class TestDirectoryWatcher(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.db_path = str(self.test_dir.parent / (self.test_dir.name + ".db"))
+        self.app = DataIngestionApplication()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+    def land(self, name, records, age=60):
+        """Write a file whose mtime is `age` seconds in the past"""
+        path = self.test_dir / name
+        path.write_text(json.dumps(records), encoding='utf-8')
+        stamp = time.time() - age
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def rows(self):
+        with sqlite3.connect(self.db_path) as conn:
+            return sorted(conn.execute('SELECT CAST(id AS INTEGER) FROM processed_data').fetchall())
+
+    def test_ingests_stable_files_in_group_commits(self):
+        """Test settled files are written per micro-batch and unsettled ones wait"""
+        # Arrange
+        for index in range(4):
+            self.land(f"part_{index}.json", [{"id": index}])
+        watcher = DirectoryWatcher(self.app, self.test_dir, self.db_path, settle_seconds=30,
+                                   max_batch_files=10)
+
+        try:
+            # Act
+            first = watcher.poll()
+            self.land("late.json", [{"id": 10}], age=0)
+            waiting = watcher.poll()
+            self.land("late.json", [{"id": 10}, {"id": 11}])
+            second = watcher.poll()
+        finally:
+            watcher.close()
+
+        # Assert
+        # The first file creates the table on its own, the other three share a commit
+        self.assertEqual(first, {'files_ingested': 4, 'records': 4, 'commits': 2})
+        self.assertEqual(waiting['files_ingested'], 0)
+        self.assertEqual(second, {'files_ingested': 1, 'records': 2, 'commits': 1})
+        self.assertEqual(self.rows(), [(0,), (1,), (2,), (3,), (10,), (11,)])
+
+    def test_changed_files_replace_rows_and_restart_skips_loaded(self):
+        """Test a rewritten file replaces its rows and a new watcher skips loaded files"""
+        # Arrange
+        self.land("a.json", [{"id": 1}, {"id": 2}])
+        watcher = DirectoryWatcher(self.app, self.test_dir, self.db_path)
+        watcher.poll()
+        self.land("a.json", [{"id": 3}], age=30)
+
+        # Act
+        changed = watcher.poll()
+        watcher.close()
+        restarted = DirectoryWatcher(self.app, self.test_dir, self.db_path)
+        again = restarted.poll()
+        restarted.close()
+
+        # Assert
+        self.assertEqual(changed['records'], 1)
+        self.assertEqual(again['files_ingested'], 0)
+        self.assertEqual(restarted.totals['files_unchanged'], 1)
+        self.assertEqual(self.rows(), [(3,)])
+
+    def test_bad_file_does_not_block_its_group(self):
+        """Test a failing file is reported while the rest of its group is still loaded"""
+        # Arrange
+        self.land("a.json", [{"id": 1}])
+        watcher = DirectoryWatcher(self.app, self.test_dir, self.db_path)
+        watcher.poll()
+        self.land("b.json", [{"id": 2}])
+        broken = self.test_dir / "c.json"
+        broken.write_text('[{"id": 3}, {"id": ', encoding='utf-8')
+        os.utime(broken, (time.time() - 60, time.time() - 60))
+        self.land("d.json", [{"id": 4}])
+
+        # Act
+        result = watcher.run(max_polls=1)
+        watcher.close()
+
+        # Assert
+        self.assertEqual(result['files_ingested'], 3)
+        self.assertEqual(len(result['errors']), 1)
+        self.assertIn("c.json", result['errors'][0])
+        self.assertEqual(self.rows(), [(1,), (2,), (4,)])
+
+
+    def test_bulk_profile_lets_readers_in_between_polls(self):
+        """Test a long-lived bulk-profile watcher does not keep the database locked"""
+        # Arrange
+        self.land("a.json", [{"id": 1}])
+        self.land("b.json", [{"id": 2}])
+        watcher = DirectoryWatcher(self.app, self.test_dir, self.db_path, load_profile='bulk')
+
+        try:
+            # Act
+            watcher.poll()
+            reader = sqlite3.connect(self.db_path, timeout=0)
+            try:
+                count = reader.execute('SELECT COUNT(*) FROM processed_data').fetchone()[0]
+            finally:
+                reader.close()
+            self.land("c.json", [{"id": 3}])
+            second = watcher.poll()
+        finally:
+            watcher.close()
+
+        # Assert
+        self.assertEqual(count, 2)
+        self.assertEqual(second['files_ingested'], 1)
+        self.assertEqual(self.rows(), [(1,), (2,), (3,)])
+
+if __name__ == '__main__':
+    unittest.main()